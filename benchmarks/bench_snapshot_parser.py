@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# coding=utf-8
+"""
+快照解析基准测试
+
+对 output/ 下的全部 txt 快照测量共享解析器（trendradar.snapshot_parser）的吞吐量（行/秒），
+并与此前逐行 split/rsplit 的实现对比，同时校验两者解析结果一致。
+
+用法:
+    python benchmarks/bench_snapshot_parser.py [output目录] [--repeat N]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from trendradar.snapshot_parser import (  # noqa: E402
+    FAILED_SECTION_MARKER,
+    parse_snapshot_text,
+)
+
+
+def legacy_clean_title(title: str) -> str:
+    """旧版标题清理实现，仅用于对比"""
+    cleaned_title = title.replace("\n", " ").replace("\r", " ")
+    cleaned_title = re.sub(r"\s+", " ", cleaned_title)
+    return cleaned_title.strip()
+
+
+def legacy_parse_snapshot_text(content: str):
+    """旧版解析实现（逐行 split/rsplit），仅用于对比"""
+    titles_by_id = {}
+    id_to_name = {}
+
+    for section in content.split("\n\n"):
+        if not section.strip() or FAILED_SECTION_MARKER in section:
+            continue
+
+        lines = section.strip().split("\n")
+        if len(lines) < 2:
+            continue
+
+        header_line = lines[0].strip()
+        if " | " in header_line:
+            parts = header_line.split(" | ", 1)
+            source_id = parts[0].strip()
+            id_to_name[source_id] = parts[1].strip()
+        else:
+            source_id = header_line
+            id_to_name[source_id] = source_id
+
+        titles_by_id[source_id] = {}
+
+        for line in lines[1:]:
+            if not line.strip():
+                continue
+            title_part = line.strip()
+            rank = None
+            if ". " in title_part and title_part.split(". ")[0].isdigit():
+                rank_str, title_part = title_part.split(". ", 1)
+                rank = int(rank_str)
+
+            mobile_url = ""
+            if " [MOBILE:" in title_part:
+                title_part, mobile_part = title_part.rsplit(" [MOBILE:", 1)
+                if mobile_part.endswith("]"):
+                    mobile_url = mobile_part[:-1]
+
+            url = ""
+            if " [URL:" in title_part:
+                title_part, url_part = title_part.rsplit(" [URL:", 1)
+                if url_part.endswith("]"):
+                    url = url_part[:-1]
+
+            titles_by_id[source_id][legacy_clean_title(title_part.strip())] = {
+                "ranks": [rank] if rank is not None else [1],
+                "url": url,
+                "mobileUrl": mobile_url,
+            }
+
+    return titles_by_id, id_to_name
+
+
+def run_benchmark(name: str, parse, contents, total_lines: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for content in contents:
+            parse(content)
+        best = min(best, time.perf_counter() - start)
+    lines_per_second = total_lines / best if best else 0
+    print(f"  {name:<10} {best * 1000:8.1f} ms   {lines_per_second:12,.0f} 行/秒")
+    return lines_per_second
+
+
+def main():
+    parser = argparse.ArgumentParser(description="快照解析基准测试")
+    parser.add_argument("output_dir", nargs="?", default="output")
+    parser.add_argument("--repeat", type=int, default=5, help="重复次数，取最快一次")
+    args = parser.parse_args()
+
+    files = sorted(Path(args.output_dir).glob("*/txt/*.txt"))
+    if not files:
+        print(f"❌ {args.output_dir} 下没有找到 txt 快照")
+        return
+
+    contents = [f.read_text(encoding="utf-8") for f in files]
+    total_lines = sum(content.count("\n") for content in contents)
+    total_bytes = sum(len(content.encode("utf-8")) for content in contents)
+    print(f"📊 {len(files)} 个快照，{total_lines:,} 行，{total_bytes / 1024 / 1024:.1f} MB")
+
+    mismatches = sum(
+        parse_snapshot_text(content) != legacy_parse_snapshot_text(content)
+        for content in contents
+    )
+    print(f"🔍 结果一致性: {'一致' if not mismatches else f'{mismatches} 个快照不一致'}")
+
+    legacy = run_benchmark("旧版", legacy_parse_snapshot_text, contents, total_lines, args.repeat)
+    shared = run_benchmark("共享解析器", parse_snapshot_text, contents, total_lines, args.repeat)
+    if legacy:
+        print(f"⚡ 提速 {shared / legacy:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
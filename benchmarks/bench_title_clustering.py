@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# coding=utf-8
+"""
+相似标题聚类基准测试
+
+从 output/ 下的快照汇总出每天每个平台的标题，测量 trendradar.clustering 在 1、2、4……天的标题上的
+耗时（应随标题数线性增长），并在标题最多的一天上与两两比较全部标题的结果对比：统计 Jaccard 相似度
+达到阈值的跨平台标题对中被分到同一簇的比例（召回率）。
+
+用法:
+    python benchmarks/bench_title_clustering.py [output目录] [--threshold 0.5]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from trendradar import clustering  # noqa: E402
+from trendradar.storage import TxtSnapshotStorage  # noqa: E402
+
+
+def load_days(output_dir: str):
+    """每天一个列表：[(平台ID, 标题), ...]"""
+    storage = TxtSnapshotStorage(output_dir, parse_cache=False)
+    days = []
+    for date_folder in storage.list_dates():
+        day_titles = {}
+        for _, titles_by_id, _ in storage.iter_snapshots(date_folder):
+            for platform_id, titles in titles_by_id.items():
+                for title in titles:
+                    day_titles[(platform_id, title)] = None
+        if day_titles:
+            days.append((date_folder, list(day_titles)))
+    return days
+
+
+def run_clustering(entries, threshold: float):
+    """entries 为 [(来源, 标题), ...]；清空缓存后计时，返回 (簇列表, 耗时)"""
+    clustering._title_sketch.cache_clear()
+    start = time.perf_counter()
+    clusters = clustering.cluster_titles(
+        [title for _, title in entries], threshold, [source for source, _ in entries]
+    )
+    return clusters, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="相似标题聚类基准测试")
+    parser.add_argument("output_dir", nargs="?", default="output")
+    parser.add_argument("--threshold", type=float, default=0.5, help="Jaccard 相似度阈值")
+    args = parser.parse_args()
+
+    days = load_days(args.output_dir)
+    if not days:
+        print(f"❌ {args.output_dir} 下没有找到快照")
+        return
+
+    print("📈 耗时随标题数的变化（多天合并时来源为 日期+平台）:")
+    day_count = 1
+    while True:
+        selected = days[-day_count:]
+        entries = [
+            ((date_folder, platform_id), title)
+            for date_folder, titles in selected
+            for platform_id, title in titles
+        ]
+        clusters, elapsed = run_clustering(entries, args.threshold)
+        print(
+            f"  {len(selected):>3} 天 {len(entries):>7,} 条标题 → {len(clusters):>7,} 个簇  "
+            f"{elapsed * 1000:8.1f} ms  {elapsed / len(entries) * 1e6:6.1f} µs/条"
+        )
+        if day_count >= len(days):
+            break
+        day_count = min(day_count * 2, len(days))
+
+    date_folder, entries = max(days, key=lambda day: len(day[1]))
+    clusters, elapsed = run_clustering(entries, args.threshold)
+    cluster_of = {}
+    for cluster_index, members in enumerate(clusters):
+        for index in members:
+            cluster_of[index] = cluster_index
+
+    start = time.perf_counter()
+    shingle_sets = [clustering.title_shingles(title) for _, title in entries]
+    similar_pairs = [
+        (left, right)
+        for left in range(len(entries))
+        for right in range(left + 1, len(entries))
+        if entries[left][0] != entries[right][0]
+        and clustering.jaccard(shingle_sets[left], shingle_sets[right]) >= args.threshold
+    ]
+    pairwise_time = time.perf_counter() - start
+    found = sum(1 for left, right in similar_pairs if cluster_of[left] == cluster_of[right])
+    recall = found / len(similar_pairs) if similar_pairs else 1.0
+    print(
+        f"🔍 {date_folder}: {len(entries):,} 条标题，LSH {elapsed * 1000:.1f} ms，"
+        f"两两比较 {pairwise_time * 1000:.1f} ms；相似标题对 {len(similar_pairs)} 个，"
+        f"同簇 {found} 个（召回率 {recall:.1%}）"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# coding=utf-8
+"""
+权重计算基准测试
+
+从 output/ 下的全部快照汇总出每天每个平台每个标题的排名列表（即 MCP 多日查询按权重排序的条目），
+对比逐条计算（此前 calculate_news_weight 的实现）、批量逐条计算与 NumPy 向量化计算
+（trendradar.scoring）的耗时，并校验三者的权重逐位一致、按权重排序的结果相同。
+
+用法:
+    python benchmarks/bench_weight_scoring.py [output目录] [--repeat N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from trendradar.scoring import calculate_weights, has_numpy  # noqa: E402
+from trendradar.storage import TxtSnapshotStorage  # noqa: E402
+
+RANK_THRESHOLD = 5
+WEIGHTS = (0.6, 0.3, 0.1)
+
+
+def legacy_calculate_news_weight(news_data, rank_threshold=RANK_THRESHOLD):
+    """旧版逐条实现，仅用于对比"""
+    ranks = news_data.get("ranks", [])
+    if not ranks:
+        return 0.0
+
+    count = news_data.get("count", len(ranks))
+    rank_scores = []
+    for rank in ranks:
+        score = 11 - min(rank, 10)
+        rank_scores.append(score)
+
+    rank_weight = sum(rank_scores) / len(ranks) if ranks else 0
+    frequency_weight = min(count, 10) * 10
+    high_rank_count = sum(1 for rank in ranks if rank <= rank_threshold)
+    hotness_ratio = high_rank_count / len(ranks) if ranks else 0
+    hotness_weight = hotness_ratio * 100
+
+    return (
+        rank_weight * WEIGHTS[0]
+        + frequency_weight * WEIGHTS[1]
+        + hotness_weight * WEIGHTS[2]
+    )
+
+
+def load_items(output_dir: str):
+    """每天每个平台每个标题一个条目：{"ranks": [...], "count": 出现次数}"""
+    storage = TxtSnapshotStorage(output_dir, parse_cache=False)
+    items = []
+    for date_folder in storage.list_dates():
+        day_items = {}
+        for _, titles_by_id, _ in storage.iter_snapshots(date_folder):
+            for platform_id, titles in titles_by_id.items():
+                for title, data in titles.items():
+                    item = day_items.setdefault((platform_id, title), {"ranks": []})
+                    item["ranks"].extend(data.get("ranks", []))
+        for item in day_items.values():
+            item["count"] = len(item["ranks"])
+            items.append(item)
+    return items
+
+
+def run_benchmark(name: str, score, items, repeat: int):
+    best = float("inf")
+    weights = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        weights = score(items)
+        best = min(best, time.perf_counter() - start)
+    print(f"  {name:<12} {best * 1000:8.1f} ms   {len(items) / best:12,.0f} 条/秒")
+    return best, weights
+
+
+def main():
+    parser = argparse.ArgumentParser(description="权重计算基准测试")
+    parser.add_argument("output_dir", nargs="?", default="output")
+    parser.add_argument("--repeat", type=int, default=5, help="重复次数，取最快一次")
+    args = parser.parse_args()
+
+    items = load_items(args.output_dir)
+    if not items:
+        print(f"❌ {args.output_dir} 下没有找到快照")
+        return
+    total_ranks = sum(len(item["ranks"]) for item in items)
+    print(f"📊 {len(items):,} 个条目，{total_ranks:,} 个排名")
+
+    backends = [
+        ("逐条", lambda data: [legacy_calculate_news_weight(item) for item in data]),
+        (
+            "批量",
+            lambda data: calculate_weights(data, RANK_THRESHOLD, *WEIGHTS, use_numpy=False),
+        ),
+    ]
+    if has_numpy():
+        backends.append(
+            (
+                "NumPy",
+                lambda data: calculate_weights(data, RANK_THRESHOLD, *WEIGHTS, use_numpy=True),
+            )
+        )
+    else:
+        print("⚠️  未安装 NumPy，跳过向量化计算")
+
+    results = [run_benchmark(name, score, items, args.repeat) for name, score in backends]
+    baseline_time, baseline_weights = results[0]
+    for (name, _), (elapsed, weights) in zip(backends[1:], results[1:]):
+        identical = weights == baseline_weights
+        print(
+            f"🔍 {name}: 结果{'逐位一致' if identical else '不一致'}，"
+            f"提速 {baseline_time / elapsed:.2f}x"
+        )
+
+    # 按权重排序（MCP 的 sort_by=weight）：旧版在排序键中逐条计算
+    start = time.perf_counter()
+    legacy_sorted = sorted(items, key=legacy_calculate_news_weight, reverse=True)
+    legacy_sort_time = time.perf_counter() - start
+    start = time.perf_counter()
+    weights = calculate_weights(items, RANK_THRESHOLD, *WEIGHTS)
+    order = sorted(range(len(items)), key=weights.__getitem__, reverse=True)
+    batch_sorted = [items[index] for index in order]
+    batch_sort_time = time.perf_counter() - start
+    print(
+        f"📈 按权重排序: 旧版 {legacy_sort_time * 1000:.1f} ms，批量 {batch_sort_time * 1000:.1f} ms，"
+        f"顺序{'一致' if all(a is b for a, b in zip(legacy_sorted, batch_sorted)) else '不一致'}"
+    )
+
+
+if __name__ == "__main__":
+    main()
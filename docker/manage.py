@@ -124,6 +124,7 @@ def show_status():
 
     # 检查 PID 1 状态
     supercronic_is_pid1 = False
+    daemon_is_pid1 = False
     pid1_cmdline = ""
     try:
         with open('/proc/1/cmdline', 'r') as f:
@@ -133,6 +134,9 @@ def show_status():
         if "supercronic" in pid1_cmdline.lower():
             print("  ✅ supercronic 正确运行为 PID 1")
             supercronic_is_pid1 = True
+        elif "main.py --daemon" in pid1_cmdline:
+            print("  ✅ 常驻模式（main.py --daemon）正确运行为 PID 1")
+            daemon_is_pid1 = True
         else:
             print("  ❌ PID 1 不是 supercronic")
             print(f"  📋 实际的 PID 1: {pid1_cmdline}")
@@ -228,7 +232,10 @@ def show_status():
 
     # 状态总结和建议
     print("  📊 状态总结:")
-    if supercronic_is_pid1:
+    if daemon_is_pid1:
+        print("    ✅ 常驻模式运行中，由进程内调度器按 CRON_SCHEDULE 执行")
+        print("    💡 修改 config.yaml 后下一轮执行前自动重新加载，无需重启容器")
+    elif supercronic_is_pid1:
         print("    ✅ supercronic 正确运行为 PID 1")
         print("    ✅ 定时任务应该正常工作")
         
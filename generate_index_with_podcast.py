@@ -16,6 +16,9 @@ import requests
 from typing import Optional
 import asyncio
 
+from trendradar.snapshot_parser import parse_snapshot_platforms
+from trendradar.storage import get_storage_from_config
+
 # ==================== 配置参数 ====================
 # 可以通过环境变量覆盖这些默认值
 
@@ -46,30 +49,25 @@ def ensure_directory_exists(directory: str):
 
 
 def read_latest_news_for_summary() -> tuple[Optional[str], Optional[str]]:
-    """读取最新的新闻文件用于生成摘要
+    """读取最新的新闻快照用于生成摘要
 
     Returns:
-        (content, filename): 文件内容和文件名（不含扩展名）
+        (content, filename): 快照的 txt 格式内容和快照时间（即 txt 文件名，不含扩展名）
     """
     date_folder = format_date_folder()
-    txt_dir = Path("output") / date_folder / "txt"
-
-    if not txt_dir.exists():
-        print(f"❌ 目录不存在: {txt_dir}")
-        return None, None
+    storage = get_storage_from_config()
 
-    txt_files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
-    if not txt_files:
-        print(f"❌ 没有找到txt文件")
+    snapshots = storage.list_snapshots(date_folder)
+    if not snapshots:
+        print(f"❌ {date_folder} 没有找到新闻快照（存储后端: {storage.backend}）")
         return None, None
 
-    latest_file = txt_files[-1]
-    print(f"✅ 读取新闻文件: {latest_file.name}")
+    latest = snapshots[-1]
+    print(f"✅ 读取新闻快照: {latest.time_info}")
 
-    with open(latest_file, "r", encoding="utf-8") as f:
-        content = f.read()
+    content = storage.read_snapshot_text(date_folder, latest.time_info)
 
-    return content, latest_file.stem
+    return content, latest.time_info
 
 
 def parse_and_simplify_news(news_content: str, max_items_per_platform: int = 10) -> list:
@@ -82,75 +80,19 @@ def parse_and_simplify_news(news_content: str, max_items_per_platform: int = 10)
     Returns:
         list: 包含平台和新闻条目的列表，每个新闻包含标题和链接
     """
-    lines = news_content.strip().split("\n")
-
-    news_data = []
-    current_platform = ""
-    current_platform_news = []
-
-    for line in lines:
-        line = line.strip()
-        if not line or "==== 以下ID请求失败 ====" in line:
-            continue
-
-        # 检测平台名称行
-        if not line[0].isdigit() and ("|" in line or "[" not in line):
-            # 保存上一个平台的数据
-            if current_platform_news and current_platform:
-                news_data.append({
-                    "platform": current_platform,
-                    "items": current_platform_news[:max_items_per_platform]
-                })
-                current_platform_news = []
-
-            # 解析新平台
-            if "|" in line:
-                parts = line.split("|")
-                current_platform = parts[1].strip() if len(parts) > 1 else parts[0].strip()
-            else:
-                current_platform = line
-
-        elif line[0].isdigit() and ". " in line:
-            # 新闻条目行
-            full_line = line.split(". ", 1)[1]
-
-            # 提取标题和链接
-            title = full_line
-            url = ""
-
-            # 提取 URL
-            if "[URL:" in full_line:
-                parts = full_line.split("[URL:")
-                title = parts[0].strip()
-                url_part = parts[1].split("]")[0].strip()
-                url = url_part
-
-            # 如果没有 URL，尝试提取 MOBILE
-            if not url and "[MOBILE:" in full_line:
-                parts = full_line.split("[MOBILE:")
-                title = parts[0].strip()
-                url_part = parts[1].split("]")[0].strip()
-                url = url_part
-
-            # 清理标题中残留的链接标记
-            if "[URL:" in title:
-                title = title.split("[URL:")[0].strip()
-            if "[MOBILE:" in title:
-                title = title.split("[MOBILE:")[0].strip()
-
-            current_platform_news.append({
-                "title": title,
-                "url": url
-            })
-
-    # 处理最后一个平台
-    if current_platform_news and current_platform:
-        news_data.append({
-            "platform": current_platform,
-            "items": current_platform_news[:max_items_per_platform]
-        })
-
-    return news_data
+    return [
+        {
+            "platform": platform_data["platform"],
+            "items": [
+                # 没有 URL 时使用移动端链接
+                {"title": item["title"], "url": item["url"] or item["mobileUrl"]}
+                for item in platform_data["items"]
+            ],
+        }
+        for platform_data in parse_snapshot_platforms(
+            news_content, max_items_per_platform=max_items_per_platform
+        )
+    ]
 
 
 def generate_podcast_script_with_ai(news_data: list, api_key: str, max_tokens: int = MAX_TOKENS) -> Optional[str]:
@@ -14,6 +14,9 @@ import pytz
 import requests
 from typing import Optional, Tuple
 
+from trendradar.snapshot_parser import parse_snapshot_platforms
+from trendradar.storage import get_storage_from_config
+
 
 def get_beijing_time():
     """获取北京时间"""
@@ -36,77 +39,34 @@ def ensure_directory_exists(directory: str):
 
 
 def read_latest_news_file() -> Tuple[Optional[str], Optional[str]]:
-    """读取最新的新闻txt文件"""
+    """读取最新的新闻快照（txt 格式内容）"""
     date_folder = format_date_folder()
-    txt_dir = Path("output") / date_folder / "txt"
-
-    if not txt_dir.exists():
-        print(f"❌ 错误: 目录不存在 {txt_dir}")
-        return None, None
+    storage = get_storage_from_config()
 
-    txt_files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
-    if not txt_files:
-        print(f"❌ 错误: 在 {txt_dir} 中没有找到txt文件")
+    snapshots = storage.list_snapshots(date_folder)
+    if not snapshots:
+        print(f"❌ 错误: {date_folder} 没有找到新闻快照（存储后端: {storage.backend}）")
         return None, None
 
-    latest_file = txt_files[-1]
-    print(f"✅ 找到最新新闻文件: {latest_file}")
+    latest = snapshots[-1]
+    print(f"✅ 找到最新新闻快照: {date_folder} {latest.time_info}")
 
-    with open(latest_file, "r", encoding="utf-8") as f:
-        content = f.read()
+    content = storage.read_snapshot_text(date_folder, latest.time_info)
 
-    return content, latest_file.stem
+    return content, latest.time_info
 
 
 def parse_news_content(news_content: str) -> list:
-    """解析新闻内容，提取关键信息"""
-    lines = news_content.strip().split("\n")
-
-    news_data = []
-    current_platform = ""
-    current_platform_news = []
-
-    for line in lines:
-        line = line.strip()
-        if not line or "==== 以下ID请求失败 ====" in line:
-            continue
-
-        # 检测平台名称行
-        if not line[0].isdigit() and ("|" in line or "[" not in line):
-            # 保存上一个平台的数据
-            if current_platform_news and current_platform:
-                news_data.append({
-                    "platform": current_platform,
-                    "items": current_platform_news[:10]  # 只取前10条
-                })
-                current_platform_news = []
-
-            # 解析新平台
-            if "|" in line:
-                parts = line.split("|")
-                current_platform = parts[1].strip() if len(parts) > 1 else parts[0].strip()
-            else:
-                current_platform = line
-
-        elif line[0].isdigit() and ". " in line:
-            # 新闻条目行
-            title = line.split(". ", 1)[1]
-            # 移除URL链接部分
-            if "[URL:" in title:
-                title = title.split("[URL:")[0].strip()
-            if "[MOBILE:" in title:
-                title = title.split("[MOBILE:")[0].strip()
-
-            current_platform_news.append(title)
-
-    # 处理最后一个平台
-    if current_platform_news and current_platform:
-        news_data.append({
-            "platform": current_platform,
-            "items": current_platform_news[:5]
-        })
-
-    return news_data
+    """解析新闻内容，提取关键信息（每个平台取前10条标题）"""
+    return [
+        {
+            "platform": platform_data["platform"],
+            "items": [item["title"] for item in platform_data["items"]],
+        }
+        for platform_data in parse_snapshot_platforms(
+            news_content, max_items_per_platform=10
+        )
+    ]
 
 
 def generate_podcast_script_with_ai(news_data: list, api_key: str) -> Optional[str]:
@@ -1,9 +1,15 @@
 # coding=utf-8
 
+import argparse
+import bisect
+import hashlib
+import heapq
 import json
 import os
 import random
 import re
+import signal
+import threading
 import time
 import webbrowser
 import smtplib
@@ -11,14 +17,38 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.header import Header
 from email.utils import formataddr, formatdate, make_msgid
-from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Union
+from urllib.parse import urlparse
 
 import pytz
 import requests
 import yaml
 
+from trendradar.clustering import cluster_titles
+from trendradar.http_client import configure_http_client, get_http_client
+from trendradar.polling import AdaptivePoller
+from trendradar.records import TitleRecord, encode_time, intern
+from trendradar.report_store import (
+    REPORT_DATA_SUFFIX,
+    REPORTS_DIR,
+    is_report_data_path,
+    load_report_data,
+    save_report_data,
+)
+from trendradar.report_viewer import serve_reports
+from trendradar.scheduler import CronSchedule
+from trendradar.scoring import calculate_weights
+from trendradar.snapshot_parser import clean_title
+from trendradar.storage import (
+    compute_platform_hash,
+    create_storage,
+    resolve_storage_config,
+)
+
 
 VERSION = "3.3.0"
 
@@ -55,7 +85,61 @@ SMTP_CONFIGS = {
 }
 
 
+# 推送渠道配置项：CONFIG 键 -> notification.webhooks 中的字段
+WEBHOOK_CONFIG_KEYS = {
+    "FEISHU_WEBHOOK_URL": "feishu_url",
+    "DINGTALK_WEBHOOK_URL": "dingtalk_url",
+    "WEWORK_WEBHOOK_URL": "wework_url",
+    "WEWORK_MSG_TYPE": "wework_msg_type",
+    "TELEGRAM_BOT_TOKEN": "telegram_bot_token",
+    "TELEGRAM_CHAT_ID": "telegram_chat_id",
+    "EMAIL_FROM": "email_from",
+    "EMAIL_PASSWORD": "email_password",
+    "EMAIL_TO": "email_to",
+    "EMAIL_SMTP_SERVER": "email_smtp_server",
+    "EMAIL_SMTP_PORT": "email_smtp_port",
+    "NTFY_SERVER_URL": "ntfy_server_url",
+    "NTFY_TOPIC": "ntfy_topic",
+    "NTFY_TOKEN": "ntfy_token",
+    "BARK_URL": "bark_url",
+}
+
+
 # === 配置管理 ===
+def load_profile_config(profile_data: Dict, config: Dict) -> Dict:
+    """解析 profiles 中的一项：频率词文件、报告模式与推送渠道（只取 profile 自己的 webhooks）"""
+    name = str(profile_data.get("name") or "").strip()
+    if not name or not re.fullmatch(r"[\w-]+", name):
+        raise ValueError(f"profiles 中的 name 只能包含字母、数字、下划线或连字符: {name!r}")
+
+    webhooks = profile_data.get("webhooks") or {}
+    channels = {
+        config_key: str(webhooks.get(field) or "").strip()
+        for config_key, field in WEBHOOK_CONFIG_KEYS.items()
+    }
+    channels["WEWORK_MSG_TYPE"] = channels["WEWORK_MSG_TYPE"] or "markdown"
+    channels["NTFY_SERVER_URL"] = channels["NTFY_SERVER_URL"] or "https://ntfy.sh"
+
+    return {
+        "NAME": name,
+        "FREQUENCY_FILE": profile_data.get("frequency_file") or "config/frequency_words.txt",
+        "REPORT_MODE": profile_data.get("report_mode") or config["REPORT_MODE"],
+        "CHANNELS": channels,
+    }
+
+
+def get_env_int(name: str, default: int) -> int:
+    """读取整数环境变量，未设置或不是整数时返回 default"""
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        print(f"环境变量 {name}={value!r} 不是整数，已忽略")
+        return default
+
+
 def load_config():
     """加载配置文件"""
     config_path = os.environ.get("CONFIG_PATH", "config/config.yaml")
@@ -73,6 +157,26 @@ def load_config():
         "VERSION_CHECK_URL": config_data["app"]["version_check_url"],
         "SHOW_VERSION_UPDATE": config_data["app"]["show_version_update"],
         "REQUEST_INTERVAL": config_data["crawler"]["request_interval"],
+        "CRAWLER_MAX_WORKERS": get_env_int("CRAWLER_MAX_WORKERS", 0)
+        or config_data["crawler"].get("max_workers", 1),
+        "HOST_RATE_LIMIT": config_data["crawler"].get("host_rate_limit", 0),
+        "HTTP_POOL_SIZE": config_data["crawler"].get("http_pool_size", 10),
+        "SKIP_UNCHANGED": config_data["crawler"].get("skip_unchanged", False),
+        "ADAPTIVE_POLLING": {
+            "ENABLED": os.environ.get("ADAPTIVE_POLLING", "").strip().lower()
+            in ("true", "1")
+            if os.environ.get("ADAPTIVE_POLLING", "").strip()
+            else config_data["crawler"].get("adaptive_polling", {}).get("enabled", False),
+            "MIN_INTERVAL": config_data["crawler"]
+            .get("adaptive_polling", {})
+            .get("min_interval", 30),
+            "MAX_INTERVAL": config_data["crawler"]
+            .get("adaptive_polling", {})
+            .get("max_interval", 180),
+            "STATE_FILE": config_data["crawler"]
+            .get("adaptive_polling", {})
+            .get("state_file", "output/poll_state.json"),
+        },
         "REPORT_MODE": os.environ.get("REPORT_MODE", "").strip()
         or config_data["report"]["mode"],
         "RANK_THRESHOLD": config_data["report"]["rank_threshold"],
@@ -84,6 +188,9 @@ def load_config():
             os.environ.get("MAX_NEWS_PER_KEYWORD", "").strip() or "0"
         )
         or config_data["report"].get("max_news_per_keyword", 0),
+        "SAVE_CRAWL_HTML": config_data["report"].get("save_crawl_html", False),
+        "CLUSTER_SIMILAR_TITLES": config_data["report"].get("cluster_similar_titles", False),
+        "CLUSTER_SIMILARITY": config_data["report"].get("cluster_similarity", 0.5),
         "USE_PROXY": config_data["crawler"]["use_proxy"],
         "DEFAULT_PROXY": config_data["crawler"]["default_proxy"],
         "ENABLE_CRAWLER": os.environ.get("ENABLE_CRAWLER", "").strip().lower()
@@ -142,6 +249,7 @@ def load_config():
             "HOTNESS_WEIGHT": config_data["weight"]["hotness_weight"],
         },
         "PLATFORMS": config_data["platforms"],
+        "STORAGE": resolve_storage_config(config_data.get("storage")),
     }
 
     # 通知渠道配置（环境变量优先）
@@ -236,6 +344,17 @@ def load_config():
     else:
         print("未配置任何通知渠道")
 
+    # 多配置：共用一次抓取，各自生成报告并推送到自己的渠道
+    config["PROFILES"] = [
+        load_profile_config(profile_data, config)
+        for profile_data in config_data.get("profiles") or []
+    ]
+    profile_names = [profile["NAME"] for profile in config["PROFILES"]]
+    if len(set(profile_names)) != len(profile_names):
+        raise ValueError(f"profiles 中的 name 不能重复: {profile_names}")
+    if profile_names:
+        print(f"报告配置: {', '.join(profile_names)}")
+
     return config
 
 
@@ -261,16 +380,6 @@ def format_time_filename():
     return get_beijing_time().strftime("%H时%M分")
 
 
-def clean_title(title: str) -> str:
-    """清理标题中的特殊字符"""
-    if not isinstance(title, str):
-        title = str(title)
-    cleaned_title = title.replace("\n", " ").replace("\r", " ")
-    cleaned_title = re.sub(r"\s+", " ", cleaned_title)
-    cleaned_title = cleaned_title.strip()
-    return cleaned_title
-
-
 def ensure_directory_exists(directory: str):
     """确保目录存在"""
     Path(directory).mkdir(parents=True, exist_ok=True)
@@ -284,6 +393,26 @@ def get_output_path(subfolder: str, filename: str) -> str:
     return str(output_dir / filename)
 
 
+_storage = None
+
+
+def get_storage():
+    """获取快照存储（按 storage 配置创建，进程内复用）"""
+    global _storage
+    if _storage is None:
+        storage_config = CONFIG["STORAGE"]
+        _storage = create_storage(
+            backend=storage_config["BACKEND"],
+            output_dir="output",
+            sqlite_path=storage_config["SQLITE_PATH"],
+            txt_export=storage_config["TXT_EXPORT"],
+            parse_cache=storage_config["PARSE_CACHE"],
+            delta_snapshots=storage_config["DELTA_SNAPSHOTS"],
+            keyframe_interval=storage_config["KEYFRAME_INTERVAL"],
+        )
+    return _storage
+
+
 def check_version_update(
     current_version: str, version_url: str, proxy_url: Optional[str] = None
 ) -> Tuple[bool, Optional[str]]:
@@ -299,7 +428,7 @@ def check_version_update(
             "Cache-Control": "no-cache",
         }
 
-        response = requests.get(
+        response = get_http_client().get(
             version_url, proxies=proxies, headers=headers, timeout=10
         )
         response.raise_for_status()
@@ -330,14 +459,7 @@ def check_version_update(
 
 def is_first_crawl_today() -> bool:
     """检测是否是当天第一次爬取"""
-    date_folder = format_date_folder()
-    txt_dir = Path("output") / date_folder / "txt"
-
-    if not txt_dir.exists():
-        return True
-
-    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
-    return len(files) <= 1
+    return len(get_storage().list_snapshots(format_date_folder())) <= 1
 
 
 def html_escape(text: str) -> str:
@@ -356,10 +478,12 @@ def html_escape(text: str) -> str:
 
 # === 推送记录管理 ===
 class PushRecordManager:
-    """推送记录管理器"""
+    """推送记录管理器（多配置时每个配置单独记录）"""
 
-    def __init__(self):
+    def __init__(self, profile_name: str = ""):
         self.record_dir = Path("output") / ".push_records"
+        if profile_name:
+            self.record_dir = self.record_dir / profile_name
         self.ensure_record_dir()
         self.cleanup_old_records()
 
@@ -458,11 +582,44 @@ class PushRecordManager:
 
 
 # === 数据获取 ===
+class HostRateLimiter:
+    """按主机的礼貌限速器（线程安全），保证同一主机的请求间隔不小于 1/rate 秒"""
+
+    def __init__(self, requests_per_second: float = 0):
+        self.min_interval = 1.0 / requests_per_second if requests_per_second > 0 else 0
+        self._lock = threading.Lock()
+        self._next_allowed = {}
+
+    def wait(self, url: str) -> None:
+        """阻塞直到该主机允许发出下一个请求"""
+        if self.min_interval <= 0:
+            return
+
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_allowed.get(host, now))
+            self._next_allowed[host] = slot + self.min_interval
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
 class DataFetcher:
     """数据获取器"""
 
-    def __init__(self, proxy_url: Optional[str] = None):
+    def __init__(
+        self,
+        proxy_url: Optional[str] = None,
+        max_workers: int = 1,
+        host_rate_limit: float = 0,
+    ):
         self.proxy_url = proxy_url
+        self.max_workers = max(1, int(max_workers or 1))
+        self.rate_limiter = HostRateLimiter(host_rate_limit)
+        # 最近一次爬取中各平台的内容哈希
+        self.content_hashes: Dict[str, str] = {}
 
     def fetch_data(
         self,
@@ -495,7 +652,8 @@ class DataFetcher:
         retries = 0
         while retries <= max_retries:
             try:
-                response = requests.get(
+                self.rate_limiter.wait(url)
+                response = get_http_client().get(
                     url, proxies=proxies, headers=headers, timeout=10
                 )
                 response.raise_for_status()
@@ -524,12 +682,47 @@ class DataFetcher:
                     return None, id_value, alias
         return None, id_value, alias
 
+    def parse_response(self, id_value: str, response: str) -> Optional[Dict]:
+        """解析接口响应为 {title: {ranks, url, mobileUrl}}，失败返回 None"""
+        try:
+            data = json.loads(response)
+            title_data = {}
+            for index, item in enumerate(data.get("items", []), 1):
+                title = item.get("title")
+                # 跳过无效标题（None、float、空字符串）
+                if title is None or isinstance(title, float) or not str(title).strip():
+                    continue
+                title = str(title).strip()
+                url = item.get("url", "")
+                mobile_url = item.get("mobileUrl", "")
+
+                if title in title_data:
+                    title_data[title]["ranks"].append(index)
+                else:
+                    title_data[title] = {
+                        "ranks": [index],
+                        "url": url,
+                        "mobileUrl": mobile_url,
+                    }
+            # 抓取时即计算内容哈希，用于判断平台内容是否与上一次快照相同
+            self.content_hashes[id_value] = compute_platform_hash(title_data)
+            return title_data
+        except json.JSONDecodeError:
+            print(f"解析 {id_value} 响应失败")
+        except Exception as e:
+            print(f"处理 {id_value} 数据出错: {e}")
+        return None
+
     def crawl_websites(
         self,
         ids_list: List[Union[str, Tuple[str, str]]],
         request_interval: int = CONFIG["REQUEST_INTERVAL"],
     ) -> Tuple[Dict, Dict, List]:
-        """爬取多个网站数据"""
+        """爬取多个网站数据（max_workers > 1 时并发爬取）"""
+        self.content_hashes = {}
+        if self.max_workers > 1 and len(ids_list) > 1:
+            return self._crawl_concurrently(ids_list)
+
         results = {}
         id_to_name = {}
         failed_ids = []
@@ -544,33 +737,9 @@ class DataFetcher:
             id_to_name[id_value] = name
             response, _, _ = self.fetch_data(id_info)
 
-            if response:
-                try:
-                    data = json.loads(response)
-                    results[id_value] = {}
-                    for index, item in enumerate(data.get("items", []), 1):
-                        title = item.get("title")
-                        # 跳过无效标题（None、float、空字符串）
-                        if title is None or isinstance(title, float) or not str(title).strip():
-                            continue
-                        title = str(title).strip()
-                        url = item.get("url", "")
-                        mobile_url = item.get("mobileUrl", "")
-
-                        if title in results[id_value]:
-                            results[id_value][title]["ranks"].append(index)
-                        else:
-                            results[id_value][title] = {
-                                "ranks": [index],
-                                "url": url,
-                                "mobileUrl": mobile_url,
-                            }
-                except json.JSONDecodeError:
-                    print(f"解析 {id_value} 响应失败")
-                    failed_ids.append(id_value)
-                except Exception as e:
-                    print(f"处理 {id_value} 数据出错: {e}")
-                    failed_ids.append(id_value)
+            title_data = self.parse_response(id_value, response) if response else None
+            if title_data is not None:
+                results[id_value] = title_data
             else:
                 failed_ids.append(id_value)
 
@@ -582,62 +751,130 @@ class DataFetcher:
         print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
         return results, id_to_name, failed_ids
 
+    def _crawl_concurrently(
+        self, ids_list: List[Union[str, Tuple[str, str]]]
+    ) -> Tuple[Dict, Dict, List]:
+        """并发爬取，请求节奏由 HostRateLimiter 控制，结果保持配置顺序"""
+        id_to_name = {}
+        for id_info in ids_list:
+            if isinstance(id_info, tuple):
+                id_to_name[id_info[0]] = id_info[1]
+            else:
+                id_to_name[id_info] = id_info
 
-# === 数据处理 ===
-def save_titles_to_file(results: Dict, id_to_name: Dict, failed_ids: List) -> str:
-    """保存标题到文件"""
-    file_path = get_output_path("txt", f"{format_time_filename()}.txt")
+        workers = min(self.max_workers, len(ids_list))
+        print(f"并发爬取 {len(ids_list)} 个平台，线程数 {workers}")
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            responses = list(executor.map(self.fetch_data, ids_list))
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        for id_value, title_data in results.items():
-            # id | name 或 id
-            name = id_to_name.get(id_value)
-            if name and name != id_value:
-                f.write(f"{id_value} | {name}\n")
+        results = {}
+        failed_ids = []
+        for response, id_value, _ in responses:
+            title_data = self.parse_response(id_value, response) if response else None
+            if title_data is not None:
+                results[id_value] = title_data
             else:
-                f.write(f"{id_value}\n")
-
-            # 按排名排序标题
-            sorted_titles = []
-            for title, info in title_data.items():
-                cleaned_title = clean_title(title)
-                if isinstance(info, dict):
-                    ranks = info.get("ranks", [])
-                    url = info.get("url", "")
-                    mobile_url = info.get("mobileUrl", "")
-                else:
-                    ranks = info if isinstance(info, list) else []
-                    url = ""
-                    mobile_url = ""
+                failed_ids.append(id_value)
 
-                rank = ranks[0] if ranks else 1
-                sorted_titles.append((rank, cleaned_title, url, mobile_url))
+        print(f"成功: {list(results.keys())}, 失败: {failed_ids}")
+        return results, id_to_name, failed_ids
 
-            sorted_titles.sort(key=lambda x: x[0])
 
-            for rank, cleaned_title, url, mobile_url in sorted_titles:
-                line = f"{rank}. {cleaned_title}"
+# === 数据处理 ===
+def save_titles_to_file(
+    results: Dict,
+    id_to_name: Dict,
+    failed_ids: List,
+    time_info: Optional[str] = None,
+    refs: Optional[Dict[str, str]] = None,
+) -> str:
+    """保存标题快照（按 storage 配置写入 txt 或 SQLite），返回保存位置
 
-                if url:
-                    line += f" [URL:{url}]"
-                if mobile_url:
-                    line += f" [MOBILE:{mobile_url}]"
-                f.write(line + "\n")
+    refs 中的平台内容与此前快照相同，只写入对该快照的引用。
+    """
+    return get_storage().save_snapshot(
+        format_date_folder(),
+        time_info or format_time_filename(),
+        results,
+        id_to_name,
+        failed_ids,
+        refs,
+    )
 
-            f.write("\n")
 
-        if failed_ids:
-            f.write("==== 以下ID请求失败 ====\n")
-            for id_value in failed_ids:
-                f.write(f"{id_value}\n")
+def find_unchanged_platforms(content_hashes: Dict[str, str]) -> Dict[str, str]:
+    """对比当日聚合中各平台最近一次的内容哈希，返回内容未变化的平台 {平台ID: 内容所在快照时间}"""
+    aggregate = get_daily_aggregate()
+    refs = {}
+    for platform_id, content_hash in content_hashes.items():
+        known = aggregate.platform_hashes.get(platform_id)
+        if known and known[0] == content_hash:
+            refs[platform_id] = known[1]
+    return refs
 
-    return file_path
 
+def archive_finished_days(keep_days: int) -> List[str]:
+    """
+    把已结束的日期归档为 output/<日期>.tar.gz（读取时由存储层透明访问）
 
-def load_frequency_words(
-    frequency_file: Optional[str] = None,
-) -> Tuple[List[Dict], List[str]]:
-    """加载频率词配置"""
+    Args:
+        keep_days: 保留最近多少天（含今天）不归档，小于 1 时不归档
+
+    Returns:
+        本次归档的日期文件夹名列表
+    """
+    if keep_days < 1:
+        return []
+    storage = get_storage()
+    cutoff = (get_beijing_time() - timedelta(days=keep_days - 1)).strftime("%Y年%m月%d日")
+    archived = []
+    for date_folder in storage.list_dates():
+        if date_folder >= cutoff:
+            continue
+        try:
+            archive_path = storage.archive_date(date_folder)
+        except (FileNotFoundError, FileExistsError):
+            # 已经归档或没有可归档的文件
+            continue
+        except Exception as e:
+            print(f"归档 {date_folder} 失败: {e}")
+            continue
+        print(f"已归档: {archive_path}")
+        archived.append(date_folder)
+    return archived
+
+
+class FrequencyConfig:
+    """编译后的频率词配置：词组、过滤词、匹配器与内容版本"""
+
+    def __init__(
+        self,
+        file_path: str,
+        mtime_ns: int,
+        word_groups: List[Dict],
+        filter_words: List[str],
+    ):
+        self.file_path = file_path
+        self.mtime_ns = mtime_ns
+        self.word_groups = word_groups
+        self.filter_words = filter_words
+        self.matcher = get_word_matcher(word_groups, filter_words)
+
+    @property
+    def version(self) -> str:
+        """配置内容版本，其他缓存可以据此判断是否失效"""
+        return self.matcher.version
+
+    def matches(self, title: str) -> bool:
+        """检查标题是否匹配词组规则"""
+        return matches_word_groups(title, self.word_groups, self.filter_words)
+
+
+_frequency_configs: Dict[str, FrequencyConfig] = {}
+
+
+def load_frequency_config(frequency_file: Optional[str] = None) -> FrequencyConfig:
+    """加载并编译频率词配置，按文件路径和修改时间缓存，文件未变化时直接复用"""
     if frequency_file is None:
         frequency_file = os.environ.get(
             "FREQUENCY_WORDS_PATH", "config/frequency_words.txt"
@@ -647,9 +884,32 @@ def load_frequency_words(
     if not frequency_path.exists():
         raise FileNotFoundError(f"频率词文件 {frequency_file} 不存在")
 
+    cache_key = str(frequency_path.resolve())
+    mtime_ns = frequency_path.stat().st_mtime_ns
+    cached = _frequency_configs.get(cache_key)
+    if cached and cached.mtime_ns == mtime_ns:
+        return cached
+
     with open(frequency_path, "r", encoding="utf-8") as f:
         content = f.read()
 
+    word_groups, filter_words = parse_frequency_words(content)
+    config = FrequencyConfig(str(frequency_path), mtime_ns, word_groups, filter_words)
+    _frequency_configs[cache_key] = config
+    return config
+
+
+def load_frequency_words(
+    frequency_file: Optional[str] = None,
+) -> Tuple[List[Dict], List[str]]:
+    """加载频率词配置"""
+    config = load_frequency_config(frequency_file)
+    return config.word_groups, config.filter_words
+
+
+def parse_frequency_words(content: str) -> Tuple[List[Dict], List[str]]:
+    """解析频率词文件内容，返回(词组列表, 过滤词列表)"""
+
     word_groups = [group.strip() for group in content.split("\n\n") if group.strip()]
 
     processed_groups = []
@@ -698,250 +958,265 @@ def load_frequency_words(
     return processed_groups, filter_words
 
 
-def parse_file_titles(file_path: Path) -> Tuple[Dict, Dict]:
-    """解析单个txt文件的标题数据，返回(titles_by_id, id_to_name)"""
-    titles_by_id = {}
-    id_to_name = {}
-
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
-        sections = content.split("\n\n")
-
-        for section in sections:
-            if not section.strip() or "==== 以下ID请求失败 ====" in section:
-                continue
-
-            lines = section.strip().split("\n")
-            if len(lines) < 2:
-                continue
-
-            # id | name 或 id
-            header_line = lines[0].strip()
-            if " | " in header_line:
-                parts = header_line.split(" | ", 1)
-                source_id = parts[0].strip()
-                name = parts[1].strip()
-                id_to_name[source_id] = name
-            else:
-                source_id = header_line
-                id_to_name[source_id] = source_id
-
-            titles_by_id[source_id] = {}
-
-            for line in lines[1:]:
-                if line.strip():
-                    try:
-                        title_part = line.strip()
-                        rank = None
-
-                        # 提取排名
-                        if ". " in title_part and title_part.split(". ")[0].isdigit():
-                            rank_str, title_part = title_part.split(". ", 1)
-                            rank = int(rank_str)
-
-                        # 提取 MOBILE URL
-                        mobile_url = ""
-                        if " [MOBILE:" in title_part:
-                            title_part, mobile_part = title_part.rsplit(" [MOBILE:", 1)
-                            if mobile_part.endswith("]"):
-                                mobile_url = mobile_part[:-1]
-
-                        # 提取 URL
-                        url = ""
-                        if " [URL:" in title_part:
-                            title_part, url_part = title_part.rsplit(" [URL:", 1)
-                            if url_part.endswith("]"):
-                                url = url_part[:-1]
-
-                        title = clean_title(title_part.strip())
-                        ranks = [rank] if rank is not None else [1]
-
-                        titles_by_id[source_id][title] = {
-                            "ranks": ranks,
-                            "url": url,
-                            "mobileUrl": mobile_url,
-                        }
-
-                    except Exception as e:
-                        print(f"解析标题行出错: {line}, 错误: {e}")
-
-    return titles_by_id, id_to_name
-
-
 def read_all_today_titles(
     current_platform_ids: Optional[List[str]] = None,
 ) -> Tuple[Dict, Dict, Dict]:
-    """读取当天所有标题文件，支持按当前监控平台过滤"""
-    date_folder = format_date_folder()
-    txt_dir = Path("output") / date_folder / "txt"
-
-    if not txt_dir.exists():
+    """读取当天所有标题（来自增量维护的当日聚合），支持按当前监控平台过滤"""
+    aggregate = get_daily_aggregate()
+    if not aggregate.files:
         return {}, {}, {}
 
-    all_results = {}
-    final_id_to_name = {}
-    title_info = {}
-
-    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
-
-    for file_path in files:
-        time_info = file_path.stem
+    return (
+        aggregate.filter_by_platforms(aggregate.all_results, current_platform_ids),
+        aggregate.filter_by_platforms(aggregate.id_to_name, current_platform_ids),
+        aggregate.filter_by_platforms(aggregate.title_info, current_platform_ids),
+    )
 
-        titles_by_id, file_id_to_name = parse_file_titles(file_path)
 
-        if current_platform_ids is not None:
-            filtered_titles_by_id = {}
-            filtered_id_to_name = {}
+def process_source_data(
+    source_id: str,
+    title_data: Dict,
+    time_info: str,
+    all_results: Dict,
+    title_info: Dict,
+) -> None:
+    """处理来源数据，合并重复标题（all_results 与 title_info 中同一标题共享一条记录）"""
+    source_id = intern(source_id)
+    source_results = all_results.setdefault(source_id, {})
+    source_info = title_info.setdefault(source_id, {})
+    time_value = encode_time(time_info)
+
+    for title, data in title_data.items():
+        ranks = data.get("ranks", [])
+        url = data.get("url", "")
+        mobile_url = data.get("mobileUrl", "")
+
+        record = source_info.get(title)
+        if record is None:
+            title = intern(title)
+            record = TitleRecord(
+                ranks, intern(url), intern(mobile_url), time_value, time_value, 1
+            )
+            source_info[title] = record
+            source_results[title] = record
+        else:
+            record.add_ranks(ranks, unique=True)
+            record.fill_urls(url, mobile_url)
+            record.last_time = time_value
+            record.count += 1
+            source_results.setdefault(title, record)
+
+
+class DailyAggregate:
+    """当日标题聚合：持久化 all_results / title_info，每次只合并尚未处理的快照"""
+
+    FILE_NAME = "aggregate.json"
+    FORMAT_VERSION = 4
+    # 同时维护的词组统计份数（每个频率词配置一份）
+    MAX_GROUP_STATS = 16
+
+    def __init__(self, date_folder: str):
+        self.date_folder = date_folder
+        self.path = Path("output") / date_folder / self.FILE_NAME
+        self._reset()
+        self._load()
+
+    def _reset(self) -> None:
+        # 已合并的快照：[时间, 版本标识]，用于判断历史快照是否变化
+        self.files = []
+        # 标题记录（TitleRecord），all_results 与 title_info 共享同一份
+        self.title_info = {}
+        self.all_results = self.title_info
+        self.id_to_name = {}
+        # 最新快照相对此前所有快照的新增标题
+        self.latest_new_titles = {}
+        # 各平台最近一次的内容：{平台ID: [内容哈希, 内容首次出现的快照时间]}
+        self.platform_hashes = {}
+        # 增量维护的词组统计，每个频率词配置一份（首次使用时建立，不持久化）
+        self._group_stats: Dict[Tuple, "WordGroupStats"] = {}
+
+    def _load(self) -> None:
+        """从磁盘加载聚合，格式不匹配或损坏时从头重建"""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != self.FORMAT_VERSION:
+                return
+            self.files = data["files"]
+            self.title_info = {
+                intern(source_id): {
+                    intern(title): TitleRecord.from_row(row)
+                    for title, row in rows.items()
+                }
+                for source_id, rows in data["title_info"].items()
+            }
+            self.all_results = self.title_info
+            self.id_to_name = data["id_to_name"]
+            self.latest_new_titles = data["latest_new_titles"]
+            self.platform_hashes = data["platform_hashes"]
+        except Exception as e:
+            print(f"读取当日聚合失败，将重新构建: {e}")
+            self._reset()
+
+    def save(self) -> None:
+        """原子写入聚合文件"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": self.FORMAT_VERSION,
+            "files": self.files,
+            "id_to_name": self.id_to_name,
+            # 记录以紧凑的列表形式写入：[排名, url, mobileUrl, 首次时间, 最后时间, 次数]
+            "title_info": {
+                source_id: {title: record.to_row() for title, record in records.items()}
+                for source_id, records in self.title_info.items()
+            },
+            "latest_new_titles": self.latest_new_titles,
+            "platform_hashes": self.platform_hashes,
+        }
+        tmp_path = self.path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            print(f"保存当日聚合失败: {e}")
+
+    def sync(self) -> None:
+        """与快照存储同步：只解析新增的快照，历史快照被改写或删除时重建"""
+        storage = get_storage()
+        current_files = [
+            [entry.time_info, entry.version]
+            for entry in storage.list_snapshots(self.date_folder)
+        ]
+        if not current_files:
+            self._reset()
+            return
 
-            for source_id, title_data in titles_by_id.items():
-                if source_id in current_platform_ids:
-                    filtered_titles_by_id[source_id] = title_data
-                    if source_id in file_id_to_name:
-                        filtered_id_to_name[source_id] = file_id_to_name[source_id]
+        applied = len(self.files)
+        if current_files[:applied] != self.files:
+            if self.files:
+                print("当日快照文件发生变化，重新构建当日聚合")
+            self._reset()
+            applied = 0
 
-            titles_by_id = filtered_titles_by_id
-            file_id_to_name = filtered_id_to_name
+        if len(current_files) == applied:
+            return
 
-        final_id_to_name.update(file_id_to_name)
+        for file_entry in current_files[applied:]:
+            titles_by_id, file_id_to_name = storage.load_snapshot(
+                self.date_folder, file_entry[0]
+            )
+            # 增量快照直接给出相对上一个快照的新增标题，只需在其中找当日首次出现的
+            changes = None
+            if storage.stores_changes and self.files:
+                changes = storage.load_changes(self.date_folder, file_entry[0])
+            self.apply_snapshot(titles_by_id, file_id_to_name, file_entry, changes)
+        storage.flush_cache()
+        self.save()
+
+    def apply_snapshot(
+        self,
+        titles_by_id: Dict,
+        file_id_to_name: Dict,
+        file_entry: List,
+        changes: Optional[Dict] = None,
+    ) -> None:
+        """合并单个快照，并记录其相对历史快照的新增标题
+
+        changes 为快照相对上一个快照的变化（storage.load_changes），提供时只检查其中新增的标题。
+        """
+        time_info = file_entry[0]
+        is_first_snapshot = not self.files
 
+        new_titles = {}
         for source_id, title_data in titles_by_id.items():
+            if not is_first_snapshot:
+                seen_titles = self.all_results.get(source_id, {})
+                candidates = title_data
+                if changes is not None and source_id in changes:
+                    candidates = changes[source_id].added
+                source_new_titles = {
+                    title: title_data[title]
+                    for title in candidates
+                    if title not in seen_titles and title in title_data
+                }
+                if source_new_titles:
+                    new_titles[source_id] = source_new_titles
+
             process_source_data(
-                source_id, title_data, time_info, all_results, title_info
+                source_id, title_data, time_info, self.all_results, self.title_info
             )
+            for group_stats in self._group_stats.values():
+                group_stats.apply(source_id, title_data)
 
-    return all_results, final_id_to_name, title_info
+            # 内容不变时保留最早的快照时间，引用始终指向实际存有内容的快照
+            content_hash = compute_platform_hash(title_data)
+            known = self.platform_hashes.get(source_id)
+            if not known or known[0] != content_hash:
+                self.platform_hashes[source_id] = [content_hash, time_info]
 
+        self.id_to_name.update(file_id_to_name)
+        self.latest_new_titles = new_titles
+        self.files.append(file_entry)
 
-def process_source_data(
-    source_id: str,
-    title_data: Dict,
-    time_info: str,
-    all_results: Dict,
-    title_info: Dict,
-) -> None:
-    """处理来源数据，合并重复标题"""
-    if source_id not in all_results:
-        all_results[source_id] = title_data
-
-        if source_id not in title_info:
-            title_info[source_id] = {}
-
-        for title, data in title_data.items():
-            ranks = data.get("ranks", [])
-            url = data.get("url", "")
-            mobile_url = data.get("mobileUrl", "")
-
-            title_info[source_id][title] = {
-                "first_time": time_info,
-                "last_time": time_info,
-                "count": 1,
-                "ranks": ranks,
-                "url": url,
-                "mobileUrl": mobile_url,
-            }
-    else:
-        for title, data in title_data.items():
-            ranks = data.get("ranks", [])
-            url = data.get("url", "")
-            mobile_url = data.get("mobileUrl", "")
+    def get_group_stats(
+        self, word_groups: List[Dict], filter_words: List[str], rank_threshold: int
+    ) -> "WordGroupStats":
+        """获取当日的词组统计，新的配置首次使用时建立，之后随合并的快照增量更新
 
-            if title not in all_results[source_id]:
-                all_results[source_id][title] = {
-                    "ranks": ranks,
-                    "url": url,
-                    "mobileUrl": mobile_url,
-                }
-                title_info[source_id][title] = {
-                    "first_time": time_info,
-                    "last_time": time_info,
-                    "count": 1,
-                    "ranks": ranks,
-                    "url": url,
-                    "mobileUrl": mobile_url,
-                }
-            else:
-                existing_data = all_results[source_id][title]
-                existing_ranks = existing_data.get("ranks", [])
-                existing_url = existing_data.get("url", "")
-                existing_mobile_url = existing_data.get("mobileUrl", "")
-
-                merged_ranks = existing_ranks.copy()
-                for rank in ranks:
-                    if rank not in merged_ranks:
-                        merged_ranks.append(rank)
-
-                all_results[source_id][title] = {
-                    "ranks": merged_ranks,
-                    "url": existing_url or url,
-                    "mobileUrl": existing_mobile_url or mobile_url,
-                }
+        多个频率词配置各自保留一份，超过 MAX_GROUP_STATS 份时丢弃最早建立的。
+        """
+        key = WordGroupStats.make_key(word_groups, filter_words, rank_threshold)
+        group_stats = self._group_stats.get(key)
+        if group_stats is None:
+            if len(self._group_stats) >= self.MAX_GROUP_STATS:
+                del self._group_stats[next(iter(self._group_stats))]
+            group_stats = self._group_stats[key] = WordGroupStats(
+                self.title_info, word_groups, filter_words, rank_threshold
+            )
+        return group_stats
+
+    @staticmethod
+    def filter_by_platforms(
+        data: Dict, current_platform_ids: Optional[List[str]] = None
+    ) -> Dict:
+        """按平台过滤（返回新的外层字典，内层数据与聚合共享，调用方只读）"""
+        if current_platform_ids is None:
+            return dict(data)
+        return {
+            source_id: value
+            for source_id, value in data.items()
+            if source_id in current_platform_ids
+        }
 
-                title_info[source_id][title]["last_time"] = time_info
-                title_info[source_id][title]["ranks"] = merged_ranks
-                title_info[source_id][title]["count"] += 1
-                if not title_info[source_id][title].get("url"):
-                    title_info[source_id][title]["url"] = url
-                if not title_info[source_id][title].get("mobileUrl"):
-                    title_info[source_id][title]["mobileUrl"] = mobile_url
 
+_daily_aggregates: Dict[str, DailyAggregate] = {}
 
-def detect_latest_new_titles(current_platform_ids: Optional[List[str]] = None) -> Dict:
-    """检测当日最新批次的新增标题，支持按当前监控平台过滤"""
+
+def get_daily_aggregate() -> DailyAggregate:
+    """获取当天的聚合（进程内复用），并同步最新快照"""
     date_folder = format_date_folder()
-    txt_dir = Path("output") / date_folder / "txt"
+    aggregate = _daily_aggregates.get(date_folder)
+    if aggregate is None:
+        _daily_aggregates.clear()
+        aggregate = DailyAggregate(date_folder)
+        _daily_aggregates[date_folder] = aggregate
 
-    if not txt_dir.exists():
-        return {}
+    aggregate.sync()
+    return aggregate
 
-    files = sorted([f for f in txt_dir.iterdir() if f.suffix == ".txt"])
-    if len(files) < 2:
+
+def detect_latest_new_titles(current_platform_ids: Optional[List[str]] = None) -> Dict:
+    """检测当日最新批次的新增标题（来自当日聚合），支持按当前监控平台过滤"""
+    aggregate = get_daily_aggregate()
+    if len(aggregate.files) < 2:
         return {}
 
-    # 解析最新文件
-    latest_file = files[-1]
-    latest_titles, _ = parse_file_titles(latest_file)
-
-    # 如果指定了当前平台列表，过滤最新文件数据
-    if current_platform_ids is not None:
-        filtered_latest_titles = {}
-        for source_id, title_data in latest_titles.items():
-            if source_id in current_platform_ids:
-                filtered_latest_titles[source_id] = title_data
-        latest_titles = filtered_latest_titles
-
-    # 汇总历史标题（按平台过滤）
-    historical_titles = {}
-    for file_path in files[:-1]:
-        historical_data, _ = parse_file_titles(file_path)
-
-        # 过滤历史数据
-        if current_platform_ids is not None:
-            filtered_historical_data = {}
-            for source_id, title_data in historical_data.items():
-                if source_id in current_platform_ids:
-                    filtered_historical_data[source_id] = title_data
-            historical_data = filtered_historical_data
-
-        for source_id, titles_data in historical_data.items():
-            if source_id not in historical_titles:
-                historical_titles[source_id] = set()
-            for title in titles_data.keys():
-                historical_titles[source_id].add(title)
-
-    # 找出新增标题
-    new_titles = {}
-    for source_id, latest_source_titles in latest_titles.items():
-        historical_set = historical_titles.get(source_id, set())
-        source_new_titles = {}
-
-        for title, title_data in latest_source_titles.items():
-            if title not in historical_set:
-                source_new_titles[title] = title_data
-
-        if source_new_titles:
-            new_titles[source_id] = source_new_titles
-
-    return new_titles
+    return aggregate.filter_by_platforms(
+        aggregate.latest_new_titles, current_platform_ids
+    )
 
 
 # === 统计和分析 ===
@@ -949,36 +1224,321 @@ def calculate_news_weight(
     title_data: Dict, rank_threshold: int = CONFIG["RANK_THRESHOLD"]
 ) -> float:
     """计算新闻权重，用于排序"""
-    ranks = title_data.get("ranks", [])
-    if not ranks:
-        return 0.0
+    return calculate_news_weights([title_data], rank_threshold)[0]
 
-    count = title_data.get("count", len(ranks))
+
+def calculate_news_weights(
+    titles: List[Dict], rank_threshold: int = CONFIG["RANK_THRESHOLD"]
+) -> List[float]:
+    """批量计算新闻权重（公式见 trendradar.scoring，条目多且安装了 NumPy 时向量化计算）"""
     weight_config = CONFIG["WEIGHT_CONFIG"]
+    return calculate_weights(
+        titles,
+        rank_threshold,
+        weight_config["RANK_WEIGHT"],
+        weight_config["FREQUENCY_WEIGHT"],
+        weight_config["HOTNESS_WEIGHT"],
+    )
 
-    # 排名权重：Σ(11 - min(rank, 10)) / 出现次数
-    rank_scores = []
-    for rank in ranks:
-        score = 11 - min(rank, 10)
-        rank_scores.append(score)
 
-    rank_weight = sum(rank_scores) / len(ranks) if ranks else 0
+def select_top_titles(
+    titles: List[Dict], rank_threshold: int, limit: int = 0
+) -> List[Dict]:
+    """按权重排序标题；limit 大于 0 时用有界堆只选出前 limit 条，不对全部标题排序
 
-    # 频次权重：min(出现次数, 10) × 10
-    frequency_weight = min(count, 10) * 10
+    排序键依次为权重降序、最高排名升序、出现次数降序，键相同时保持原顺序。
+    """
+    weights = calculate_news_weights(titles, rank_threshold)
+    sort_keys = [
+        (-weight, min(title["ranks"]) if title["ranks"] else 999, -title["count"])
+        for weight, title in zip(weights, titles)
+    ]
+    if 0 < limit < len(titles):
+        # heapq.nsmallest 与 sorted(...)[:limit] 结果一致（同样稳定）
+        order = heapq.nsmallest(limit, range(len(titles)), key=sort_keys.__getitem__)
+    else:
+        order = sorted(range(len(titles)), key=sort_keys.__getitem__)
+    return [titles[index] for index in order]
 
-    # 热度加成：高排名次数 / 总出现次数 × 100
-    high_rank_count = sum(1 for rank in ranks if rank <= rank_threshold)
-    hotness_ratio = high_rank_count / len(ranks) if ranks else 0
-    hotness_weight = hotness_ratio * 100
 
-    total_weight = (
-        rank_weight * weight_config["RANK_WEIGHT"]
-        + frequency_weight * weight_config["FREQUENCY_WEIGHT"]
-        + hotness_weight * weight_config["HOTNESS_WEIGHT"]
+def merge_similar_titles(titles: List[Dict]) -> List[Dict]:
+    """
+    合并不同平台上的相似标题（titles 已按权重排序）
+
+    每个簇保留权重最高（排在最前）的标题作为代表，来源合并为平台列表，
+    排名、出现次数与时间范围合并，任一标题为新增时整条标记为新增。
+    """
+    clusters = cluster_titles(
+        [title_data["title"] for title_data in titles],
+        CONFIG["CLUSTER_SIMILARITY"],
+        [title_data["source_name"] for title_data in titles],
     )
+    if len(clusters) == len(titles):
+        return titles
+
+    merged_titles = []
+    for members in clusters:
+        if len(members) == 1:
+            merged_titles.append(titles[members[0]])
+            continue
+
+        items = [titles[index] for index in members]
+        first_time = min(
+            (item["first_time"] for item in items if item.get("first_time")), default=""
+        )
+        last_time = max((item.get("last_time", "") for item in items), default="")
+        platforms = [item["source_name"] for item in items]
+        merged_titles.append(
+            {
+                **items[0],
+                "source_name": "、".join(platforms),
+                "platforms": platforms,
+                "first_time": first_time,
+                "last_time": last_time,
+                "time_display": format_time_display(first_time, last_time),
+                "count": sum(item["count"] for item in items),
+                "ranks": sorted({rank for item in items for rank in item["ranks"]}),
+                "is_new": any(item.get("is_new", False) for item in items),
+                "similar_titles": [item["title"] for item in items[1:]],
+            }
+        )
+    return merged_titles
 
-    return total_weight
+
+def select_group_titles(
+    titles: List[Dict], rank_threshold: int, limit: int = 0
+) -> Tuple[List[Dict], int]:
+    """
+    词组内标题的排序与截取：启用相似标题合并时先合并，再按合并后的权重排序并截取
+
+    Returns:
+        (排序并截取后的标题, 合并后的条数)
+    """
+    if not CONFIG["CLUSTER_SIMILAR_TITLES"] or len(titles) < 2:
+        return select_top_titles(titles, rank_threshold, limit), len(titles)
+    merged_titles = merge_similar_titles(select_top_titles(titles, rank_threshold))
+    return select_top_titles(merged_titles, rank_threshold, limit), len(merged_titles)
+
+
+class WordGroupMatcher:
+    """频率词匹配器：所有必须词、普通词、过滤词编译为一个 Aho-Corasick 自动机
+
+    每个标题只需扫描一遍，得到命中词的位集（int），词组与过滤判断都基于该位集完成。
+    匹配语义与逐词 `word.lower() in title.lower()` 一致（包含空词恒命中）。
+    """
+
+    def __init__(self, word_groups: List[Dict], filter_words: List[str]):
+        self.word_groups = word_groups
+        self.filter_words = filter_words
+        self.version = self.compute_version(word_groups, filter_words)
+        self.word_ids: Dict[str, int] = {}
+        self.always_mask = 0  # 空词在任何标题中都算命中
+
+        self.filter_mask = self._mask(filter_words)
+        self.group_masks = [
+            (self._mask(group["required"]), self._mask(group["normal"]))
+            for group in word_groups
+        ]
+        self._build_automaton()
+
+    @staticmethod
+    def compute_version(word_groups: List[Dict], filter_words: List[str]) -> str:
+        """根据词组内容计算配置版本，内容相同的配置版本相同"""
+        payload = json.dumps(
+            [
+                [
+                    (group["required"], group["normal"], group["group_key"])
+                    for group in word_groups
+                ],
+                filter_words,
+            ],
+            ensure_ascii=False,
+        )
+        return hashlib.md5(payload.encode("utf-8")).hexdigest()[:12]
+
+    def _mask(self, words: List[str]) -> int:
+        mask = 0
+        for word in words:
+            word_lower = word.lower()
+            word_id = self.word_ids.setdefault(word_lower, len(self.word_ids))
+            mask |= 1 << word_id
+            if not word_lower:
+                self.always_mask |= 1 << word_id
+        return mask
+
+    def _build_automaton(self) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._output: List[int] = [0]
+
+        for word, word_id in self.word_ids.items():
+            if not word:
+                continue
+            state = 0
+            for char in word:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._output.append(0)
+                state = next_state
+            self._output[state] |= 1 << word_id
+
+        # 广度优先构建失败指针，并把失败链上的输出合并到当前状态
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail_state = self._fail[state]
+                while fail_state and char not in self._goto[fail_state]:
+                    fail_state = self._fail[fail_state]
+                self._fail[next_state] = self._goto[fail_state].get(char, 0)
+                self._output[next_state] |= self._output[self._fail[next_state]]
+
+    def scan(self, title: str) -> int:
+        """扫描一遍标题，返回命中词的位集"""
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+        matched = self.always_mask
+        state = 0
+        for char in title.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            matched |= output[state]
+        return matched
+
+    def is_filtered(self, matched: int) -> bool:
+        return bool(matched & self.filter_mask)
+
+    def group_matches(self, group_index: int, matched: int) -> bool:
+        """根据位集判断某个词组是否命中（必须词全部命中，普通词至少命中一个）"""
+        required_mask, normal_mask = self.group_masks[group_index]
+        if matched & required_mask != required_mask:
+            return False
+        if normal_mask and not matched & normal_mask:
+            return False
+        return True
+
+    def match_group(self, title: str) -> Optional[int]:
+        """返回标题命中的第一个词组下标，被过滤或未命中时返回 None
+
+        结果按 (标题, 配置版本) 在本次运行内缓存，实时、汇总与报告阶段共享。
+        """
+        cache_key = (title, self.version)
+        if cache_key in _group_match_cache:
+            return _group_match_cache[cache_key]
+
+        group_index = None
+        if title.strip():
+            matched = self.scan(title)
+            if not self.is_filtered(matched):
+                for index in range(len(self.group_masks)):
+                    if self.group_matches(index, matched):
+                        group_index = index
+                        break
+
+        _cache_group_match(cache_key, group_index)
+        return group_index
+
+    def matches(self, title: str) -> bool:
+        """检查标题是否匹配词组规则（不含空词组的特殊处理）"""
+        return self.match_group(title) is not None
+
+
+class CombinedWordMatcher:
+    """多个频率词配置共用的匹配器：所有配置的词编译为一个自动机
+
+    每个标题只扫描一遍，用各配置自己的过滤词与词组位集（在合并后的词编号上重新计算）
+    判断命中的词组，结果写入与 WordGroupMatcher.match_group 相同的匹配缓存，
+    之后各配置的统计直接命中缓存，匹配开销与配置数量基本无关。
+    """
+
+    def __init__(self, matchers: List[WordGroupMatcher]):
+        self.matchers = matchers
+        # 以所有配置的词组与过滤词构建一个匹配器，只用于扫描标题得到合并后的命中位集
+        self.scanner = WordGroupMatcher(
+            [group for matcher in matchers for group in matcher.word_groups],
+            [word for matcher in matchers for word in matcher.filter_words],
+        )
+        self.profile_masks = [
+            (
+                self._mask(matcher.filter_words),
+                [
+                    (self._mask(group["required"]), self._mask(group["normal"]))
+                    for group in matcher.word_groups
+                ],
+            )
+            for matcher in matchers
+        ]
+
+    def _mask(self, words: List[str]) -> int:
+        """某个配置的词在合并后词编号上的位集"""
+        mask = 0
+        for word in words:
+            mask |= 1 << self.scanner.word_ids[word.lower()]
+        return mask
+
+    def prime(self, titles) -> int:
+        """匹配尚未缓存的标题，返回扫描的标题数"""
+        versions = [matcher.version for matcher in self.matchers]
+        scanned = 0
+        for title in titles:
+            if all((title, version) in _group_match_cache for version in versions):
+                continue
+            scanned += 1
+            matched = self.scanner.scan(title) if title.strip() else None
+            for version, (filter_mask, group_masks) in zip(versions, self.profile_masks):
+                group_index = None
+                if matched is not None and not matched & filter_mask:
+                    for index, (required_mask, normal_mask) in enumerate(group_masks):
+                        if matched & required_mask != required_mask:
+                            continue
+                        if normal_mask and not matched & normal_mask:
+                            continue
+                        group_index = index
+                        break
+                _cache_group_match((title, version), group_index)
+        return scanned
+
+
+_group_match_cache: Dict[Tuple[str, str], Optional[int]] = {}
+_word_matchers: Dict[int, Tuple[List[Dict], List[str], WordGroupMatcher]] = {}
+_combined_matchers: Dict[Tuple[str, ...], CombinedWordMatcher] = {}
+
+
+def _cache_group_match(cache_key: Tuple[str, str], group_index: Optional[int]) -> None:
+    if len(_group_match_cache) >= 200000:
+        _group_match_cache.clear()
+    _group_match_cache[cache_key] = group_index
+
+
+def get_combined_matcher(matchers: List[WordGroupMatcher]) -> CombinedWordMatcher:
+    """获取多个配置的合并匹配器（按各配置版本缓存）"""
+    key = tuple(matcher.version for matcher in matchers)
+    combined = _combined_matchers.get(key)
+    if combined is None:
+        _combined_matchers.clear()
+        combined = _combined_matchers[key] = CombinedWordMatcher(matchers)
+    return combined
+
+
+def get_word_matcher(
+    word_groups: List[Dict], filter_words: List[str]
+) -> WordGroupMatcher:
+    """获取词组配置对应的编译匹配器（按列表对象缓存，同一份配置只编译一次）"""
+    cached = _word_matchers.get(id(word_groups))
+    if cached and cached[0] is word_groups and cached[1] is filter_words:
+        return cached[2]
+
+    if len(_word_matchers) >= 16:
+        _word_matchers.clear()
+    matcher = WordGroupMatcher(word_groups, filter_words)
+    _word_matchers[id(word_groups)] = (word_groups, filter_words, matcher)
+    return matcher
 
 
 def matches_word_groups(
@@ -995,36 +1555,7 @@ def matches_word_groups(
     if not word_groups:
         return True
 
-    title_lower = title.lower()
-
-    # 过滤词检查
-    if any(filter_word.lower() in title_lower for filter_word in filter_words):
-        return False
-
-    # 词组匹配检查
-    for group in word_groups:
-        required_words = group["required"]
-        normal_words = group["normal"]
-
-        # 必须词检查
-        if required_words:
-            all_required_present = all(
-                req_word.lower() in title_lower for req_word in required_words
-            )
-            if not all_required_present:
-                continue
-
-        # 普通词检查
-        if normal_words:
-            any_normal_present = any(
-                normal_word.lower() in title_lower for normal_word in normal_words
-            )
-            if not any_normal_present:
-                continue
-
-        return True
-
-    return False
+    return get_word_matcher(word_groups, filter_words).matches(title)
 
 
 def format_time_display(first_time: str, last_time: str) -> str:
@@ -1074,7 +1605,256 @@ def format_rank_display(ranks: List[int], rank_threshold: int, format_type: str)
         if min_rank == max_rank:
             return f"[{min_rank}]"
         else:
-            return f"[{min_rank} - {max_rank}]"
+            return f"[{min_rank} - {max_rank}]"
+
+
+class WordGroupStats:
+    """当日词组统计的增量维护
+
+    count_word_frequency 的 daily/current 模式原来每次都对当天全部标题重新匹配、计算权重并排序。
+    这里按词组保存命中标题的排序键（由权重输入 ranks/count 决定），当日聚合每合并一个快照，
+    只对其中出现的标题重新计算排序键并在所属词组的有序列表中调整位置：
+    - 标题首次出现时匹配一次词组，之后不再匹配
+    - 各词组、各平台的命中数与标题总数随之增减
+    - current 模式使用的最新批次标题另外维护一份有序列表
+
+    排序键末尾附加平台与标题的出现顺序，结果与原先对全部标题稳定排序完全一致。
+    """
+
+    def __init__(
+        self,
+        title_info: Dict,
+        word_groups: List[Dict],
+        filter_words: List[str],
+        rank_threshold: int,
+    ):
+        self.title_info = title_info
+        self.matcher = get_word_matcher(word_groups, filter_words)
+        self.rank_threshold = rank_threshold
+        self.key = self.make_key(word_groups, filter_words, rank_threshold)
+
+        # 同名词组合并统计（与按 group_key 汇总的原逻辑一致）：词组下标 -> 统计槽位
+        self.slot_keys: List[str] = []
+        self.slot_positions: List[int] = []
+        self.slot_max_counts: List[int] = []
+        self.group_slots: List[int] = []
+        for index, group in enumerate(word_groups):
+            group_key = group["group_key"]
+            if group_key in self.slot_keys:
+                slot = self.slot_keys.index(group_key)
+                # 同名词组的位置与最大显示数量以最后一个为准
+                self.slot_positions[slot] = index
+                self.slot_max_counts[slot] = group.get("max_count", 0)
+            else:
+                slot = len(self.slot_keys)
+                self.slot_keys.append(group_key)
+                self.slot_positions.append(index)
+                self.slot_max_counts.append(group.get("max_count", 0))
+            self.group_slots.append(slot)
+
+        slot_count = len(self.slot_keys)
+        # {(平台ID, 标题): (槽位, 排序键, 出现顺序)}，未命中的标题槽位为 None
+        self._members: Dict[Tuple[str, str], Tuple] = {}
+        # 每个槽位按排序键升序的 (排序键, 平台ID, 标题)
+        self._sorted: List[List[Tuple]] = [[] for _ in range(slot_count)]
+        self._current_sorted: List[List[Tuple]] = [[] for _ in range(slot_count)]
+        # 每个槽位各平台的命中数
+        self._counts: List[Dict[str, int]] = [{} for _ in range(slot_count)]
+        self._current_counts: List[Dict[str, int]] = [{} for _ in range(slot_count)]
+        # 各平台的出现顺序、标题数、最近一次有数据的快照时间及该快照中的标题
+        self._source_order: Dict[str, int] = {}
+        self._source_totals: Dict[str, int] = {}
+        self._source_latest: Dict[str, str] = {}
+        self._source_current: Dict[str, set] = {}
+        # 已生成的标题统计项 {(平台ID, 标题): 字段}，标题在新快照中出现时失效
+        self._title_items: Dict[Tuple[str, str], Dict] = {}
+
+        for source_id, records in title_info.items():
+            latest = max(
+                (record.get("last_time", "") for record in records.values()), default=""
+            )
+            self.apply(
+                source_id,
+                records,
+                [title for title, record in records.items() if record.get("last_time", "") == latest],
+            )
+
+    @staticmethod
+    def make_key(word_groups: List[Dict], filter_words: List[str], rank_threshold: int) -> Tuple:
+        """影响统计结果的配置：词组内容与最大显示数量、排名阈值、权重配置"""
+        return (
+            get_word_matcher(word_groups, filter_words).version,
+            tuple(group.get("max_count", 0) for group in word_groups),
+            rank_threshold,
+            tuple(sorted(CONFIG["WEIGHT_CONFIG"].items())),
+        )
+
+    def _sort_key(self, record, source_order: int, sequence: int) -> Tuple:
+        ranks = record.get("ranks") or [99]
+        count = record.get("count", 1)
+        weight = calculate_news_weight(
+            {"ranks": ranks, "count": count}, self.rank_threshold
+        )
+        return (-weight, min(ranks), -count, source_order, sequence)
+
+    @staticmethod
+    def _remove(entries: List[Tuple], sort_key: Tuple) -> None:
+        del entries[bisect.bisect_left(entries, (sort_key,))]
+
+    @staticmethod
+    def _add_count(counts: Dict[str, int], source_id: str, delta: int) -> None:
+        counts[source_id] = counts.get(source_id, 0) + delta
+
+    def apply(self, source_id: str, titles, current_titles=None) -> None:
+        """
+        合并某个平台在最新快照中出现的标题（当日聚合中的记录已更新）
+
+        Args:
+            source_id: 平台ID
+            titles: 本次出现的标题
+            current_titles: 最新批次的标题，默认即 titles
+        """
+        records = self.title_info.get(source_id)
+        if records is None:
+            return
+        # 平台顺序与当日聚合中的平台顺序一致（包括暂时没有标题的平台）
+        source_order = self._source_order.setdefault(source_id, len(self._source_order))
+        if not titles:
+            return
+        current = set(titles if current_titles is None else current_titles)
+
+        # 上一批次的标题先移出 current 列表，仍在本批次中的稍后以新的排序键重新加入
+        for title in self._source_current.get(source_id, ()):
+            slot, sort_key, _ = self._members[(source_id, title)]
+            if slot is not None:
+                self._remove(self._current_sorted[slot], sort_key)
+                self._add_count(self._current_counts[slot], source_id, -1)
+
+        for title in titles:
+            record = records.get(title)
+            if record is None:
+                continue
+            member_key = (source_id, title)
+            member = self._members.get(member_key)
+            if member is None:
+                sequence = self._source_totals.get(source_id, 0)
+                self._source_totals[source_id] = sequence + 1
+                group_index = self.matcher.match_group(title)
+                if group_index is None:
+                    self._members[member_key] = (None, None, sequence)
+                    continue
+                slot = self.group_slots[group_index]
+                self._add_count(self._counts[slot], source_id, 1)
+            else:
+                slot, old_sort_key, sequence = member
+                if slot is None:
+                    continue
+                self._remove(self._sorted[slot], old_sort_key)
+                self._title_items.pop(member_key, None)
+            sort_key = self._sort_key(record, source_order, sequence)
+            bisect.insort(self._sorted[slot], (sort_key, source_id, title))
+            self._members[member_key] = (slot, sort_key, sequence)
+
+        for title in current:
+            slot, sort_key, _ = self._members[(source_id, title)]
+            if slot is not None:
+                bisect.insort(self._current_sorted[slot], (sort_key, source_id, title))
+                self._add_count(self._current_counts[slot], source_id, 1)
+        self._source_current[source_id] = current
+        self._source_latest[source_id] = records[next(iter(current))].get("last_time", "")
+
+    def _build_item(self, source_id: str, title: str) -> Dict:
+        record = self.title_info[source_id][title]
+        first_time = record.get("first_time", "")
+        last_time = record.get("last_time", "")
+        return {
+            "title": title,
+            "source_name": "",
+            "first_time": first_time,
+            "last_time": last_time,
+            "time_display": format_time_display(first_time, last_time),
+            "count": record.get("count", 1),
+            "ranks": record.get("ranks") or [99],
+            "rank_threshold": self.rank_threshold,
+            "url": record.get("url", ""),
+            "mobileUrl": record.get("mobileUrl", ""),
+            "is_new": False,
+        }
+
+    def compute(
+        self, mode: str, platform_ids, id_to_name: Dict, new_titles: Dict
+    ) -> Tuple[List[Dict], int, Optional[str]]:
+        """
+        生成与 count_word_frequency 相同结构的统计结果
+
+        Args:
+            mode: "daily" 或 "current"
+            platform_ids: 参与统计的平台
+            id_to_name: 平台名称映射
+            new_titles: 最新批次的新增标题
+
+        Returns:
+            (stats, total_titles, current 模式的最新时间)
+        """
+        sources = {source_id for source_id in platform_ids if source_id in self._source_order}
+        latest_time = None
+        if mode == "current":
+            latest_time = max(
+                (self._source_latest.get(source_id, "") for source_id in sources), default=""
+            ) or None
+            sources = {
+                source_id for source_id in sources
+                if self._source_latest.get(source_id) == latest_time
+            }
+            slot_entries, slot_counts = self._current_sorted, self._current_counts
+            total_titles = sum(len(self._source_current[source_id]) for source_id in sources)
+        else:
+            slot_entries, slot_counts = self._sorted, self._counts
+            total_titles = sum(self._source_totals.get(source_id, 0) for source_id in sources)
+
+        stats = []
+        for slot, group_key in enumerate(self.slot_keys):
+            count = sum(slot_counts[slot].get(source_id, 0) for source_id in sources)
+            max_count = self.slot_max_counts[slot] or CONFIG.get("MAX_NEWS_PER_KEYWORD", 0)
+            # 合并相似标题时需要词组内的全部标题，合并后再排序截取
+            clustering = CONFIG["CLUSTER_SIMILAR_TITLES"]
+            titles = []
+            if count:
+                for _, source_id, title in slot_entries[slot]:
+                    if source_id not in sources:
+                        continue
+                    item = self._title_items.get((source_id, title))
+                    if item is None:
+                        item = self._title_items[(source_id, title)] = self._build_item(
+                            source_id, title
+                        )
+                    # 每次返回新的字典，调用方可以修改
+                    item = dict(item)
+                    item["source_name"] = id_to_name.get(source_id, source_id)
+                    item["is_new"] = title in new_titles.get(source_id, ())
+                    item["ranks"] = list(item["ranks"])
+                    titles.append(item)
+                    if not clustering and max_count > 0 and len(titles) >= max_count:
+                        break
+            if clustering and titles:
+                # 条目已按排序键有序，稳定排序保持平台与出现顺序的次序
+                matched_count = len(titles)
+                titles, merged_count = select_group_titles(
+                    titles, self.rank_threshold, max_count
+                )
+                count -= matched_count - merged_count
+            stats.append(
+                {
+                    "word": group_key,
+                    "count": count,
+                    "position": self.slot_positions[slot],
+                    "titles": titles,
+                    "percentage": (
+                        round(count / total_titles * 100, 2) if total_titles > 0 else 0
+                    ),
+                }
+            )
+        return stats, total_titles, latest_time
 
 
 def count_word_frequency(
@@ -1086,8 +1866,12 @@ def count_word_frequency(
     rank_threshold: int = CONFIG["RANK_THRESHOLD"],
     new_titles: Optional[Dict] = None,
     mode: str = "daily",
+    aggregate: Optional[DailyAggregate] = None,
 ) -> Tuple[List[Dict], int]:
-    """统计词频，支持必须词、频率词、过滤词，并标记新增标题"""
+    """统计词频，支持必须词、频率词、过滤词，并标记新增标题
+
+    results/title_info 来自当日聚合时传入 aggregate，daily/current 模式直接使用其增量维护的词组统计。
+    """
 
     # 如果没有配置词组，创建一个包含所有新闻的虚拟词组
     if not word_groups:
@@ -1097,6 +1881,32 @@ def count_word_frequency(
 
     is_first_today = is_first_crawl_today()
 
+    if aggregate is not None and title_info and mode in ("daily", "current"):
+        group_stats = aggregate.get_group_stats(word_groups, filter_words, rank_threshold)
+        stats, total_titles, latest_time = group_stats.compute(
+            mode, results.keys(), id_to_name, new_titles or {}
+        )
+        if mode == "daily" or latest_time:
+            show_all = len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻"
+            if mode == "daily":
+                filter_status = "全部显示" if show_all else "频率词过滤"
+                print(f"当日汇总模式：处理 {total_titles} 条新闻，模式：{filter_status}")
+            else:
+                matched_count = sum(stat["count"] for stat in stats)
+                filter_status = "全部显示" if show_all else "频率词匹配"
+                print(
+                    f"当前榜单模式：最新时间 {latest_time}，筛选出 {total_titles} 条当前榜单新闻"
+                )
+                if is_first_today:
+                    print(
+                        f"当前榜单模式：当天第一次爬取，{total_titles} 条当前榜单新闻中有 {matched_count} 条{filter_status}"
+                    )
+                else:
+                    print(
+                        f"当前榜单模式：{total_titles} 条当前榜单新闻中有 {matched_count} 条{filter_status}"
+                    )
+            return sort_word_stats(stats), total_titles
+
     # 确定处理的数据源和新增标记逻辑
     if mode == "incremental":
         if is_first_today:
@@ -1166,6 +1976,8 @@ def count_word_frequency(
         group_key = group["group_key"]
         word_stats[group_key] = {"count": 0, "titles": {}}
 
+    matcher = get_word_matcher(word_groups, filter_words)
+
     for source_id, titles_data in results_to_process.items():
         total_titles += len(titles_data)
 
@@ -1176,12 +1988,11 @@ def count_word_frequency(
             if title in processed_titles.get(source_id, {}):
                 continue
 
-            # 使用统一的匹配逻辑
-            matches_frequency_words = matches_word_groups(
-                title, word_groups, filter_words
-            )
-
-            if not matches_frequency_words:
+            # 使用统一的匹配逻辑：一次匹配直接得到命中的词组
+            if not isinstance(title, str):
+                title = str(title) if title is not None else ""
+            group_index = matcher.match_group(title)
+            if group_index is None:
                 continue
 
             # 如果是增量模式或 current 模式第一次，统计匹配的新增新闻数量
@@ -1194,115 +2005,84 @@ def count_word_frequency(
             source_url = title_data.get("url", "")
             source_mobile_url = title_data.get("mobileUrl", "")
 
-            # 找到匹配的词组（防御性转换确保类型安全）
-            title_lower = str(title).lower() if not isinstance(title, str) else title.lower()
-            for group in word_groups:
-                required_words = group["required"]
-                normal_words = group["normal"]
-
-                # 如果是"全部新闻"模式，所有标题都匹配第一个（唯一的）词组
-                if len(word_groups) == 1 and word_groups[0]["group_key"] == "全部新闻":
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-                else:
-                    # 原有的匹配逻辑
-                    if required_words:
-                        all_required_present = all(
-                            req_word.lower() in title_lower
-                            for req_word in required_words
-                        )
-                        if not all_required_present:
-                            continue
-
-                    if normal_words:
-                        any_normal_present = any(
-                            normal_word.lower() in title_lower
-                            for normal_word in normal_words
-                        )
-                        if not any_normal_present:
-                            continue
-
-                    group_key = group["group_key"]
-                    word_stats[group_key]["count"] += 1
-                    if source_id not in word_stats[group_key]["titles"]:
-                        word_stats[group_key]["titles"][source_id] = []
-
-                first_time = ""
-                last_time = ""
-                count_info = 1
-                ranks = source_ranks if source_ranks else []
-                url = source_url
-                mobile_url = source_mobile_url
-
-                # 对于 current 模式，从历史统计信息中获取完整数据
-                if (
-                    mode == "current"
-                    and title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-                elif (
-                    title_info
-                    and source_id in title_info
-                    and title in title_info[source_id]
-                ):
-                    info = title_info[source_id][title]
-                    first_time = info.get("first_time", "")
-                    last_time = info.get("last_time", "")
-                    count_info = info.get("count", 1)
-                    if "ranks" in info and info["ranks"]:
-                        ranks = info["ranks"]
-                    url = info.get("url", source_url)
-                    mobile_url = info.get("mobileUrl", source_mobile_url)
-
-                if not ranks:
-                    ranks = [99]
+            # 记录到匹配的词组（"全部新闻"虚拟词组恒命中）
+            group_key = word_groups[group_index]["group_key"]
+            word_stats[group_key]["count"] += 1
+            if source_id not in word_stats[group_key]["titles"]:
+                word_stats[group_key]["titles"][source_id] = []
 
-                time_display = format_time_display(first_time, last_time)
-
-                source_name = id_to_name.get(source_id, source_id)
-
-                # 判断是否为新增
-                is_new = False
-                if all_news_are_new:
-                    # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
-                    is_new = True
-                elif new_titles and source_id in new_titles:
-                    # 检查是否在新增列表中
-                    new_titles_for_source = new_titles[source_id]
-                    is_new = title in new_titles_for_source
-
-                word_stats[group_key]["titles"][source_id].append(
-                    {
-                        "title": title,
-                        "source_name": source_name,
-                        "first_time": first_time,
-                        "last_time": last_time,
-                        "time_display": time_display,
-                        "count": count_info,
-                        "ranks": ranks,
-                        "rank_threshold": rank_threshold,
-                        "url": url,
-                        "mobileUrl": mobile_url,
-                        "is_new": is_new,
-                    }
-                )
+            first_time = ""
+            last_time = ""
+            count_info = 1
+            ranks = source_ranks if source_ranks else []
+            url = source_url
+            mobile_url = source_mobile_url
 
-                if source_id not in processed_titles:
-                    processed_titles[source_id] = {}
-                processed_titles[source_id][title] = True
+            # 对于 current 模式，从历史统计信息中获取完整数据
+            if (
+                mode == "current"
+                and title_info
+                and source_id in title_info
+                and title in title_info[source_id]
+            ):
+                info = title_info[source_id][title]
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if "ranks" in info and info["ranks"]:
+                    ranks = info["ranks"]
+                url = info.get("url", source_url)
+                mobile_url = info.get("mobileUrl", source_mobile_url)
+            elif (
+                title_info
+                and source_id in title_info
+                and title in title_info[source_id]
+            ):
+                info = title_info[source_id][title]
+                first_time = info.get("first_time", "")
+                last_time = info.get("last_time", "")
+                count_info = info.get("count", 1)
+                if "ranks" in info and info["ranks"]:
+                    ranks = info["ranks"]
+                url = info.get("url", source_url)
+                mobile_url = info.get("mobileUrl", source_mobile_url)
+
+            if not ranks:
+                ranks = [99]
+
+            time_display = format_time_display(first_time, last_time)
+
+            source_name = id_to_name.get(source_id, source_id)
+
+            # 判断是否为新增
+            is_new = False
+            if all_news_are_new:
+                # 增量模式下所有处理的新闻都是新增，或者当天第一次的所有新闻都是新增
+                is_new = True
+            elif new_titles and source_id in new_titles:
+                # 检查是否在新增列表中
+                new_titles_for_source = new_titles[source_id]
+                is_new = title in new_titles_for_source
+
+            word_stats[group_key]["titles"][source_id].append(
+                {
+                    "title": title,
+                    "source_name": source_name,
+                    "first_time": first_time,
+                    "last_time": last_time,
+                    "time_display": time_display,
+                    "count": count_info,
+                    "ranks": ranks,
+                    "rank_threshold": rank_threshold,
+                    "url": url,
+                    "mobileUrl": mobile_url,
+                    "is_new": is_new,
+                }
+            )
 
-                break
+            if source_id not in processed_titles:
+                processed_titles[source_id] = {}
+            processed_titles[source_id][title] = True
 
     # 最后统一打印汇总信息
     if mode == "incremental":
@@ -1368,48 +2148,44 @@ def count_word_frequency(
         for source_id, title_list in data["titles"].items():
             all_titles.extend(title_list)
 
-        # 按权重排序
-        sorted_titles = sorted(
-            all_titles,
-            key=lambda x: (
-                -calculate_news_weight(x, rank_threshold),
-                min(x["ranks"]) if x["ranks"] else 999,
-                -x["count"],
-            ),
-        )
-
         # 应用最大显示数量限制（优先级：单独配置 > 全局配置）
         group_max_count = group_key_to_max_count.get(group_key, 0)
         if group_max_count == 0:
             # 使用全局配置
             group_max_count = CONFIG.get("MAX_NEWS_PER_KEYWORD", 0)
 
-        if group_max_count > 0:
-            sorted_titles = sorted_titles[:group_max_count]
+        # 按权重排序（有数量限制时只选出前 N 条），启用时先合并相似标题
+        sorted_titles, merged_count = select_group_titles(
+            all_titles, rank_threshold, group_max_count
+        )
+        group_count = data["count"] - (len(all_titles) - merged_count)
 
         stats.append(
             {
                 "word": group_key,
-                "count": data["count"],
+                "count": group_count,
                 "position": group_key_to_position.get(group_key, 999),
                 "titles": sorted_titles,
                 "percentage": (
-                    round(data["count"] / total_titles * 100, 2)
+                    round(group_count / total_titles * 100, 2)
                     if total_titles > 0
                     else 0
                 ),
             }
         )
 
-    # 根据配置选择排序优先级
+    return sort_word_stats(stats), total_titles
+
+
+def sort_word_stats(stats: List[Dict]) -> List[Dict]:
+    """按配置的优先级对词组统计排序"""
     if CONFIG.get("SORT_BY_POSITION_FIRST", False):
         # 先按配置位置，再按热点条数
         stats.sort(key=lambda x: (x["position"], -x["count"]))
     else:
         # 先按热点条数，再按配置位置（原逻辑）
         stats.sort(key=lambda x: (-x["count"], x["position"]))
-
-    return stats, total_titles
+    return stats
 
 
 # === 报告生成 ===
@@ -1419,6 +2195,7 @@ def prepare_report_data(
     new_titles: Optional[Dict] = None,
     id_to_name: Optional[Dict] = None,
     mode: str = "daily",
+    frequency_config: Optional[FrequencyConfig] = None,
 ) -> Dict:
     """准备报告数据"""
     processed_new_titles = []
@@ -1430,11 +2207,12 @@ def prepare_report_data(
     if not hide_new_section:
         filtered_new_titles = {}
         if new_titles and id_to_name:
-            word_groups, filter_words = load_frequency_words()
+            if frequency_config is None:
+                frequency_config = load_frequency_config()
             for source_id, titles_data in new_titles.items():
                 filtered_titles = {}
                 for title, title_data in titles_data.items():
-                    if matches_word_groups(title, word_groups, filter_words):
+                    if frequency_config.matches(title):
                         filtered_titles[title] = title_data
                 if filtered_titles:
                     filtered_new_titles[source_id] = filtered_titles
@@ -1489,6 +2267,9 @@ def prepare_report_data(
                 "mobile_url": title_data.get("mobileUrl", ""),
                 "is_new": title_data.get("is_new", False),
             }
+            if "platforms" in title_data:
+                processed_title["platforms"] = title_data["platforms"]
+                processed_title["similar_titles"] = title_data["similar_titles"]
             processed_titles.append(processed_title)
 
         processed_stats.append(
@@ -1667,6 +2448,57 @@ def format_title_for_platform(
         return cleaned_title
 
 
+def get_summary_html_filename(mode: str, profile_name: str = "") -> str:
+    """汇总报告的 HTML 文件名（多配置时带配置名后缀）"""
+    if mode == "current":
+        filename = "当前榜单汇总.html"
+    elif mode == "incremental":
+        filename = "当日增量.html"
+    else:
+        filename = "当日汇总.html"
+    if profile_name:
+        filename = filename.replace(".html", f"_{profile_name}.html")
+    return filename
+
+
+def get_crawl_report_name(profile_name: str = "") -> str:
+    """单次爬取报告的文件名（不含扩展名，多配置时带配置名后缀）"""
+    name = format_time_filename()
+    return f"{name}_{profile_name}" if profile_name else name
+
+
+def save_crawl_report(
+    stats: List[Dict],
+    total_titles: int,
+    failed_ids: Optional[List] = None,
+    new_titles: Optional[Dict] = None,
+    id_to_name: Optional[Dict] = None,
+    mode: str = "daily",
+    update_info: Optional[Dict] = None,
+    frequency_config: Optional[FrequencyConfig] = None,
+    profile_name: str = "",
+) -> str:
+    """只保存单次爬取的报告数据（reports/<时间>.json.gz），需要时再渲染 HTML，返回数据文件路径"""
+    name = get_crawl_report_name(profile_name)
+    file_path = get_output_path(REPORTS_DIR, name + REPORT_DATA_SUFFIX)
+    save_report_data(
+        file_path,
+        {
+            "report_data": prepare_report_data(
+                stats, failed_ids, new_titles, id_to_name, mode, frequency_config
+            ),
+            "total_titles": total_titles,
+            "is_daily_summary": False,
+            "mode": mode,
+            "update_info": update_info,
+            "date_folder": format_date_folder(),
+            "time_filename": name,
+            "generated_at": get_beijing_time().strftime("%Y-%m-%d %H:%M:%S"),
+        },
+    )
+    return file_path
+
+
 def generate_html_report(
     stats: List[Dict],
     total_titles: int,
@@ -1676,41 +2508,27 @@ def generate_html_report(
     mode: str = "daily",
     is_daily_summary: bool = False,
     update_info: Optional[Dict] = None,
+    frequency_config: Optional[FrequencyConfig] = None,
+    profile_name: str = "",
 ) -> str:
-    """生成HTML报告"""
+    """生成HTML报告（多配置时文件名带配置名后缀，汇总报告写入 index_<配置名>.html）"""
     if is_daily_summary:
-        if mode == "current":
-            filename = "当前榜单汇总.html"
-        elif mode == "incremental":
-            filename = "当日增量.html"
-        else:
-            filename = "当日汇总.html"
+        filename = get_summary_html_filename(mode, profile_name)
     else:
-        filename = f"{format_time_filename()}.html"
+        filename = get_crawl_report_name(profile_name) + ".html"
 
-    file_path = get_output_path("html", filename)
+    report_data = prepare_report_data(
+        stats, failed_ids, new_titles, id_to_name, mode, frequency_config
+    )
 
-    report_data = prepare_report_data(stats, failed_ids, new_titles, id_to_name, mode)
+    file_path = get_output_path("html", filename)
 
-    # 检查对应的音频文件是否存在
+    # 汇总文件不需要音频（因为是汇总多个时间段的）
     audio_file = None
-    # 使用与HTML文件相同的时间标识，而不是当前时间
-    # 这样可以确保 HTML 文件和音频文件的时间戳一致
-    if is_daily_summary:
-        # 汇总文件不需要音频（因为是汇总多个时间段的）
-        audio_file = None
-    else:
-        # 从filename中提取时间（如 "20时09分.html" -> "20时09分"）
-        time_filename = filename.replace(".html", "")
-        date_folder = format_date_folder()
-        audio_path = Path("output") / date_folder / "audio" / f"{time_filename}.mp3"
-
-        if audio_path.exists():
-            # 使用相对路径
-            audio_file = f"../audio/{time_filename}.mp3"
-            print(f"找到对应的音频文件: {audio_path}")
-        else:
-            print(f"未找到音频文件: {audio_path}")
+    if not is_daily_summary:
+        # 使用与HTML文件相同的时间标识，而不是当前时间
+        # 这样可以确保 HTML 文件和音频文件的时间戳一致
+        audio_file = find_report_audio(format_date_folder(), filename.replace(".html", ""))
 
     html_content = render_html_content(
         report_data, total_titles, is_daily_summary, mode, update_info, audio_file
@@ -1720,13 +2538,67 @@ def generate_html_report(
         f.write(html_content)
 
     if is_daily_summary:
-        root_file_path = Path("index.html")
+        root_file_path = Path(f"index_{profile_name}.html" if profile_name else "index.html")
         with open(root_file_path, "w", encoding="utf-8") as f:
             f.write(html_content)
 
     return file_path
 
 
+def find_report_audio(date_folder: str, time_filename: str) -> Optional[str]:
+    """查找报告对应的播客音频，返回相对 html 目录的路径（不存在时返回 None）"""
+    audio_path = Path("output") / date_folder / "audio" / f"{time_filename}.mp3"
+    if audio_path.exists():
+        print(f"找到对应的音频文件: {audio_path}")
+        return f"../audio/{time_filename}.mp3"
+    print(f"未找到音频文件: {audio_path}")
+    return None
+
+
+def render_report_data(payload: Dict) -> str:
+    """由保存的报告数据渲染 HTML（音频在渲染时查找，之后生成的播客同样会显示）"""
+    audio_file = None
+    if not payload["is_daily_summary"]:
+        audio_file = find_report_audio(payload["date_folder"], payload["time_filename"])
+    generated_at = pytz.timezone("Asia/Shanghai").localize(
+        datetime.strptime(payload["generated_at"], "%Y-%m-%d %H:%M:%S")
+    )
+    return render_html_content(
+        payload["report_data"],
+        payload["total_titles"],
+        payload["is_daily_summary"],
+        payload["mode"],
+        payload["update_info"],
+        audio_file,
+        generated_at,
+    )
+
+
+def load_report_html(report_path: str) -> str:
+    """读取报告的 HTML 内容：HTML 文件直接读取，报告数据即时渲染"""
+    if is_report_data_path(report_path):
+        return render_report_data(load_report_data(report_path))
+    with open(report_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def ensure_report_html(report_path: str) -> str:
+    """需要 HTML 文件时（如在浏览器中打开）把报告数据渲染到 html 目录，返回 HTML 文件路径"""
+    if not is_report_data_path(report_path):
+        return report_path
+    payload = load_report_data(report_path)
+    html_path = (
+        Path("output")
+        / payload["date_folder"]
+        / "html"
+        / f"{payload['time_filename']}.html"
+    )
+    html_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(html_path, "w", encoding="utf-8") as f:
+        f.write(render_report_data(payload))
+    return str(html_path)
+
+
 def render_html_content(
     report_data: Dict,
     total_titles: int,
@@ -1734,8 +2606,9 @@ def render_html_content(
     mode: str = "daily",
     update_info: Optional[Dict] = None,
     audio_file: Optional[str] = None,
+    generated_at: Optional[datetime] = None,
 ) -> str:
-    """渲染HTML内容"""
+    """渲染HTML内容（generated_at 为报告生成时间，默认当前时间）"""
     html = """
     <!DOCTYPE html>
     <html>
@@ -2253,7 +3126,7 @@ def render_html_content(
                         <span class="info-label">生成时间</span>
                         <span class="info-value">"""
 
-    now = get_beijing_time()
+    now = generated_at or get_beijing_time()
     html += now.strftime("%m-%d %H:%M")
 
     html += """</span>
@@ -3449,12 +4322,21 @@ def send_to_notifications(
     proxy_url: Optional[str] = None,
     mode: str = "daily",
     html_file_path: Optional[str] = None,
+    frequency_config: Optional[FrequencyConfig] = None,
+    channels: Optional[Dict] = None,
+    profile_name: str = "",
 ) -> Dict[str, bool]:
-    """发送数据到多个通知平台"""
+    """发送数据到多个通知平台
+
+    channels 为推送渠道配置（键同 CONFIG 中的通知配置），默认使用 CONFIG；
+    多配置时传入各配置自己的渠道，推送记录按 profile_name 分开保存。
+    """
     results = {}
+    if channels is None:
+        channels = CONFIG
 
     if CONFIG["PUSH_WINDOW"]["ENABLED"]:
-        push_manager = PushRecordManager()
+        push_manager = PushRecordManager(profile_name)
         time_range_start = CONFIG["PUSH_WINDOW"]["TIME_RANGE"]["START"]
         time_range_end = CONFIG["PUSH_WINDOW"]["TIME_RANGE"]["END"]
 
@@ -3472,22 +4354,24 @@ def send_to_notifications(
             else:
                 print(f"推送窗口控制：今天首次推送")
 
-    report_data = prepare_report_data(stats, failed_ids, new_titles, id_to_name, mode)
-
-    feishu_url = CONFIG["FEISHU_WEBHOOK_URL"]
-    dingtalk_url = CONFIG["DINGTALK_WEBHOOK_URL"]
-    wework_url = CONFIG["WEWORK_WEBHOOK_URL"]
-    telegram_token = CONFIG["TELEGRAM_BOT_TOKEN"]
-    telegram_chat_id = CONFIG["TELEGRAM_CHAT_ID"]
-    email_from = CONFIG["EMAIL_FROM"]
-    email_password = CONFIG["EMAIL_PASSWORD"]
-    email_to = CONFIG["EMAIL_TO"]
-    email_smtp_server = CONFIG.get("EMAIL_SMTP_SERVER", "")
-    email_smtp_port = CONFIG.get("EMAIL_SMTP_PORT", "")
-    ntfy_server_url = CONFIG["NTFY_SERVER_URL"]
-    ntfy_topic = CONFIG["NTFY_TOPIC"]
-    ntfy_token = CONFIG.get("NTFY_TOKEN", "")
-    bark_url = CONFIG["BARK_URL"]
+    report_data = prepare_report_data(
+        stats, failed_ids, new_titles, id_to_name, mode, frequency_config
+    )
+
+    feishu_url = channels["FEISHU_WEBHOOK_URL"]
+    dingtalk_url = channels["DINGTALK_WEBHOOK_URL"]
+    wework_url = channels["WEWORK_WEBHOOK_URL"]
+    telegram_token = channels["TELEGRAM_BOT_TOKEN"]
+    telegram_chat_id = channels["TELEGRAM_CHAT_ID"]
+    email_from = channels["EMAIL_FROM"]
+    email_password = channels["EMAIL_PASSWORD"]
+    email_to = channels["EMAIL_TO"]
+    email_smtp_server = channels.get("EMAIL_SMTP_SERVER", "")
+    email_smtp_port = channels.get("EMAIL_SMTP_PORT", "")
+    ntfy_server_url = channels["NTFY_SERVER_URL"]
+    ntfy_topic = channels["NTFY_TOPIC"]
+    ntfy_token = channels.get("NTFY_TOKEN", "")
+    bark_url = channels["BARK_URL"]
 
     update_info_to_send = update_info if CONFIG["SHOW_VERSION_UPDATE"] else None
 
@@ -3506,7 +4390,13 @@ def send_to_notifications(
     # 发送到企业微信
     if wework_url:
         results["wework"] = send_to_wework(
-            wework_url, report_data, report_type, update_info_to_send, proxy_url, mode
+            wework_url,
+            report_data,
+            report_type,
+            update_info_to_send,
+            proxy_url,
+            mode,
+            channels.get("WEWORK_MSG_TYPE"),
         )
 
     # 发送到 Telegram
@@ -3566,7 +4456,7 @@ def send_to_notifications(
         and CONFIG["PUSH_WINDOW"]["ONCE_PER_DAY"]
         and any(results.values())
     ):
-        push_manager = PushRecordManager()
+        push_manager = PushRecordManager(profile_name)
         push_manager.record_push(report_type)
 
     return results
@@ -3632,7 +4522,7 @@ def send_to_feishu(
         }
 
         try:
-            response = requests.post(
+            response = get_http_client().post(
                 webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
             if response.status_code == 200:
@@ -3715,7 +4605,7 @@ def send_to_dingtalk(
         }
 
         try:
-            response = requests.post(
+            response = get_http_client().post(
                 webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
             if response.status_code == 200:
@@ -3794,6 +4684,7 @@ def send_to_wework(
     update_info: Optional[Dict] = None,
     proxy_url: Optional[str] = None,
     mode: str = "daily",
+    msg_type: Optional[str] = None,
 ) -> bool:
     """发送到企业微信（支持分批发送，支持 markdown 和 text 两种格式）"""
     headers = {"Content-Type": "application/json"}
@@ -3801,8 +4692,8 @@ def send_to_wework(
     if proxy_url:
         proxies = {"http": proxy_url, "https": proxy_url}
 
-    # 获取消息类型配置（markdown 或 text）
-    msg_type = CONFIG.get("WEWORK_MSG_TYPE", "markdown").lower()
+    # 获取消息类型配置（markdown 或 text），默认使用 CONFIG 中的配置
+    msg_type = (msg_type or CONFIG.get("WEWORK_MSG_TYPE", "markdown")).lower()
     is_text_mode = msg_type == "text"
 
     if is_text_mode:
@@ -3841,7 +4732,7 @@ def send_to_wework(
         )
 
         try:
-            response = requests.post(
+            response = get_http_client().post(
                 webhook_url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
             if response.status_code == 200:
@@ -3913,7 +4804,7 @@ def send_to_telegram(
         }
 
         try:
-            response = requests.post(
+            response = get_http_client().post(
                 url, headers=headers, json=payload, proxies=proxies, timeout=30
             )
             if response.status_code == 200:
@@ -3956,9 +4847,8 @@ def send_to_email(
             print(f"错误：HTML文件不存在或未提供: {html_file_path}")
             return False
 
-        print(f"使用HTML文件: {html_file_path}")
-        with open(html_file_path, "r", encoding="utf-8") as f:
-            html_content = f.read()
+        print(f"使用报告文件: {html_file_path}")
+        html_content = load_report_html(html_file_path)
 
         domain = from_email.split("@")[-1].lower()
 
@@ -4162,7 +5052,7 @@ def send_to_ntfy(
             )
 
         try:
-            response = requests.post(
+            response = get_http_client().post(
                 url,
                 headers=current_headers,
                 data=batch_content.encode("utf-8"),
@@ -4183,7 +5073,7 @@ def send_to_ntfy(
                 )
                 time.sleep(10)  # 等待10秒后重试
                 # 重试一次
-                retry_response = requests.post(
+                retry_response = get_http_client().post(
                     url,
                     headers=current_headers,
                     data=batch_content.encode("utf-8"),
@@ -4292,7 +5182,7 @@ def send_to_bark(
         }
 
         try:
-            response = requests.post(
+            response = get_http_client().post(
                 bark_url,
                 json=payload,
                 proxies=proxies,
@@ -4343,7 +5233,12 @@ def send_to_bark(
 
 # === 主分析器 ===
 class NewsAnalyzer:
-    """新闻分析器"""
+    """新闻分析器
+
+    profiles 为多个报告配置（频率词文件、报告模式、推送渠道），默认取 config.yaml 的 profiles，
+    未配置时使用全局配置。一次运行只抓取、读取当日数据一次，所有配置的频率词在同一遍扫描中
+    匹配，之后逐个配置生成报告并推送到各自的渠道。
+    """
 
     # 模式策略定义
     MODE_STRATEGIES = {
@@ -4376,16 +5271,45 @@ class NewsAnalyzer:
         },
     }
 
-    def __init__(self):
+    def __init__(self, profiles: Optional[List[Dict]] = None):
         self.request_interval = CONFIG["REQUEST_INTERVAL"]
-        self.report_mode = CONFIG["REPORT_MODE"]
+        self.profiles = profiles or CONFIG["PROFILES"] or [
+            {
+                "NAME": "",
+                "FREQUENCY_FILE": None,
+                "REPORT_MODE": CONFIG["REPORT_MODE"],
+                "CHANNELS": CONFIG,
+            }
+        ]
+        self._use_profile(self.profiles[0])
+        # 本轮运行内各配置共用的数据（当日标题、新增标题），每轮开始时清空
+        self._run_cache: Dict = {}
         self.rank_threshold = CONFIG["RANK_THRESHOLD"]
         self.is_github_actions = os.environ.get("GITHUB_ACTIONS") == "true"
         self.is_docker_container = self._detect_docker_environment()
         self.update_info = None
         self.proxy_url = None
+        self.last_snapshot_time = None
+        self.nothing_changed = False
         self._setup_proxy()
-        self.data_fetcher = DataFetcher(self.proxy_url)
+        # 爬虫与推送共享同一个连接池，连接数不小于并发线程数
+        configure_http_client(
+            pool_size=max(CONFIG["HTTP_POOL_SIZE"], CONFIG["CRAWLER_MAX_WORKERS"]),
+            proxy_url=self.proxy_url or "",
+        )
+        self.data_fetcher = DataFetcher(
+            self.proxy_url,
+            max_workers=CONFIG["CRAWLER_MAX_WORKERS"],
+            host_rate_limit=CONFIG["HOST_RATE_LIMIT"],
+        )
+        self.poller = None
+        polling_config = CONFIG["ADAPTIVE_POLLING"]
+        if polling_config["ENABLED"]:
+            self.poller = AdaptivePoller(
+                polling_config["STATE_FILE"],
+                min_interval=polling_config["MIN_INTERVAL"],
+                max_interval=polling_config["MAX_INTERVAL"],
+            )
 
         if self.is_github_actions:
             self._check_version_update()
@@ -4435,25 +5359,32 @@ class NewsAnalyzer:
         except Exception as e:
             print(f"版本检查出错: {e}")
 
+    def _use_profile(self, profile: Dict) -> None:
+        """切换到某个报告配置（报告模式、频率词与推送渠道随之切换）"""
+        self.profile = profile
+        self.report_mode = profile["REPORT_MODE"]
+
     def _get_mode_strategy(self) -> Dict:
         """获取当前模式的策略配置"""
         return self.MODE_STRATEGIES.get(self.report_mode, self.MODE_STRATEGIES["daily"])
 
-    def _has_notification_configured(self) -> bool:
-        """检查是否配置了任何通知渠道"""
+    def _has_notification_configured(self, channels: Optional[Dict] = None) -> bool:
+        """检查是否配置了任何通知渠道（默认检查当前配置的渠道）"""
+        if channels is None:
+            channels = self.profile["CHANNELS"]
         return any(
             [
-                CONFIG["FEISHU_WEBHOOK_URL"],
-                CONFIG["DINGTALK_WEBHOOK_URL"],
-                CONFIG["WEWORK_WEBHOOK_URL"],
-                (CONFIG["TELEGRAM_BOT_TOKEN"] and CONFIG["TELEGRAM_CHAT_ID"]),
+                channels["FEISHU_WEBHOOK_URL"],
+                channels["DINGTALK_WEBHOOK_URL"],
+                channels["WEWORK_WEBHOOK_URL"],
+                (channels["TELEGRAM_BOT_TOKEN"] and channels["TELEGRAM_CHAT_ID"]),
                 (
-                    CONFIG["EMAIL_FROM"]
-                    and CONFIG["EMAIL_PASSWORD"]
-                    and CONFIG["EMAIL_TO"]
+                    channels["EMAIL_FROM"]
+                    and channels["EMAIL_PASSWORD"]
+                    and channels["EMAIL_TO"]
                 ),
-                (CONFIG["NTFY_SERVER_URL"] and CONFIG["NTFY_TOPIC"]),
-                CONFIG["BARK_URL"],
+                (channels["NTFY_SERVER_URL"] and channels["NTFY_TOPIC"]),
+                channels["BARK_URL"],
             ]
         )
 
@@ -4472,10 +5403,25 @@ class NewsAnalyzer:
             )
             return has_matched_news or has_new_news
 
+    def _get_new_titles(self) -> Dict:
+        """最新批次的新增标题（本轮运行内只计算一次）"""
+        if "new_titles" not in self._run_cache:
+            current_platform_ids = [platform["id"] for platform in CONFIG["PLATFORMS"]]
+            self._run_cache["new_titles"] = detect_latest_new_titles(current_platform_ids)
+        return self._run_cache["new_titles"]
+
     def _load_analysis_data(
         self,
-    ) -> Optional[Tuple[Dict, Dict, Dict, Dict, List, List]]:
-        """统一的数据加载和预处理，使用当前监控平台列表过滤历史数据"""
+    ) -> Optional[Tuple[Dict, Dict, Dict, Dict]]:
+        """统一的数据加载和预处理（本轮运行内只读取一次，各配置共用）"""
+        if "analysis_data" not in self._run_cache:
+            self._run_cache["analysis_data"] = self._read_analysis_data()
+        return self._run_cache["analysis_data"]
+
+    def _read_analysis_data(
+        self,
+    ) -> Optional[Tuple[Dict, Dict, Dict, Dict]]:
+        """读取当日数据，使用当前监控平台列表过滤历史数据"""
         try:
             # 获取当前配置的监控平台ID列表
             current_platform_ids = []
@@ -4495,39 +5441,27 @@ class NewsAnalyzer:
             total_titles = sum(len(titles) for titles in all_results.values())
             print(f"读取到 {total_titles} 个标题（已按当前监控平台过滤）")
 
-            new_titles = detect_latest_new_titles(current_platform_ids)
-            word_groups, filter_words = load_frequency_words()
-
-            return (
-                all_results,
-                id_to_name,
-                title_info,
-                new_titles,
-                word_groups,
-                filter_words,
-            )
+            return all_results, id_to_name, title_info, self._get_new_titles()
         except Exception as e:
             print(f"数据加载失败: {e}")
             return None
 
     def _prepare_current_title_info(self, results: Dict, time_info: str) -> Dict:
         """从当前抓取结果构建标题信息"""
+        time_value = encode_time(time_info)
         title_info = {}
         for source_id, titles_data in results.items():
-            title_info[source_id] = {}
-            for title, title_data in titles_data.items():
-                ranks = title_data.get("ranks", [])
-                url = title_data.get("url", "")
-                mobile_url = title_data.get("mobileUrl", "")
-
-                title_info[source_id][title] = {
-                    "first_time": time_info,
-                    "last_time": time_info,
-                    "count": 1,
-                    "ranks": ranks,
-                    "url": url,
-                    "mobileUrl": mobile_url,
-                }
+            title_info[source_id] = {
+                title: TitleRecord(
+                    title_data.get("ranks", []),
+                    title_data.get("url", ""),
+                    title_data.get("mobileUrl", ""),
+                    time_value,
+                    time_value,
+                    1,
+                )
+                for title, title_data in titles_data.items()
+            }
         return title_info
 
     def _run_analysis_pipeline(
@@ -4536,37 +5470,58 @@ class NewsAnalyzer:
         mode: str,
         title_info: Dict,
         new_titles: Dict,
-        word_groups: List[Dict],
-        filter_words: List[str],
+        frequency_config: FrequencyConfig,
         id_to_name: Dict,
         failed_ids: Optional[List] = None,
         is_daily_summary: bool = False,
+        aggregate: Optional[DailyAggregate] = None,
     ) -> Tuple[List[Dict], str]:
-        """统一的分析流水线：数据处理 → 统计计算 → HTML生成"""
+        """统一的分析流水线：数据处理 → 统计计算 → HTML生成
+
+        数据来自当日聚合时传入 aggregate，统计直接使用其增量维护的词组统计。
+        """
 
         # 统计计算
         stats, total_titles = count_word_frequency(
             data_source,
-            word_groups,
-            filter_words,
+            frequency_config.word_groups,
+            frequency_config.filter_words,
             id_to_name,
             title_info,
             self.rank_threshold,
             new_titles,
             mode=mode,
+            aggregate=aggregate,
         )
 
-        # HTML生成
-        html_file = generate_html_report(
-            stats,
-            total_titles,
-            failed_ids=failed_ids,
-            new_titles=new_titles,
-            id_to_name=id_to_name,
-            mode=mode,
-            is_daily_summary=is_daily_summary,
-            update_info=self.update_info if CONFIG["SHOW_VERSION_UPDATE"] else None,
-        )
+        update_info = self.update_info if CONFIG["SHOW_VERSION_UPDATE"] else None
+        if is_daily_summary or CONFIG["SAVE_CRAWL_HTML"]:
+            # HTML生成
+            html_file = generate_html_report(
+                stats,
+                total_titles,
+                failed_ids=failed_ids,
+                new_titles=new_titles,
+                id_to_name=id_to_name,
+                mode=mode,
+                is_daily_summary=is_daily_summary,
+                update_info=update_info,
+                frequency_config=frequency_config,
+                profile_name=self.profile["NAME"],
+            )
+        else:
+            # 单次爬取的报告只保存报告数据，需要时再渲染 HTML
+            html_file = save_crawl_report(
+                stats,
+                total_titles,
+                failed_ids=failed_ids,
+                new_titles=new_titles,
+                id_to_name=id_to_name,
+                mode=mode,
+                update_info=update_info,
+                frequency_config=frequency_config,
+                profile_name=self.profile["NAME"],
+            )
 
         return stats, html_file
 
@@ -4579,6 +5534,7 @@ class NewsAnalyzer:
         new_titles: Optional[Dict] = None,
         id_to_name: Optional[Dict] = None,
         html_file_path: Optional[str] = None,
+        frequency_config: Optional[FrequencyConfig] = None,
     ) -> bool:
         """统一的通知发送逻辑，包含所有判断条件"""
         has_notification = self._has_notification_configured()
@@ -4598,6 +5554,9 @@ class NewsAnalyzer:
                 self.proxy_url,
                 mode=mode,
                 html_file_path=html_file_path,
+                frequency_config=frequency_config,
+                channels=self.profile["CHANNELS"],
+                profile_name=self.profile["NAME"],
             )
             return True
         elif CONFIG["ENABLE_NOTIFICATION"] and not has_notification:
@@ -4621,7 +5580,9 @@ class NewsAnalyzer:
 
         return False
 
-    def _generate_summary_report(self, mode_strategy: Dict) -> Optional[str]:
+    def _generate_summary_report(
+        self, mode_strategy: Dict, frequency_config: FrequencyConfig
+    ) -> Optional[str]:
         """生成汇总报告（带通知）"""
         summary_type = (
             "当前榜单汇总" if mode_strategy["summary_mode"] == "current" else "当日汇总"
@@ -4633,9 +5594,7 @@ class NewsAnalyzer:
         if not analysis_data:
             return None
 
-        all_results, id_to_name, title_info, new_titles, word_groups, filter_words = (
-            analysis_data
-        )
+        all_results, id_to_name, title_info, new_titles = analysis_data
 
         # 运行分析流水线
         stats, html_file = self._run_analysis_pipeline(
@@ -4643,10 +5602,10 @@ class NewsAnalyzer:
             mode_strategy["summary_mode"],
             title_info,
             new_titles,
-            word_groups,
-            filter_words,
+            frequency_config,
             id_to_name,
             is_daily_summary=True,
+            aggregate=get_daily_aggregate(),
         )
 
         print(f"{summary_type}报告已生成: {html_file}")
@@ -4660,11 +5619,14 @@ class NewsAnalyzer:
             new_titles=new_titles,
             id_to_name=id_to_name,
             html_file_path=html_file,
+            frequency_config=frequency_config,
         )
 
         return html_file
 
-    def _generate_summary_html(self, mode: str = "daily") -> Optional[str]:
+    def _generate_summary_html(
+        self, frequency_config: FrequencyConfig, mode: str = "daily"
+    ) -> Optional[str]:
         """生成汇总HTML"""
         summary_type = "当前榜单汇总" if mode == "current" else "当日汇总"
         print(f"生成{summary_type}HTML...")
@@ -4674,9 +5636,7 @@ class NewsAnalyzer:
         if not analysis_data:
             return None
 
-        all_results, id_to_name, title_info, new_titles, word_groups, filter_words = (
-            analysis_data
-        )
+        all_results, id_to_name, title_info, new_titles = analysis_data
 
         # 运行分析流水线
         _, html_file = self._run_analysis_pipeline(
@@ -4684,10 +5644,10 @@ class NewsAnalyzer:
             mode,
             title_info,
             new_titles,
-            word_groups,
-            filter_words,
+            frequency_config,
             id_to_name,
             is_daily_summary=True,
+            aggregate=get_daily_aggregate(),
         )
 
         print(f"{summary_type}HTML已生成: {html_file}")
@@ -4702,7 +5662,9 @@ class NewsAnalyzer:
             print("爬虫功能已禁用（ENABLE_CRAWLER=False），程序退出")
             return
 
-        has_notification = self._has_notification_configured()
+        has_notification = any(
+            self._has_notification_configured(profile["CHANNELS"]) for profile in self.profiles
+        )
         if not CONFIG["ENABLE_NOTIFICATION"]:
             print("通知功能已禁用（ENABLE_NOTIFICATION=False），将只进行数据抓取")
         elif not has_notification:
@@ -4710,9 +5672,13 @@ class NewsAnalyzer:
         else:
             print("通知功能已启用，将发送通知")
 
-        mode_strategy = self._get_mode_strategy()
-        print(f"报告模式: {self.report_mode}")
-        print(f"运行模式: {mode_strategy['description']}")
+        for profile in self.profiles:
+            mode_strategy = self.MODE_STRATEGIES.get(
+                profile["REPORT_MODE"], self.MODE_STRATEGIES["daily"]
+            )
+            prefix = f"[{profile['NAME']}] " if profile["NAME"] else ""
+            print(f"{prefix}报告模式: {profile['REPORT_MODE']}")
+            print(f"{prefix}运行模式: {mode_strategy['description']}")
 
     def _crawl_data(self) -> Tuple[Dict, Dict, List]:
         """执行数据爬取"""
@@ -4726,28 +5692,155 @@ class NewsAnalyzer:
         print(
             f"配置的监控平台: {[p.get('name', p['id']) for p in CONFIG['PLATFORMS']]}"
         )
-        print(f"开始爬取数据，请求间隔 {self.request_interval} 毫秒")
+        if self.data_fetcher.max_workers > 1:
+            print(
+                f"开始并发爬取数据，线程数 {self.data_fetcher.max_workers}，"
+                f"单主机限速 {CONFIG['HOST_RATE_LIMIT']} 次/秒"
+            )
+        else:
+            print(f"开始爬取数据，请求间隔 {self.request_interval} 毫秒")
         ensure_directory_exists("output")
 
-        results, id_to_name, failed_ids = self.data_fetcher.crawl_websites(
-            ids, self.request_interval
-        )
+        if self.poller:
+            results, id_to_name, failed_ids = self._crawl_adaptively(ids)
+        else:
+            results, id_to_name, failed_ids = self.data_fetcher.crawl_websites(
+                ids, self.request_interval
+            )
 
-        title_file = save_titles_to_file(results, id_to_name, failed_ids)
+        refs = {}
+        if CONFIG["SKIP_UNCHANGED"] and results:
+            # 抓取时已计算哈希；自适应轮询沿用的平台在这里补算
+            content_hashes = {
+                platform_id: self.data_fetcher.content_hashes.get(platform_id)
+                or compute_platform_hash(titles)
+                for platform_id, titles in results.items()
+            }
+            refs = find_unchanged_platforms(content_hashes)
+            if refs:
+                print(f"内容未变化的平台 {len(refs)}/{len(results)} 个，快照中只写入引用")
+        self.nothing_changed = bool(results) and len(refs) == len(results)
+
+        time_info = format_time_filename()
+        title_file = save_titles_to_file(
+            results, id_to_name, failed_ids, time_info, refs
+        )
+        self.last_snapshot_time = time_info
         print(f"标题已保存到: {title_file}")
 
         return results, id_to_name, failed_ids
 
+    def _crawl_adaptively(self, ids: List) -> Tuple[Dict, Dict, List]:
+        """自适应轮询：只抓取到期的平台，未到期的平台沿用上一次的抓取结果"""
+        now = get_beijing_time()
+        due_ids = []
+        skipped_ids = []
+        for id_info in ids:
+            platform_id = id_info[0] if isinstance(id_info, tuple) else id_info
+            if self.poller.is_due(platform_id, now):
+                due_ids.append(id_info)
+            else:
+                skipped_ids.append(id_info)
+
+        if due_ids:
+            crawled_results, id_to_name, failed_ids = self.data_fetcher.crawl_websites(
+                due_ids, self.request_interval
+            )
+        else:
+            crawled_results, id_to_name, failed_ids = {}, {}, []
+
+        for platform_id, titles in crawled_results.items():
+            self.poller.record(platform_id, titles, now)
+
+        # 按配置顺序合并，保持快照中的平台顺序与全量抓取一致
+        results = {}
+        carried_count = 0
+        for id_info in ids:
+            if isinstance(id_info, tuple):
+                platform_id, platform_name = id_info
+            else:
+                platform_id = platform_name = id_info
+
+            if platform_id in crawled_results:
+                results[platform_id] = crawled_results[platform_id]
+            elif id_info in skipped_ids:
+                last_results = self.poller.get_last_results(platform_id)
+                if last_results:
+                    results[platform_id] = last_results
+                    id_to_name[platform_id] = platform_name
+                    carried_count += 1
+
+        self.poller.save()
+        print(
+            f"自适应轮询：本轮抓取 {len(due_ids)} 个平台，沿用 {carried_count} 个平台的上次结果"
+        )
+        if skipped_ids:
+            skipped_desc = [
+                f"{pid}({self.poller.get_interval(pid)}分钟)"
+                for pid in (i[0] if isinstance(i, tuple) else i for i in skipped_ids)
+            ]
+            print(f"  本轮跳过: {', '.join(skipped_desc)}")
+
+        return results, id_to_name, failed_ids
+
+    def _is_scheduled_push_due(self) -> bool:
+        """推送窗口内且今天还未推送（每天只推一次）时，当天的定时推送到期"""
+        push_window = CONFIG["PUSH_WINDOW"]
+        if not (
+            CONFIG["ENABLE_NOTIFICATION"]
+            and self._has_notification_configured()
+            and push_window["ENABLED"]
+            and push_window["ONCE_PER_DAY"]
+        ):
+            return False
+        push_manager = PushRecordManager(self.profile["NAME"])
+        return push_manager.is_in_time_range(
+            push_window["TIME_RANGE"]["START"], push_window["TIME_RANGE"]["END"]
+        ) and not push_manager.has_pushed_today()
+
+    def _execute_due_steps(
+        self, mode_strategy: Dict, results: Dict, id_to_name: Dict, failed_ids: List
+    ) -> Optional[str]:
+        """
+        内容未变化时只执行到期的步骤
+
+        当天的定时推送到期时照常执行完整流程（不因内容未变化而错过推送）；
+        汇总 HTML 尚不存在时补生成；其余情况报告与上一轮相同，跳过分析与推送。
+        """
+        if self._is_scheduled_push_due():
+            print("推送窗口内今天尚未推送，照常生成报告并推送")
+            return self._execute_mode_strategy(
+                mode_strategy, results, id_to_name, failed_ids
+            )
+
+        summary_mode = mode_strategy["summary_mode"]
+        summary_path = (
+            Path("output")
+            / format_date_folder()
+            / "html"
+            / get_summary_html_filename(summary_mode, self.profile["NAME"])
+        )
+        if mode_strategy["should_generate_summary"] and not summary_path.exists():
+            return self._generate_summary_html(
+                load_frequency_config(self.profile["FREQUENCY_FILE"]), summary_mode
+            )
+
+        print("报告与上一轮相同，跳过分析与推送")
+        return None
+
     def _execute_mode_strategy(
         self, mode_strategy: Dict, results: Dict, id_to_name: Dict, failed_ids: List
     ) -> Optional[str]:
         """执行模式特定逻辑"""
-        # 获取当前监控平台ID列表
-        current_platform_ids = [platform["id"] for platform in CONFIG["PLATFORMS"]]
-
-        new_titles = detect_latest_new_titles(current_platform_ids)
-        time_info = Path(save_titles_to_file(results, id_to_name, failed_ids)).stem
-        word_groups, filter_words = load_frequency_words()
+        new_titles = self._get_new_titles()
+        # 直接使用本次爬取已保存的快照，避免重复写入导致快照被改写
+        time_info = self.last_snapshot_time
+        if not time_info:
+            time_info = format_time_filename()
+            save_titles_to_file(results, id_to_name, failed_ids, time_info)
+            self.last_snapshot_time = time_info
+        # 本次运行统一使用同一份编译好的频率词配置
+        frequency_config = load_frequency_config(self.profile["FREQUENCY_FILE"])
 
         # current模式下，实时推送需要使用完整的历史数据来保证统计信息的完整性
         if self.report_mode == "current":
@@ -4759,8 +5852,6 @@ class NewsAnalyzer:
                     historical_id_to_name,
                     historical_title_info,
                     historical_new_titles,
-                    _,
-                    _,
                 ) = analysis_data
 
                 print(
@@ -4772,15 +5863,15 @@ class NewsAnalyzer:
                     self.report_mode,
                     historical_title_info,
                     historical_new_titles,
-                    word_groups,
-                    filter_words,
+                    frequency_config,
                     historical_id_to_name,
                     failed_ids=failed_ids,
+                    aggregate=get_daily_aggregate(),
                 )
 
                 combined_id_to_name = {**historical_id_to_name, **id_to_name}
 
-                print(f"HTML报告已生成: {html_file}")
+                print(f"报告已生成: {html_file}")
 
                 # 发送实时通知（使用完整历史数据的统计结果）
                 summary_html = None
@@ -4793,6 +5884,7 @@ class NewsAnalyzer:
                         new_titles=historical_new_titles,
                         id_to_name=combined_id_to_name,
                         html_file_path=html_file,
+                        frequency_config=frequency_config,
                     )
             else:
                 print("❌ 严重错误：无法读取刚保存的数据文件")
@@ -4804,12 +5896,11 @@ class NewsAnalyzer:
                 self.report_mode,
                 title_info,
                 new_titles,
-                word_groups,
-                filter_words,
+                frequency_config,
                 id_to_name,
                 failed_ids=failed_ids,
             )
-            print(f"HTML报告已生成: {html_file}")
+            print(f"报告已生成: {html_file}")
 
             # 发送实时通知（如果需要）
             summary_html = None
@@ -4822,6 +5913,7 @@ class NewsAnalyzer:
                     new_titles=new_titles,
                     id_to_name=id_to_name,
                     html_file_path=html_file,
+                    frequency_config=frequency_config,
                 )
 
         # 生成汇总报告（如果需要）
@@ -4830,50 +5922,240 @@ class NewsAnalyzer:
             if mode_strategy["should_send_realtime"]:
                 # 如果已经发送了实时通知，汇总只生成HTML不发送通知
                 summary_html = self._generate_summary_html(
-                    mode_strategy["summary_mode"]
+                    frequency_config, mode_strategy["summary_mode"]
                 )
             else:
                 # daily模式：直接生成汇总报告并发送通知
-                summary_html = self._generate_summary_report(mode_strategy)
+                summary_html = self._generate_summary_report(
+                    mode_strategy, frequency_config
+                )
 
-        # 打开浏览器（仅在非容器环境）
-        if self._should_open_browser() and html_file:
+        # 打开浏览器（仅在非容器环境，多配置时只打开第一个配置的报告）
+        if self._should_open_browser() and html_file and self.profile is self.profiles[0]:
             if summary_html:
                 summary_url = "file://" + str(Path(summary_html).resolve())
                 print(f"正在打开汇总报告: {summary_url}")
                 webbrowser.open(summary_url)
             else:
-                file_url = "file://" + str(Path(html_file).resolve())
+                file_url = "file://" + str(Path(ensure_report_html(html_file)).resolve())
                 print(f"正在打开HTML报告: {file_url}")
                 webbrowser.open(file_url)
         elif self.is_docker_container and html_file:
             if summary_html:
                 print(f"汇总报告已生成（Docker环境）: {summary_html}")
             else:
-                print(f"HTML报告已生成（Docker环境）: {html_file}")
+                print(f"报告已生成（Docker环境）: {html_file}")
 
         return summary_html
 
+    def _match_profiles(self, results: Dict) -> None:
+        """多配置时用合并的匹配器一次扫描本次抓取与当日的全部标题，各配置的统计直接使用匹配缓存"""
+        if len(self.profiles) < 2:
+            return
+        matchers = [
+            load_frequency_config(profile["FREQUENCY_FILE"]).matcher
+            for profile in self.profiles
+        ]
+        combined = get_combined_matcher(matchers)
+        # 先匹配本次抓取的标题：读取当日聚合时合并新快照会用到各配置的匹配结果
+        scanned = combined.prime(
+            title for titles in results.values() for title in titles
+        )
+        analysis_data = self._load_analysis_data()
+        if analysis_data:
+            title_info = analysis_data[2]
+            scanned += combined.prime(
+                title for titles in title_info.values() for title in titles
+            )
+        print(f"{len(self.profiles)} 个报告配置共用一次匹配，扫描 {scanned} 个标题")
+
     def run(self) -> None:
-        """执行分析流程"""
+        """执行分析流程：抓取一次，逐个配置生成报告与推送"""
         try:
             self._initialize_and_check_config()
-
-            mode_strategy = self._get_mode_strategy()
+            self._run_cache = {}
 
             results, id_to_name, failed_ids = self._crawl_data()
 
-            self._execute_mode_strategy(mode_strategy, results, id_to_name, failed_ids)
+            if self.nothing_changed:
+                print("所有平台内容与上次快照一致，跳过本轮抓取结果的分析")
+            else:
+                self._match_profiles(results)
+
+            errors = []
+            for profile in self.profiles:
+                self._use_profile(profile)
+                if len(self.profiles) > 1:
+                    print(f"===== 报告配置: {profile['NAME']} =====")
+                try:
+                    if self.nothing_changed:
+                        self._execute_due_steps(
+                            self._get_mode_strategy(), results, id_to_name, failed_ids
+                        )
+                    else:
+                        self._execute_mode_strategy(
+                            self._get_mode_strategy(), results, id_to_name, failed_ids
+                        )
+                except Exception as e:
+                    if len(self.profiles) == 1:
+                        raise
+                    # 单个配置失败不影响其他配置
+                    print(f"❌ 报告配置 {profile['NAME']} 执行出错: {e}")
+                    errors.append(e)
+            self._use_profile(self.profiles[0])
+
+            archive_finished_days(CONFIG["STORAGE"]["ARCHIVE_AFTER_DAYS"])
+            if errors:
+                raise errors[0]
 
         except Exception as e:
             print(f"分析流程执行出错: {e}")
             raise
 
 
+class DaemonRunner:
+    """常驻模式：进程内按 cron 表达式调度，配置、编译匹配器、连接池与当日聚合跨轮次复用"""
+
+    def __init__(self, schedule_expression: str, immediate_run: bool = False):
+        self.schedule = CronSchedule(schedule_expression)
+        self.immediate_run = immediate_run
+        self.config_path = os.environ.get("CONFIG_PATH", "config/config.yaml")
+        self.config_mtime = self._get_config_mtime()
+        self.reload_requested = False
+        self.stop_event = threading.Event()
+        self.analyzer = NewsAnalyzer()
+
+    def _get_config_mtime(self) -> Optional[int]:
+        try:
+            return Path(self.config_path).stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _handle_stop(self, signum, frame) -> None:
+        print(f"收到退出信号 {signum}，当前轮次结束后退出")
+        self.stop_event.set()
+
+    def _handle_reload(self, signum, frame) -> None:
+        print("收到 SIGHUP，下一轮执行前重新加载配置")
+        self.reload_requested = True
+
+    def _install_signal_handlers(self) -> None:
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        if hasattr(signal, "SIGHUP"):
+            signal.signal(signal.SIGHUP, self._handle_reload)
+
+    def _reload_if_needed(self) -> None:
+        """配置文件变化（或收到 SIGHUP）时重新加载配置并重建分析器"""
+        config_mtime = self._get_config_mtime()
+        if not self.reload_requested and config_mtime == self.config_mtime:
+            return
+
+        self.reload_requested = False
+        self.config_mtime = config_mtime
+        try:
+            new_config = load_config()
+        except Exception as e:
+            print(f"配置重新加载失败，继续使用当前配置: {e}")
+            return
+
+        global _storage
+        # 原地更新，保证其他位置持有的 CONFIG 引用同样生效
+        CONFIG.clear()
+        CONFIG.update(new_config)
+        _storage = None
+        _daily_aggregates.clear()
+        self.analyzer = NewsAnalyzer()
+        print(f"配置已重新加载，监控平台数量: {len(CONFIG['PLATFORMS'])}")
+
+    def _run_once(self) -> None:
+        self._reload_if_needed()
+        try:
+            self.analyzer.run()
+        except Exception as e:
+            # 单轮失败不影响后续调度
+            print(f"❌ 本轮执行失败: {e}")
+
+    def _wait_until(self, run_at: datetime) -> bool:
+        """等待到指定时间，期间收到退出信号则返回 False"""
+        while not self.stop_event.is_set():
+            remaining = (run_at - get_beijing_time()).total_seconds()
+            if remaining <= 0:
+                return True
+            self.stop_event.wait(min(remaining, 60))
+        return False
+
+    def run(self) -> None:
+        self._install_signal_handlers()
+        upcoming = self.schedule.upcoming(get_beijing_time())
+        print(f"常驻模式启动，调度表达式: {self.schedule.expression}")
+        print(f"接下来的执行时间: {[t.strftime('%m-%d %H:%M') for t in upcoming]}")
+
+        if self.immediate_run:
+            print("▶️ 立即执行一次")
+            self._run_once()
+
+        while not self.stop_event.is_set():
+            next_run = self.schedule.next_run(get_beijing_time())
+            print(f"下次执行时间: {next_run.strftime('%Y-%m-%d %H:%M')}")
+            if not self._wait_until(next_run):
+                break
+            self._run_once()
+
+        get_http_client().close()
+        print("常驻模式已退出")
+
+
+def parse_args():
+    """解析命令行参数"""
+    parser = argparse.ArgumentParser(description=f"TrendRadar v{VERSION}")
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="常驻模式：进程内按 cron 表达式定时执行，配置变化时自动重新加载",
+    )
+    parser.add_argument(
+        "--schedule",
+        default=os.environ.get("CRON_SCHEDULE", "").strip() or "*/30 * * * *",
+        help="常驻模式的 cron 表达式（默认读取 CRON_SCHEDULE 环境变量）",
+    )
+    parser.add_argument(
+        "--immediate",
+        action="store_true",
+        default=os.environ.get("IMMEDIATE_RUN", "").strip().lower() in ("true", "1"),
+        help="常驻模式启动时立即执行一次（默认读取 IMMEDIATE_RUN 环境变量）",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="启动本地报告查看器，按请求从报告数据渲染 HTML（包括已归档的日期）",
+    )
+    parser.add_argument(
+        "--port", type=int, default=8080, help="报告查看器端口（默认 8080）"
+    )
+    parser.add_argument(
+        "--archive",
+        action="store_true",
+        help="把已结束的日期归档为 output/<日期>.tar.gz 后退出（保留天数取 storage.archive_after_days，未配置时只保留今天）",
+    )
+    return parser.parse_args()
+
+
 def main():
+    args = parse_args()
     try:
-        analyzer = NewsAnalyzer()
-        analyzer.run()
+        if args.serve:
+            serve_reports("output", render_report_data, port=args.port)
+        elif args.archive:
+            archived = archive_finished_days(
+                max(1, CONFIG["STORAGE"]["ARCHIVE_AFTER_DAYS"])
+            )
+            print(f"归档完成，共 {len(archived)} 天")
+        elif args.daemon:
+            DaemonRunner(args.schedule, args.immediate).run()
+        else:
+            analyzer = NewsAnalyzer()
+            analyzer.run()
     except FileNotFoundError as e:
         print(f"❌ 配置文件错误: {e}")
         print("\n请确保以下文件存在:")
@@ -35,6 +35,14 @@ def _get_tools(project_root: Optional[str] = None):
     return _tools_instances
 
 
+def _close_tools() -> None:
+    """关闭各工具的解析服务（多日加载的进程池等）"""
+    for tools in _tools_instances.values():
+        data_service = getattr(tools, "data_service", None)
+        if data_service is not None:
+            data_service.parser.close()
+
+
 # ==================== 数据查询工具 ====================
 
 @mcp.tool
@@ -640,18 +648,21 @@ def run_server(
     print()
 
     # 根据传输模式运行服务器
-    if transport == 'stdio':
-        mcp.run(transport='stdio')
-    elif transport == 'http':
-        # HTTP 模式（生产推荐）
-        mcp.run(
-            transport='http',
-            host=host,
-            port=port,
-            path='/mcp'  # HTTP 端点路径
-        )
-    else:
-        raise ValueError(f"不支持的传输模式: {transport}")
+    try:
+        if transport == 'stdio':
+            mcp.run(transport='stdio')
+        elif transport == 'http':
+            # HTTP 模式（生产推荐）
+            mcp.run(
+                transport='http',
+                host=host,
+                port=port,
+                path='/mcp'  # HTTP 端点路径
+            )
+        else:
+            raise ValueError(f"不支持的传输模式: {transport}")
+    finally:
+        _close_tools()
 
 
 if __name__ == '__main__':
@@ -4,16 +4,34 @@
 提供统一的数据查询接口,封装数据访问逻辑。
 """
 
-import re
 from collections import Counter
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
 
 from .cache_service import get_cache
 from .parser_service import ParserService
 from ..utils.errors import DataNotFoundError
 
 
+class NewsRecord(NamedTuple):
+    """单条新闻记录（某天某平台的一个标题）"""
+
+    date: str  # YYYY-MM-DD
+    platform_id: str
+    platform_name: str
+    title: str
+    ranks: List[int]  # 当天各次快照中的排名
+    url: str
+    mobile_url: str
+
+
+def title_contains(keyword: str) -> Callable[[str, str], bool]:
+    """生成 iter_records 使用的标题关键词过滤条件（不区分大小写）"""
+    keyword_lower = keyword.lower()
+    return lambda platform_id, title: keyword_lower in title.lower()
+
+
 class DataService:
     """数据访问服务类"""
 
@@ -27,6 +45,49 @@ class DataService:
         self.parser = ParserService(project_root)
         self.cache = get_cache()
 
+    def iter_records(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        platforms: Optional[List[str]] = None,
+        predicate: Optional[Callable[[str, str], bool]] = None
+    ) -> Iterator[NewsRecord]:
+        """
+        按日期顺序流式遍历日期范围内的新闻记录
+
+        每次只在内存中保留一天里满足条件的标题，平台过滤下推到存储层，
+        predicate 在合并排名之前执行，长时间范围的扫描内存占用保持不变。
+
+        Args:
+            start_date: 开始日期
+            end_date: 结束日期（包含）
+            platforms: 平台ID列表，None表示所有平台
+            predicate: 过滤函数 predicate(platform_id, title) -> bool，
+                       如 title_contains("人工智能")
+
+        Yields:
+            NewsRecord，同一天内同一平台的同一标题只产出一次
+        """
+        current_date = start_date
+        while current_date <= end_date:
+            titles, id_to_name = self.parser.read_titles_for_date_filtered(
+                current_date, platforms, predicate
+            )
+            date_str = current_date.strftime("%Y-%m-%d")
+            for platform_id, platform_titles in titles.items():
+                platform_name = id_to_name.get(platform_id, platform_id)
+                for title, info in platform_titles.items():
+                    yield NewsRecord(
+                        date_str,
+                        platform_id,
+                        platform_name,
+                        title,
+                        info["ranks"],
+                        info.get("url", ""),
+                        info.get("mobileUrl", ""),
+                    )
+            current_date += timedelta(days=1)
+
     def get_latest_news(
         self,
         platforms: Optional[List[str]] = None,
@@ -214,6 +275,9 @@ class DataService:
         results = []
         platform_distribution = Counter()
 
+        # 并行预加载整个日期范围，下面逐日读取时直接命中缓存
+        self.parser.load_date_range(start_date, end_date, platforms)
+
         # 遍历日期范围
         current_date = start_date
         while current_date <= end_date:
@@ -497,7 +561,7 @@ class DataService:
 
     def get_available_date_range(self) -> Tuple[Optional[datetime], Optional[datetime]]:
         """
-        扫描 output 目录，返回实际可用的日期范围
+        从目录索引读取实际可用的日期范围
 
         Returns:
             (最早日期, 最新日期) 元组，如果没有数据则返回 (None, None)
@@ -507,33 +571,14 @@ class DataService:
             >>> earliest, latest = service.get_available_date_range()
             >>> print(f"可用日期范围：{earliest} 至 {latest}")
         """
-        output_dir = self.parser.project_root / "output"
-
-        if not output_dir.exists():
-            return (None, None)
-
-        available_dates = []
-
-        # 遍历日期文件夹
-        for date_folder in output_dir.iterdir():
-            if date_folder.is_dir() and not date_folder.name.startswith('.'):
-                # 解析日期（格式: YYYY年MM月DD日）
-                try:
-                    date_match = re.match(r'(\d{4})年(\d{2})月(\d{2})日', date_folder.name)
-                    if date_match:
-                        folder_date = datetime(
-                            int(date_match.group(1)),
-                            int(date_match.group(2)),
-                            int(date_match.group(3))
-                        )
-                        available_dates.append(folder_date)
-                except Exception:
-                    pass
-
-        if not available_dates:
+        # 目录索引只收录 YYYY年MM月DD日 格式的日期
+        earliest, latest = self.parser.storage.get_catalog().refresh().date_range()
+        if earliest is None:
             return (None, None)
-
-        return (min(available_dates), max(available_dates))
+        return (
+            datetime.strptime(earliest, "%Y年%m月%d日"),
+            datetime.strptime(latest, "%Y年%m月%d日"),
+        )
 
     def get_system_status(self) -> Dict:
         """
@@ -542,42 +587,10 @@ class DataService:
         Returns:
             系统状态字典
         """
-        # 获取数据统计
-        output_dir = self.parser.project_root / "output"
-
-        total_storage = 0
-        oldest_record = None
-        latest_record = None
-        total_news = 0
-
-        if output_dir.exists():
-            # 遍历日期文件夹
-            for date_folder in output_dir.iterdir():
-                if date_folder.is_dir():
-                    # 解析日期
-                    try:
-                        date_str = date_folder.name
-                        # 格式: YYYY年MM月DD日
-                        date_match = re.match(r'(\d{4})年(\d{2})月(\d{2})日', date_str)
-                        if date_match:
-                            folder_date = datetime(
-                                int(date_match.group(1)),
-                                int(date_match.group(2)),
-                                int(date_match.group(3))
-                            )
-
-                            if oldest_record is None or folder_date < oldest_record:
-                                oldest_record = folder_date
-                            if latest_record is None or folder_date > latest_record:
-                                latest_record = folder_date
-
-                    except:
-                        pass
-
-                    # 计算存储大小
-                    for item in date_folder.rglob("*"):
-                        if item.is_file():
-                            total_storage += item.stat().st_size
+        # 数据统计直接读取目录索引（日期目录与归档的占用、快照数）
+        catalog = self.parser.storage.get_catalog().refresh()
+        total_storage = catalog.total_size
+        oldest_record, latest_record = self.get_available_date_range()
 
         # 读取版本信息
         version_file = self.parser.project_root / "version"
@@ -596,6 +609,8 @@ class DataService:
             },
             "data": {
                 "total_storage": f"{total_storage / 1024 / 1024:.2f} MB",
+                "total_days": catalog.date_count,
+                "total_snapshots": catalog.total_snapshots,
                 "oldest_record": oldest_record.strftime("%Y-%m-%d") if oldest_record else None,
                 "latest_record": latest_record.strftime("%Y-%m-%d") if latest_record else None,
             },
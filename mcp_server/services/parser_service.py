@@ -4,17 +4,87 @@
 提供txt格式新闻数据和YAML配置文件的解析功能。
 """
 
-import re
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from datetime import datetime
+from typing import Callable, Dict, List, Tuple, Optional
+from datetime import datetime, timedelta
 
 import yaml
 
+from trendradar.records import TitleRecord, intern
+from trendradar.snapshot_parser import clean_title
+from trendradar.storage import TxtSnapshotStorage, get_storage_from_config
+
 from ..utils.errors import FileParseError, DataNotFoundError
 from .cache_service import get_cache
 
 
+# 多日加载的最大进程数
+MAX_RANGE_WORKERS = 8
+# 待加载的快照少于该数量时直接在当前进程读取，避免进程间传输的开销
+PARALLEL_MIN_SNAPSHOTS = 48
+
+# 工作进程内的快照存储（由进程池初始化函数创建）
+_worker_storage = None
+
+
+def merge_snapshot_titles(
+    all_titles: Dict, id_to_name: Dict, titles_by_id: Dict, snapshot_id_to_name: Dict
+) -> None:
+    """
+    把一个快照（或按时间顺序合并好的一段快照）合并进当日结果，同一标题的排名依次追加
+
+    titles_by_id 中的值可以是快照解析出的字典或 TitleRecord，合并结果统一为新建的 TitleRecord
+    （平台ID、标题和链接驻留，多天之间共享同一个字符串），不与输入共享可变数据。
+    """
+    id_to_name.update(snapshot_id_to_name)
+
+    for platform_id, titles in titles_by_id.items():
+        platform_titles = all_titles.get(platform_id)
+        if platform_titles is None:
+            platform_titles = all_titles[intern(platform_id)] = {}
+
+        for title, info in titles.items():
+            record = platform_titles.get(title)
+            if record is None:
+                platform_titles[intern(title)] = TitleRecord(
+                    info["ranks"],
+                    intern(info.get("url", "")),
+                    intern(info.get("mobileUrl", "")),
+                )
+            else:
+                # 合并排名
+                record.add_ranks(info["ranks"])
+
+
+def _init_range_worker(project_root: str) -> None:
+    global _worker_storage
+    _worker_storage = get_storage_from_config(project_root=project_root)
+
+
+def _load_snapshot_chunk(
+    date_folder: str, entries: List, platform_ids: Optional[List[str]]
+) -> Tuple[Dict, Dict, Dict]:
+    """工作进程：按时间顺序读取同一天的一段快照并合并，返回 (all_titles, id_to_name, all_timestamps)"""
+    all_titles = {}
+    id_to_name = {}
+    all_timestamps = {}
+    for entry in entries:
+        try:
+            titles_by_id, snapshot_id_to_name = _worker_storage.load_snapshot(
+                date_folder, entry.time_info, platform_ids
+            )
+        except Exception as e:
+            print(f"Warning: 读取快照 {date_folder}/{entry.time_info} 失败: {e}")
+            continue
+        merge_snapshot_titles(all_titles, id_to_name, titles_by_id, snapshot_id_to_name)
+        all_timestamps[f"{entry.time_info}.txt"] = entry.timestamp
+    _worker_storage.flush_cache()
+    return all_titles, id_to_name, all_timestamps
+
+
 class ParserService:
     """文件解析服务类"""
 
@@ -35,6 +105,13 @@ class ParserService:
         # 初始化缓存服务
         self.cache = get_cache()
 
+        # 快照存储（txt 或 SQLite，由 config.yaml 的 storage 配置决定）
+        self.storage = get_storage_from_config(project_root=str(self.project_root))
+
+        # 多日加载的进程池（首次需要时创建，之后复用）
+        self._range_executor: Optional[ProcessPoolExecutor] = None
+        self._range_workers = min(MAX_RANGE_WORKERS, os.cpu_count() or 1)
+
     @staticmethod
     def clean_title(title: str) -> str:
         """
@@ -46,11 +123,7 @@ class ParserService:
         Returns:
             清理后的标题
         """
-        # 移除多余空白
-        title = re.sub(r'\s+', ' ', title)
-        # 移除特殊字符
-        title = title.strip()
-        return title
+        return clean_title(title)
 
     def parse_txt_file(self, file_path: Path) -> Tuple[Dict, Dict]:
         """
@@ -70,79 +143,20 @@ class ParserService:
         if not file_path.exists():
             raise FileParseError(str(file_path), "文件不存在")
 
-        titles_by_id = {}
-        id_to_name = {}
-
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                sections = content.split("\n\n")
-
-                for section in sections:
-                    if not section.strip() or "==== 以下ID请求失败 ====" in section:
-                        continue
-
-                    lines = section.strip().split("\n")
-                    if len(lines) < 2:
-                        continue
-
-                    # 解析header: id | name 或 id
-                    header_line = lines[0].strip()
-                    if " | " in header_line:
-                        parts = header_line.split(" | ", 1)
-                        source_id = parts[0].strip()
-                        name = parts[1].strip()
-                        id_to_name[source_id] = name
-                    else:
-                        source_id = header_line
-                        id_to_name[source_id] = source_id
-
-                    titles_by_id[source_id] = {}
-
-                    # 解析标题行
-                    for line in lines[1:]:
-                        if line.strip():
-                            try:
-                                title_part = line.strip()
-                                rank = None
-
-                                # 提取排名
-                                if ". " in title_part and title_part.split(". ")[0].isdigit():
-                                    rank_str, title_part = title_part.split(". ", 1)
-                                    rank = int(rank_str)
-
-                                # 提取 MOBILE URL
-                                mobile_url = ""
-                                if " [MOBILE:" in title_part:
-                                    title_part, mobile_part = title_part.rsplit(" [MOBILE:", 1)
-                                    if mobile_part.endswith("]"):
-                                        mobile_url = mobile_part[:-1]
-
-                                # 提取 URL
-                                url = ""
-                                if " [URL:" in title_part:
-                                    title_part, url_part = title_part.rsplit(" [URL:", 1)
-                                    if url_part.endswith("]"):
-                                        url = url_part[:-1]
-
-                                title = self.clean_title(title_part.strip())
-                                ranks = [rank] if rank is not None else [1]
-
-                                titles_by_id[source_id][title] = {
-                                    "ranks": ranks,
-                                    "url": url,
-                                    "mobileUrl": mobile_url,
-                                }
-
-                            except Exception as e:
-                                # 忽略单行解析错误
-                                continue
-
+            # 经存储层读取，展开快照中的 @ref 引用和 @delta 增量
+            txt_dir = file_path.parent
+            output_dir = txt_dir.parent.parent
+            storage = self.storage
+            if not (
+                isinstance(storage, TxtSnapshotStorage)
+                and storage.output_dir.resolve() == output_dir.resolve()
+            ):
+                storage = TxtSnapshotStorage(str(output_dir), parse_cache=False)
+            return storage.load_snapshot(txt_dir.parent.name, file_path.stem)
         except Exception as e:
             raise FileParseError(str(file_path), str(e))
 
-        return titles_by_id, id_to_name
-
     def get_date_folder_name(self, date: datetime = None) -> str:
         """
         获取日期文件夹名称
@@ -171,33 +185,22 @@ class ParserService:
 
         Returns:
             (all_titles, id_to_name, all_timestamps) 元组
-            - all_titles: {platform_id: {title: {ranks, url, mobileUrl, ...}}}
+            - all_titles: {platform_id: {title: TitleRecord}}，可按 ranks/url/mobileUrl 键读取
             - id_to_name: {platform_id: platform_name}
             - all_timestamps: {filename: timestamp}
 
         Raises:
             DataNotFoundError: 数据不存在
         """
-        # 生成缓存键
-        date_str = self.get_date_folder_name(date)
-        platform_key = ','.join(sorted(platform_ids)) if platform_ids else 'all'
-        cache_key = f"read_all_titles:{date_str}:{platform_key}"
-
-        # 尝试从缓存获取
-        # 对于历史数据（非今天），使用更长的缓存时间（1小时）
-        # 对于今天的数据，使用较短的缓存时间（15分钟），因为可能有新数据
-        is_today = (date is None) or (date.date() == datetime.now().date())
-        ttl = 900 if is_today else 3600  # 15分钟 vs 1小时
-
+        cache_key, ttl = self._titles_cache_key(date, platform_ids)
         cached = self.cache.get(cache_key, ttl=ttl)
         if cached:
             return cached
 
-        # 缓存未命中，读取文件
+        # 缓存未命中，从快照存储读取
         date_folder = self.get_date_folder_name(date)
-        txt_dir = self.project_root / "output" / date_folder / "txt"
 
-        if not txt_dir.exists():
+        if not self.storage.has_date(date_folder):
             raise DataNotFoundError(
                 f"未找到 {date_folder} 的数据目录",
                 suggestion="请先运行爬虫或检查日期是否正确"
@@ -207,58 +210,257 @@ class ParserService:
         id_to_name = {}
         all_timestamps = {}
 
-        # 读取所有txt文件
-        txt_files = sorted(txt_dir.glob("*.txt"))
+        snapshot_count = 0
+        for entry, titles_by_id, snapshot_id_to_name in self.storage.iter_snapshots(
+            date_folder, platform_ids
+        ):
+            snapshot_count += 1
+            merge_snapshot_titles(all_titles, id_to_name, titles_by_id, snapshot_id_to_name)
+
+            # 记录快照时间戳
+            all_timestamps[f"{entry.time_info}.txt"] = entry.timestamp
 
-        if not txt_files:
+        if not snapshot_count:
             raise DataNotFoundError(
                 f"{date_folder} 没有数据文件",
                 suggestion="请等待爬虫任务完成"
             )
 
-        for txt_file in txt_files:
-            try:
-                titles_by_id, file_id_to_name = self.parse_txt_file(txt_file)
+        return self._cache_day_result(
+            cache_key, date_folder, (all_titles, id_to_name, all_timestamps)
+        )
 
-                # 更新id_to_name
-                id_to_name.update(file_id_to_name)
+    def read_titles_for_date_filtered(
+        self,
+        date: datetime,
+        platform_ids: Optional[List[str]] = None,
+        predicate: Optional[Callable[[str, str], bool]] = None
+    ) -> Tuple[Dict, Dict]:
+        """
+        读取指定日期中满足条件的标题（不写入缓存）
 
-                # 合并标题数据
-                for platform_id, titles in titles_by_id.items():
-                    # 如果指定了平台过滤
-                    if platform_ids and platform_id not in platform_ids:
-                        continue
+        逐个快照读取，只合并 predicate 通过的标题，内存占用只与当天匹配的标题数有关；
+        当天的完整结果已在缓存中时直接从缓存筛选。
 
-                    if platform_id not in all_titles:
-                        all_titles[platform_id] = {}
+        Args:
+            date: 日期对象
+            platform_ids: 平台ID列表，None表示所有平台（下推到存储层）
+            predicate: 过滤函数 predicate(platform_id, title) -> bool，None表示不过滤
 
-                    for title, info in titles.items():
-                        if title in all_titles[platform_id]:
-                            # 合并排名
-                            all_titles[platform_id][title]["ranks"].extend(info["ranks"])
-                        else:
-                            all_titles[platform_id][title] = info.copy()
+        Returns:
+            (titles, id_to_name) 元组，没有数据时均为空字典；
+            titles 中的 TitleRecord 是新对象，不与缓存共享
+        """
+        cache_key, ttl = self._titles_cache_key(date, platform_ids)
+        cached = self.cache.get(cache_key, ttl=ttl)
+        if cached:
+            snapshots = [(cached[0], cached[1])]
+        else:
+            date_folder = self.get_date_folder_name(date)
+            if not self.storage.has_date(date_folder):
+                return {}, {}
+            snapshots = (
+                (titles_by_id, snapshot_id_to_name)
+                for _, titles_by_id, snapshot_id_to_name in self.storage.iter_snapshots(
+                    date_folder, platform_ids
+                )
+            )
 
-                # 记录文件时间戳
-                all_timestamps[txt_file.name] = txt_file.stat().st_mtime
+        titles = {}
+        id_to_name = {}
+        for titles_by_id, snapshot_id_to_name in snapshots:
+            if predicate is not None:
+                titles_by_id = {
+                    platform_id: {
+                        title: info
+                        for title, info in platform_titles.items()
+                        if predicate(platform_id, title)
+                    }
+                    for platform_id, platform_titles in titles_by_id.items()
+                }
+            merge_snapshot_titles(titles, id_to_name, titles_by_id, snapshot_id_to_name)
 
-            except Exception as e:
-                # 忽略单个文件的解析错误，继续处理其他文件
-                print(f"Warning: 解析文件 {txt_file} 失败: {e}")
-                continue
+        # 丢弃没有匹配标题的平台
+        return {pid: t for pid, t in titles.items() if t}, id_to_name
+
+    def _titles_cache_key(
+        self, date: Optional[datetime], platform_ids: Optional[List[str]]
+    ) -> Tuple[str, int]:
+        """返回 (缓存键, 有效期秒数)"""
+        date_str = self.get_date_folder_name(date)
+        platform_key = ','.join(sorted(platform_ids)) if platform_ids else 'all'
+        cache_key = f"read_all_titles:{date_str}:{platform_key}"
 
-        if not all_titles:
+        # 对于历史数据（非今天），使用更长的缓存时间（1小时）
+        # 对于今天的数据，使用较短的缓存时间（15分钟），因为可能有新数据
+        is_today = (date is None) or (date.date() == datetime.now().date())
+        ttl = 900 if is_today else 3600  # 15分钟 vs 1小时
+        return cache_key, ttl
+
+    def _cache_day_result(self, cache_key: str, date_folder: str, result: Tuple) -> Tuple:
+        """校验并缓存单日合并结果"""
+        if not result[0]:
             raise DataNotFoundError(
                 f"{date_folder} 没有有效的数据",
                 suggestion="请检查数据文件格式或重新运行爬虫"
             )
-
-        # 缓存结果
-        result = (all_titles, id_to_name, all_timestamps)
         self.cache.set(cache_key, result)
-
         return result
 
+    def _get_range_executor(self) -> ProcessPoolExecutor:
+        if self._range_executor is None:
+            # MCP Server 运行在多线程的事件循环中，使用 spawn 避免 fork 继承锁状态
+            self._range_executor = ProcessPoolExecutor(
+                max_workers=self._range_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_range_worker,
+                initargs=(str(self.project_root),),
+            )
+        return self._range_executor
+
+    def close(self) -> None:
+        """关闭多日加载的进程池（取消尚未开始的任务），并写回快照解析缓存"""
+        if self._range_executor is not None:
+            self._range_executor.shutdown(cancel_futures=True)
+            self._range_executor = None
+        self.storage.flush_cache()
+
+    def load_date_range(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        platform_ids: Optional[List[str]] = None
+    ) -> Dict[str, Tuple[Dict, Dict, Dict]]:
+        """
+        批量读取日期范围内每天的标题（带缓存）
+
+        SQLite 后端用一条按日期索引的范围查询读取所有未缓存的日期；txt 后端在进程池中
+        并行加载：每天的快照按时间顺序切分成若干段，分给不同的工作进程读取并各自合并，
+        再按顺序合并为当天结果。两种方式都与逐日调用 read_all_titles_for_date 的结果一致。
+        加载结果写入缓存，随后按天调用 read_all_titles_for_date 会直接命中。
+
+        Args:
+            start_date: 开始日期
+            end_date: 结束日期（包含）
+            platform_ids: 平台ID列表，None表示所有平台
+
+        Returns:
+            {日期文件夹名: (all_titles, id_to_name, all_timestamps)}，没有数据的日期不包含在内
+        """
+        results = {}
+        date_folders = []
+        pending = []  # [(date_folder, cache_key, entries)]
+        # SQLite 后端用一条范围查询读取所有未缓存的日期，不需要逐日列出快照
+        use_range_query = self.storage.backend == "sqlite"
+
+        current_date = start_date
+        while current_date <= end_date:
+            date_folder = self.get_date_folder_name(current_date)
+            date_folders.append(date_folder)
+            cache_key, ttl = self._titles_cache_key(current_date, platform_ids)
+            cached = self.cache.get(cache_key, ttl=ttl)
+            if cached:
+                results[date_folder] = cached
+            elif use_range_query:
+                pending.append((date_folder, cache_key, None))
+            elif self.storage.has_date(date_folder):
+                entries = self.storage.list_snapshots(date_folder)
+                if entries:
+                    pending.append((date_folder, cache_key, entries))
+            current_date += timedelta(days=1)
+
+        if use_range_query:
+            if pending:
+                self._load_pending_from_range(pending, platform_ids, results)
+            return {
+                date_folder: results[date_folder]
+                for date_folder in date_folders
+                if date_folder in results
+            }
+
+        total_snapshots = sum(len(entries) for _, _, entries in pending)
+        if self._range_workers <= 1 or total_snapshots < PARALLEL_MIN_SNAPSHOTS:
+            for date_folder, cache_key, _ in pending:
+                try:
+                    results[date_folder] = self.read_all_titles_for_date(
+                        datetime.strptime(date_folder, "%Y年%m月%d日"), platform_ids
+                    )
+                except DataNotFoundError:
+                    pass
+        else:
+            self._load_pending_in_parallel(pending, total_snapshots, platform_ids, results)
+
+        return {
+            date_folder: results[date_folder]
+            for date_folder in date_folders
+            if date_folder in results
+        }
+
+    def _load_pending_from_range(
+        self,
+        pending: List[Tuple[str, str, None]],
+        platform_ids: Optional[List[str]],
+        results: Dict,
+    ) -> None:
+        """用存储层的范围查询一次读取所有未缓存的日期，按天合并并写入缓存"""
+        cache_keys = {date_folder: cache_key for date_folder, cache_key, _ in pending}
+        days: Dict[str, Tuple[Dict, Dict, Dict]] = {}
+        for date_folder, entry, titles_by_id, snapshot_id_to_name in self.storage.load_range(
+            pending[0][0], pending[-1][0], platform_ids
+        ):
+            if date_folder not in cache_keys:
+                continue
+            all_titles, id_to_name, all_timestamps = days.setdefault(date_folder, ({}, {}, {}))
+            merge_snapshot_titles(all_titles, id_to_name, titles_by_id, snapshot_id_to_name)
+            all_timestamps[f"{entry.time_info}.txt"] = entry.timestamp
+
+        for date_folder, day_result in days.items():
+            try:
+                results[date_folder] = self._cache_day_result(
+                    cache_keys[date_folder], date_folder, day_result
+                )
+            except DataNotFoundError:
+                pass
+
+    def _load_pending_in_parallel(
+        self,
+        pending: List[Tuple[str, str, List]],
+        total_snapshots: int,
+        platform_ids: Optional[List[str]],
+        results: Dict,
+    ) -> None:
+
+        # 每段大约包含的快照数：保证总段数不少于工作进程数的两倍，以平衡负载
+        chunk_size = max(1, total_snapshots // (self._range_workers * 2))
+        executor = self._get_range_executor()
+        futures = []
+        for date_folder, cache_key, entries in pending:
+            chunk_futures = [
+                executor.submit(
+                    _load_snapshot_chunk,
+                    date_folder,
+                    entries[i:i + chunk_size],
+                    platform_ids,
+                )
+                for i in range(0, len(entries), chunk_size)
+            ]
+            futures.append((date_folder, cache_key, chunk_futures))
+
+        for date_folder, cache_key, chunk_futures in futures:
+            all_titles = {}
+            id_to_name = {}
+            all_timestamps = {}
+            for future in chunk_futures:
+                chunk_titles, chunk_id_to_name, chunk_timestamps = future.result()
+                merge_snapshot_titles(all_titles, id_to_name, chunk_titles, chunk_id_to_name)
+                all_timestamps.update(chunk_timestamps)
+            try:
+                results[date_folder] = self._cache_day_result(
+                    cache_key, date_folder, (all_titles, id_to_name, all_timestamps)
+                )
+            except DataNotFoundError:
+                pass
+
     def parse_yaml_config(self, config_path: str = None) -> dict:
         """
         解析YAML配置文件
@@ -10,7 +10,9 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from difflib import SequenceMatcher
 
-from ..services.data_service import DataService
+from trendradar.scoring import calculate_weights
+
+from ..services.data_service import DataService, title_contains
 from ..utils.validators import (
     validate_platforms,
     validate_limit,
@@ -21,6 +23,12 @@ from ..utils.validators import (
 from ..utils.errors import MCPError, InvalidParameterError, DataNotFoundError
 
 
+# 权重配置（与 config.yaml 保持一致）
+RANK_WEIGHT = 0.6
+FREQUENCY_WEIGHT = 0.3
+HOTNESS_WEIGHT = 0.1
+
+
 def calculate_news_weight(news_data: Dict, rank_threshold: int = 5) -> float:
     """
     计算新闻权重（用于排序）
@@ -37,41 +45,23 @@ def calculate_news_weight(news_data: Dict, rank_threshold: int = 5) -> float:
     Returns:
         权重分数（0-100之间的浮点数）
     """
-    ranks = news_data.get("ranks", [])
-    if not ranks:
-        return 0.0
-
-    count = news_data.get("count", len(ranks))
-
-    # 权重配置（与 config.yaml 保持一致）
-    RANK_WEIGHT = 0.6
-    FREQUENCY_WEIGHT = 0.3
-    HOTNESS_WEIGHT = 0.1
-
-    # 1. 排名权重：Σ(11 - min(rank, 10)) / 出现次数
-    rank_scores = []
-    for rank in ranks:
-        score = 11 - min(rank, 10)
-        rank_scores.append(score)
-
-    rank_weight = sum(rank_scores) / len(ranks) if ranks else 0
-
-    # 2. 频次权重：min(出现次数, 10) × 10
-    frequency_weight = min(count, 10) * 10
-
-    # 3. 热度加成：高排名次数 / 总出现次数 × 100
-    high_rank_count = sum(1 for rank in ranks if rank <= rank_threshold)
-    hotness_ratio = high_rank_count / len(ranks) if ranks else 0
-    hotness_weight = hotness_ratio * 100
-
-    # 综合权重
-    total_weight = (
-        rank_weight * RANK_WEIGHT
-        + frequency_weight * FREQUENCY_WEIGHT
-        + hotness_weight * HOTNESS_WEIGHT
-    )
+    return calculate_weights(
+        [news_data], rank_threshold, RANK_WEIGHT, FREQUENCY_WEIGHT, HOTNESS_WEIGHT
+    )[0]
 
-    return total_weight
+
+def sort_news_by_weight(news_list: List[Dict], rank_threshold: int = 5) -> List[Dict]:
+    """
+    按权重从高到低排序（权重相同的保持原顺序）
+
+    所有条目的权重一次批量计算（安装了 NumPy 时向量化），
+    与 sort(key=calculate_news_weight, reverse=True) 结果一致。
+    """
+    weights = calculate_weights(
+        news_list, rank_threshold, RANK_WEIGHT, FREQUENCY_WEIGHT, HOTNESS_WEIGHT
+    )
+    order = sorted(range(len(news_list)), key=weights.__getitem__, reverse=True)
+    return [news_list[index] for index in order]
 
 
 class AnalyticsTools:
@@ -310,6 +300,9 @@ class AnalyticsTools:
             trend_data = []
             current_date = start_date
 
+            # 并行预加载整个日期范围，下面逐日读取时直接命中缓存
+            self.data_service.parser.load_date_range(start_date, end_date)
+
             while current_date <= end_date:
                 try:
                     all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
@@ -448,33 +441,19 @@ class AnalyticsTools:
                 "top_keywords": Counter()
             })
 
-            # 遍历日期范围
-            current_date = start_date
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date
-                    )
-
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
+            # 流式遍历日期范围（每次只保留一天的数据）
+            for record in self.data_service.iter_records(start_date, end_date):
+                stats = platform_stats[record.platform_name]
+                stats["total_news"] += 1
+                stats["unique_titles"].add(record.title)
 
-                        for title in titles.keys():
-                            platform_stats[platform_name]["total_news"] += 1
-                            platform_stats[platform_name]["unique_titles"].add(title)
-
-                            # 如果指定了话题，统计包含话题的新闻
-                            if topic and topic.lower() in title.lower():
-                                platform_stats[platform_name]["topic_mentions"] += 1
+                # 如果指定了话题，统计包含话题的新闻
+                if topic and topic.lower() in record.title.lower():
+                    stats["topic_mentions"] += 1
 
-                            # 提取关键词（简单分词）
-                            keywords = self._extract_keywords(title)
-                            platform_stats[platform_name]["top_keywords"].update(keywords)
-
-                except DataNotFoundError:
-                    pass
-
-                current_date += timedelta(days=1)
+                # 提取关键词（简单分词）
+                keywords = self._extract_keywords(record.title)
+                stats["top_keywords"].update(keywords)
 
             # 转换为可序列化的格式
             result_stats = {}
@@ -691,74 +670,49 @@ class AnalyticsTools:
                 # 默认今天
                 start_date = end_date = datetime.now()
 
-            # 收集新闻数据（支持多天）
-            all_news_items = []
-            current_date = start_date
-
-            while current_date <= end_date:
-                try:
-                    all_titles, id_to_name, _ = self.data_service.parser.read_all_titles_for_date(
-                        date=current_date,
-                        platform_ids=platforms
-                    )
-
-                    # 收集该日期的新闻
-                    for platform_id, titles in all_titles.items():
-                        platform_name = id_to_name.get(platform_id, platform_id)
-                        for title, info in titles.items():
-                            # 如果指定了话题，只收集包含话题的标题
-                            if topic and topic.lower() not in title.lower():
-                                continue
-
-                            news_item = {
-                                "platform": platform_name,
-                                "title": title,
-                                "ranks": info.get("ranks", []),
-                                "count": len(info.get("ranks", [])),
-                                "date": current_date.strftime("%Y-%m-%d")
-                            }
-
-                            # 条件性添加 URL 字段
-                            if include_url:
-                                news_item["url"] = info.get("url", "")
-                                news_item["mobileUrl"] = info.get("mobileUrl", "")
+            # 流式收集新闻数据（支持多天），话题过滤下推到读取阶段，边读边去重
+            predicate = title_contains(topic) if topic else None
+            total_items = 0
+            unique_news = {}
+            for record in self.data_service.iter_records(
+                start_date, end_date, platforms, predicate
+            ):
+                total_items += 1
+                key = f"{record.platform_name}::{record.title}"
+                if key in unique_news:
+                    # 合并 ranks（如果同一新闻在多天出现）
+                    existing = unique_news[key]
+                    existing["ranks"].extend(record.ranks)
+                    existing["count"] = len(existing["ranks"])
+                    continue
 
-                            all_news_items.append(news_item)
+                news_item = {
+                    "platform": record.platform_name,
+                    "title": record.title,
+                    "ranks": record.ranks,
+                    "count": len(record.ranks),
+                    "date": record.date
+                }
 
-                except DataNotFoundError:
-                    # 该日期没有数据，继续下一天
-                    pass
+                # 条件性添加 URL 字段
+                if include_url:
+                    news_item["url"] = record.url
+                    news_item["mobileUrl"] = record.mobile_url
 
-                # 下一天
-                current_date += timedelta(days=1)
+                unique_news[key] = news_item
 
-            if not all_news_items:
+            if not unique_news:
                 time_desc = "今天" if start_date == end_date else f"{start_date.strftime('%Y-%m-%d')} 至 {end_date.strftime('%Y-%m-%d')}"
                 raise DataNotFoundError(
                     f"未找到相关新闻（{time_desc}）",
                     suggestion="请尝试其他话题、日期范围或平台"
                 )
 
-            # 去重（同一标题只保留一次）
-            unique_news = {}
-            for item in all_news_items:
-                key = f"{item['platform']}::{item['title']}"
-                if key not in unique_news:
-                    unique_news[key] = item
-                else:
-                    # 合并 ranks（如果同一新闻在多天出现）
-                    existing = unique_news[key]
-                    existing["ranks"].extend(item["ranks"])
-                    existing["count"] = len(existing["ranks"])
-
             deduplicated_news = list(unique_news.values())
 
             # 按权重排序（如果启用）
             if sort_by_weight:
-                deduplicated_news.sort(
-                    key=lambda x: calculate_news_weight(x),
-                    reverse=True
-                )
+                deduplicated_news = sort_news_by_weight(deduplicated_news)
 
             # 限制返回数量
             selected_news = deduplicated_news[:limit]
@@ -782,7 +736,7 @@ class AnalyticsTools:
                     "total_found": len(deduplicated_news),
                     "returned_count": len(selected_news),
                     "requested_limit": limit,
-                    "duplicates_removed": len(all_news_items) - len(deduplicated_news),
+                    "duplicates_removed": total_items - len(deduplicated_news),
                     "topic": topic,
                     "time_range": time_range_desc,
                     "platforms": list(set(item["platform"] for item in selected_news)),
@@ -1116,10 +1070,7 @@ class AnalyticsTools:
 
             # 按权重排序（如果启用）
             if sort_by_weight:
-                related_news.sort(
-                    key=lambda x: calculate_news_weight(x),
-                    reverse=True
-                )
+                related_news = sort_news_by_weight(related_news)
             else:
                 # 按排名排序
                 related_news.sort(key=lambda x: x["rank"])
@@ -1207,6 +1158,9 @@ class AnalyticsTools:
             all_platforms_news = defaultdict(int)
             all_titles_list = []
 
+            # 并行预加载整个日期范围，下面逐日读取时直接命中缓存
+            self.data_service.parser.load_date_range(start_date, end_date)
+
             current_date = start_date
             while current_date <= end_date:
                 try:
@@ -1379,6 +1333,9 @@ class AnalyticsTools:
                 "hourly_distribution": Counter()
             })
 
+            # 并行预加载整个日期范围，下面逐日读取时直接命中缓存
+            self.data_service.parser.load_date_range(start_date, end_date)
+
             # 遍历日期范围
             current_date = start_date
             while current_date <= end_date:
@@ -1510,6 +1467,9 @@ class AnalyticsTools:
             # 收集话题历史数据
             lifecycle_data = []
             current_date = start_date
+
+            # 并行预加载整个日期范围，下面逐日读取时直接命中缓存
+            self.data_service.parser.load_date_range(start_date, end_date)
             while current_date <= end_date:
                 try:
                     all_titles, _, _ = self.data_service.parser.read_all_titles_for_date(
@@ -124,6 +124,9 @@ class SearchTools:
             all_matches = []
             current_date = start_date
 
+            # 并行预加载整个日期范围，下面逐日读取时直接命中缓存
+            self.data_service.parser.load_date_range(start_date, end_date, platforms)
+
             while current_date <= end_date:
                 try:
                     all_titles, id_to_name, timestamps = self.data_service.parser.read_all_titles_for_date(
@@ -187,8 +190,8 @@ class SearchTools:
             if sort_by == "relevance":
                 all_matches.sort(key=lambda x: x.get("similarity_score", 1.0), reverse=True)
             elif sort_by == "weight":
-                from .analytics import calculate_news_weight
-                all_matches.sort(key=lambda x: calculate_news_weight(x), reverse=True)
+                from .analytics import sort_news_by_weight
+                all_matches = sort_news_by_weight(all_matches)
             elif sort_by == "date":
                 all_matches.sort(key=lambda x: x.get("date", ""), reverse=True)
 
@@ -576,6 +579,9 @@ class SearchTools:
             all_related_news = []
             current_date = search_start
 
+            # 并行预加载整个日期范围，下面逐日读取时直接命中缓存
+            self.data_service.parser.load_date_range(search_start, search_end)
+
             while current_date <= search_end:
                 try:
                     # 读取该日期的数据
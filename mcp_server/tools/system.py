@@ -4,9 +4,12 @@
 实现系统状态查询和爬虫触发功能。
 """
 
+import os
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from trendradar.http_client import configure_http_client
+
 from ..services.data_service import DataService
 from ..utils.validators import validate_platforms
 from ..utils.errors import MCPError, CrawlTaskError
@@ -90,7 +93,6 @@ class SystemManagementTools:
             import json
             import time
             import random
-            import requests
             from datetime import datetime
             import pytz
             import yaml
@@ -130,7 +132,17 @@ class SystemManagementTools:
                 target_platforms = all_platforms
 
             # 获取请求间隔
-            request_interval = config_data.get("crawler", {}).get("request_interval", 100)
+            crawler_config = config_data.get("crawler", {})
+            request_interval = crawler_config.get("request_interval", 100)
+
+            # 复用进程级连接池（代理规则与 main.py 一致）
+            proxy_url = ""
+            if crawler_config.get("use_proxy") and os.environ.get("GITHUB_ACTIONS") != "true":
+                proxy_url = crawler_config.get("default_proxy") or ""
+            http_client = configure_http_client(
+                pool_size=crawler_config.get("http_pool_size", 10),
+                proxy_url=proxy_url,
+            )
 
             # 构建平台ID列表
             ids = []
@@ -174,7 +186,7 @@ class SystemManagementTools:
 
                 while retries <= max_retries and not success:
                     try:
-                        response = requests.get(url, headers=headers, timeout=10)
+                        response = http_client.get(url, headers=headers, timeout=10)
                         response.raise_for_status()
 
                         data_text = response.text
@@ -260,91 +272,31 @@ class SystemManagementTools:
             # 如果需要持久化，调用保存逻辑
             if save_to_local:
                 try:
-                    import re
-
-                    # 辅助函数：清理标题
-                    def clean_title(title: str) -> str:
-                        """清理标题中的特殊字符"""
-                        if not isinstance(title, str):
-                            title = str(title)
-                        cleaned_title = title.replace("\n", " ").replace("\r", " ")
-                        cleaned_title = re.sub(r"\s+", " ", cleaned_title)
-                        cleaned_title = cleaned_title.strip()
-                        return cleaned_title
-
-                    # 辅助函数：创建目录
-                    def ensure_directory_exists(directory: str):
-                        """确保目录存在"""
-                        Path(directory).mkdir(parents=True, exist_ok=True)
-
                     # 格式化日期和时间
                     date_folder = now.strftime("%Y年%m月%d日")
                     time_filename = now.strftime("%H时%M分")
 
-                    # 创建 txt 文件路径
-                    txt_dir = self.project_root / "output" / date_folder / "txt"
-                    ensure_directory_exists(str(txt_dir))
-                    txt_file_path = txt_dir / f"{time_filename}.txt"
+                    # 快照经存储层保存（按 storage 配置写入 txt 或 SQLite，并记录到目录索引）
+                    snapshot_location = self.data_service.parser.storage.save_snapshot(
+                        date_folder, time_filename, results, id_to_name, failed_ids
+                    )
 
                     # 创建 html 文件路径
                     html_dir = self.project_root / "output" / date_folder / "html"
-                    ensure_directory_exists(str(html_dir))
+                    html_dir.mkdir(parents=True, exist_ok=True)
                     html_file_path = html_dir / f"{time_filename}.html"
 
-                    # 保存 txt 文件（按照 main.py 的格式）
-                    with open(txt_file_path, "w", encoding="utf-8") as f:
-                        for id_value, title_data in results.items():
-                            # id | name 或 id
-                            name = id_to_name.get(id_value)
-                            if name and name != id_value:
-                                f.write(f"{id_value} | {name}\n")
-                            else:
-                                f.write(f"{id_value}\n")
-
-                            # 按排名排序标题
-                            sorted_titles = []
-                            for title, info in title_data.items():
-                                cleaned = clean_title(title)
-                                if isinstance(info, dict):
-                                    ranks = info.get("ranks", [])
-                                    url = info.get("url", "")
-                                    mobile_url = info.get("mobileUrl", "")
-                                else:
-                                    ranks = info if isinstance(info, list) else []
-                                    url = ""
-                                    mobile_url = ""
-
-                                rank = ranks[0] if ranks else 1
-                                sorted_titles.append((rank, cleaned, url, mobile_url))
-
-                            sorted_titles.sort(key=lambda x: x[0])
-
-                            for rank, cleaned, url, mobile_url in sorted_titles:
-                                line = f"{rank}. {cleaned}"
-                                if url:
-                                    line += f" [URL:{url}]"
-                                if mobile_url:
-                                    line += f" [MOBILE:{mobile_url}]"
-                                f.write(line + "\n")
-
-                            f.write("\n")
-
-                        if failed_ids:
-                            f.write("==== 以下ID请求失败 ====\n")
-                            for id_value in failed_ids:
-                                f.write(f"{id_value}\n")
-
                     # 保存 html 文件（简化版）
                     html_content = self._generate_simple_html(results, id_to_name, failed_ids, now)
                     with open(html_file_path, "w", encoding="utf-8") as f:
                         f.write(html_content)
 
                     print(f"数据已保存到:")
-                    print(f"  TXT: {txt_file_path}")
+                    print(f"  快照: {snapshot_location}")
                     print(f"  HTML: {html_file_path}")
 
                     result["saved_files"] = {
-                        "txt": str(txt_file_path),
+                        "snapshot": snapshot_location,
                         "html": str(html_file_path)
                     }
                     result["note"] = "数据已持久化到 output 文件夹"
@@ -0,0 +1,5 @@
+"""
+TrendRadar 公共模块
+
+main.py、MCP Server 与播客脚本共享的基础设施（HTTP 连接池等）。
+"""
@@ -0,0 +1,191 @@
+"""
+按天归档
+
+当天结束后 output/<日期>/ 下的 txt 快照和 HTML 报告不再改变，每次爬取一个文件，
+一个月就有上千个小文件。归档把一天的文件打包为单个压缩文件 output/<日期>.tar.gz：
+
+    index.json           # {"version": 1, "files": {相对路径: [大小, 修改时间ns]}}
+    .parse_cache.bin     # 快照解析缓存（见 trendradar.parse_cache）
+    txt/<时间>.txt ...
+    html/<时间>.html ...
+    reports/<时间>.json.gz ...   # 报告数据（见 trendradar.report_store）
+
+整个归档是一个 gzip 流（同一天的快照内容高度相似，整体压缩比逐个文件压缩小得多）。
+索引和解析缓存放在最前面，列出快照、读取已缓存的解析结果时只需解压开头一小段；
+需要快照原文时一次顺序读取解压全部 txt，全程不向磁盘解压。
+"""
+
+import io
+import json
+import os
+import shutil
+import tarfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from trendradar.parse_cache import PARSE_CACHE_FILE_NAME, PARSE_CACHE_LOCK_NAME
+
+ARCHIVE_SUFFIX = ".tar.gz"
+ARCHIVE_INDEX_NAME = "index.json"
+ARCHIVE_VERSION = 1
+# 打包进归档的子目录（其余内容如播客音频保留在日期目录中）
+ARCHIVED_DIRS = ("txt", "html", "reports")
+
+
+def get_archive_path(output_dir: Path, date_folder: str) -> Path:
+    return Path(output_dir) / f"{date_folder}{ARCHIVE_SUFFIX}"
+
+
+def _add_bytes(tar: tarfile.TarFile, name: str, data: bytes, mtime: float) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = int(mtime)
+    tar.addfile(info, io.BytesIO(data))
+
+
+def archive_day_folder(output_dir: Path, date_folder: str, compresslevel: int = 9) -> Path:
+    """
+    把 output/<日期>/ 下的 txt、html、报告数据和解析缓存打包为 output/<日期>.tar.gz，成功后删除原文件
+
+    Args:
+        output_dir: 输出目录
+        date_folder: 日期文件夹名
+        compresslevel: gzip 压缩级别
+
+    Returns:
+        归档文件路径
+
+    Raises:
+        FileNotFoundError: 日期目录不存在或没有可归档的文件
+        FileExistsError: 归档已存在
+    """
+    day_dir = Path(output_dir) / date_folder
+    archive_path = get_archive_path(output_dir, date_folder)
+    if archive_path.exists():
+        raise FileExistsError(f"归档已存在: {archive_path}")
+
+    files: List[Tuple[str, Path]] = []
+    for sub_dir in ARCHIVED_DIRS:
+        directory = day_dir / sub_dir
+        if directory.is_dir():
+            files.extend(
+                (f"{sub_dir}/{path.name}", path)
+                for path in sorted(directory.iterdir())
+                if path.is_file()
+            )
+    if not files:
+        raise FileNotFoundError(f"{day_dir} 下没有可归档的文件")
+
+    index = {}
+    for name, path in files:
+        stat = path.stat()
+        index[name] = [stat.st_size, stat.st_mtime_ns]
+    cache_path = day_dir / PARSE_CACHE_FILE_NAME
+
+    tmp_path = archive_path.with_name(f"{archive_path.name}.{os.getpid()}.tmp")
+    try:
+        with tarfile.open(tmp_path, "w:gz", compresslevel=compresslevel) as tar:
+            index_data = json.dumps(
+                {"version": ARCHIVE_VERSION, "files": index}, ensure_ascii=False
+            ).encode("utf-8")
+            _add_bytes(tar, ARCHIVE_INDEX_NAME, index_data, time.time())
+            if cache_path.exists():
+                tar.add(cache_path, PARSE_CACHE_FILE_NAME, recursive=False)
+            for name, path in files:
+                tar.add(path, name, recursive=False)
+        os.replace(tmp_path, archive_path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+    # 校验索引可读后再删除原文件
+    if DayArchive(archive_path).index != {name: tuple(v) for name, v in index.items()}:
+        archive_path.unlink()
+        raise OSError(f"归档校验失败: {archive_path}")
+
+    for sub_dir in ARCHIVED_DIRS:
+        shutil.rmtree(day_dir / sub_dir, ignore_errors=True)
+    for path in (cache_path, day_dir / PARSE_CACHE_LOCK_NAME):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+    try:
+        # 没有其他内容（如音频）时删除空的日期目录
+        day_dir.rmdir()
+    except OSError:
+        pass
+    return archive_path
+
+
+class DayArchive:
+    """单日归档的只读访问（不解压到磁盘）"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        # {相对路径: (大小, 修改时间ns)}
+        self.index: Dict[str, Tuple[int, int]] = {}
+        self._parse_cache_data: Optional[bytes] = None
+        # 按需一次性解压的 txt 内容 {相对路径: bytes}
+        self._txt_members: Optional[Dict[str, bytes]] = None
+        self._read_head()
+
+    def _read_head(self) -> None:
+        """流式读取开头的索引和解析缓存，读到第一个快照文件即停止"""
+        with tarfile.open(self.path, "r|gz") as tar:
+            for member in tar:
+                if member.name == ARCHIVE_INDEX_NAME:
+                    data = json.loads(tar.extractfile(member).read().decode("utf-8"))
+                    if data.get("version") != ARCHIVE_VERSION:
+                        raise ValueError(f"不支持的归档版本: {self.path}")
+                    self.index = {
+                        name: (size, mtime_ns)
+                        for name, (size, mtime_ns) in data["files"].items()
+                    }
+                elif member.name == PARSE_CACHE_FILE_NAME:
+                    self._parse_cache_data = tar.extractfile(member).read()
+                else:
+                    break
+
+    @property
+    def parse_cache_data(self) -> Optional[bytes]:
+        """归档时的解析缓存文件内容（没有时为 None）"""
+        return self._parse_cache_data
+
+    def list_files(self, sub_dir: str) -> List[str]:
+        """列出子目录下的文件名（升序）"""
+        prefix = f"{sub_dir}/"
+        return sorted(name[len(prefix):] for name in self.index if name.startswith(prefix))
+
+    def stat(self, name: str) -> Tuple[int, int]:
+        """返回归档前的 (大小, 修改时间ns)，不存在时抛出 FileNotFoundError"""
+        try:
+            return self.index[name]
+        except KeyError:
+            raise FileNotFoundError(f"{self.path}:{name}") from None
+
+    def read(self, name: str) -> bytes:
+        """读取归档中的文件；txt 快照首次读取时一次顺序解压当天全部 txt 并保留在内存中"""
+        self.stat(name)
+        if name.startswith("txt/"):
+            if self._txt_members is None:
+                self._txt_members = self._extract(
+                    {member_name for member_name in self.index if member_name.startswith("txt/")}
+                )
+            return self._txt_members[name]
+        return self._extract({name})[name]
+
+    def _extract(self, names: set) -> Dict[str, bytes]:
+        """顺序解压指定的文件，全部读到后停止"""
+        members = {}
+        with tarfile.open(self.path, "r|gz") as tar:
+            for member in tar:
+                if member.name in names:
+                    members[member.name] = tar.extractfile(member).read()
+                    if len(members) == len(names):
+                        break
+        return members
@@ -0,0 +1,289 @@
+"""
+数据目录索引
+
+MCP Server 的可用日期范围、系统状态原来每次调用都要列出并匹配整个 output 目录、
+对其中每个文件 stat()，耗时随历史天数线性增长。目录索引 output/.catalog/index.json
+记录每个日期的快照列表、占用字节数和出现过的平台：
+
+- 写入快照时由存储层增量更新（新快照追加到当天的记录中）
+- 查询前 refresh() 只检查索引文件、output 目录和最新日期目录的修改时间：
+  output 目录变化（新增、归档或删除日期）时重新核对各日期，最新日期有变化
+  （如生成了报告）时只重新统计这一天，已记录的快照不会重新解析
+- 索引不存在时首次 refresh() 全量建立
+
+日期范围、总字节数和快照总数在内存中随记录一起维护，查询与历史天数无关。
+"""
+
+import bisect
+import json
+import os
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from trendradar.archive import get_archive_path
+
+CATALOG_DIR = ".catalog"
+CATALOG_FILE_NAME = "index.json"
+CATALOG_VERSION = 1
+
+
+class DateInfo(NamedTuple):
+    """单个日期的索引信息"""
+
+    date_folder: str
+    # 快照时间（升序）
+    snapshots: Tuple[str, ...]
+    # 当天出现过的平台 {platform_id: 名称}
+    platforms: Dict[str, str]
+    # 日期目录及归档占用的字节数
+    size: int
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _tree_size(path: Path) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.stat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+class StorageCatalog:
+    """
+    快照存储的目录索引
+
+    storage 只需提供 output_dir、list_dates、list_snapshots 和 load_snapshot，
+    txt 与 SQLite 后端共用。
+    """
+
+    def __init__(self, storage):
+        self.storage = storage
+        self.output_dir = Path(storage.output_dir)
+        self.path = self.output_dir / CATALOG_DIR / CATALOG_FILE_NAME
+        self._lock = Lock()
+        self._reset()
+        # 已加载（或写入）的索引文件修改时间，None 表示尚未加载
+        self._file_mtime_ns: Optional[int] = None
+
+    def _reset(self) -> None:
+        # {日期: {"snapshots": [...], "platforms": {...}, "size": int, "signature": [...]}}
+        self._entries: Dict[str, Dict] = {}
+        self._dates: List[str] = []
+        self._total_size = 0
+        self._total_snapshots = 0
+        self._output_mtime_ns = 0
+
+    def _load(self) -> bool:
+        """读取索引文件，不存在或无法识别时返回 False"""
+        try:
+            file_mtime_ns = self.path.stat().st_mtime_ns
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != CATALOG_VERSION:
+                return False
+        except (OSError, ValueError):
+            return False
+
+        self._reset()
+        for date_folder, entry in data["dates"].items():
+            self._set_entry(date_folder, entry)
+        self._output_mtime_ns = data["output_mtime_ns"]
+        self._file_mtime_ns = file_mtime_ns
+        return True
+
+    def save(self) -> None:
+        """原子写入索引文件（放在单独的子目录中，写入不改变 output 目录的修改时间）"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": CATALOG_VERSION,
+            "output_mtime_ns": self._output_mtime_ns,
+            "dates": self._entries,
+        }
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: 写入目录索引失败: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return
+        self._file_mtime_ns = _mtime_ns(self.path)
+
+    def _set_entry(self, date_folder: str, entry: Dict) -> None:
+        self._remove_entry(date_folder)
+        self._entries[date_folder] = entry
+        bisect.insort(self._dates, date_folder)
+        self._total_size += entry["size"]
+        self._total_snapshots += len(entry["snapshots"])
+
+    def _remove_entry(self, date_folder: str) -> None:
+        entry = self._entries.pop(date_folder, None)
+        if entry is None:
+            return
+        del self._dates[bisect.bisect_left(self._dates, date_folder)]
+        self._total_size -= entry["size"]
+        self._total_snapshots -= len(entry["snapshots"])
+
+    def _signature(self, date_folder: str) -> List[int]:
+        """日期目录、其各子目录和归档文件的修改时间（增删文件都会改变其中之一）"""
+        day_dir = self.output_dir / date_folder
+        signature = [
+            _mtime_ns(get_archive_path(self.output_dir, date_folder)),
+            _mtime_ns(day_dir),
+        ]
+        try:
+            with os.scandir(day_dir) as entries:
+                for entry in sorted(entries, key=lambda item: item.name):
+                    if entry.is_dir():
+                        signature.append(entry.stat().st_mtime_ns)
+        except OSError:
+            pass
+        return signature
+
+    def _scan_date(self, date_folder: str) -> None:
+        """重新统计单个日期，只读取索引中还没有记录的快照"""
+        previous = self._entries.get(date_folder)
+        snapshots = [entry.time_info for entry in self.storage.list_snapshots(date_folder)]
+        known = set(previous["snapshots"]) if previous else set()
+        if known <= set(snapshots):
+            platforms = dict(previous["platforms"]) if previous else {}
+        else:
+            # 有快照被删除，平台需要重新统计
+            known, platforms = set(), {}
+
+        for time_info in snapshots:
+            if time_info in known:
+                continue
+            try:
+                _, id_to_name = self.storage.load_snapshot(date_folder, time_info)
+            except Exception as e:
+                print(f"Warning: 读取快照 {date_folder}/{time_info} 失败: {e}")
+                continue
+            platforms.update(id_to_name)
+
+        archive_path = get_archive_path(self.output_dir, date_folder)
+        size = _tree_size(self.output_dir / date_folder)
+        if archive_path.exists():
+            size += archive_path.stat().st_size
+        self._set_entry(
+            date_folder,
+            {
+                "snapshots": snapshots,
+                "platforms": platforms,
+                "size": size,
+                "signature": self._signature(date_folder),
+            },
+        )
+
+    def _sync_dates(self) -> None:
+        """与存储中的日期列表核对：删除消失的日期，重新统计新增或有变化的日期"""
+        dates = set(self.storage.list_dates())
+        for date_folder in [date for date in self._entries if date not in dates]:
+            self._remove_entry(date_folder)
+        for date_folder in sorted(dates):
+            entry = self._entries.get(date_folder)
+            if entry is None or entry["signature"] != self._signature(date_folder):
+                self._scan_date(date_folder)
+        self.storage.flush_cache()
+
+    def refresh(self) -> "StorageCatalog":
+        """检测其他进程写入的快照和目录变化，按需增量更新并保存"""
+        with self._lock:
+            if _mtime_ns(self.path) != self._file_mtime_ns and not self._load():
+                self._reset()
+
+            changed = False
+            output_mtime_ns = _mtime_ns(self.output_dir)
+            if output_mtime_ns != self._output_mtime_ns:
+                self._sync_dates()
+                self._output_mtime_ns = output_mtime_ns
+                changed = True
+            elif self._dates:
+                latest = self._dates[-1]
+                if self._entries[latest]["signature"] != self._signature(latest):
+                    self._scan_date(latest)
+                    self.storage.flush_cache()
+                    changed = True
+
+            if changed:
+                self.save()
+            return self
+
+    def record_snapshot(
+        self, date_folder: str, time_info: str, platforms: Dict[str, str], size: int
+    ) -> None:
+        """
+        写入快照后增量更新索引（索引尚未建立时跳过，由首次 refresh 全量建立）
+
+        Args:
+            date_folder: 日期文件夹名
+            time_info: 快照时间
+            platforms: 快照中的平台 {platform_id: 名称}
+            size: 快照写入 output/<日期>/ 的字节数
+        """
+        with self._lock:
+            if _mtime_ns(self.path) != self._file_mtime_ns and not self._load():
+                return
+
+            entry = self._entries.get(date_folder)
+            if entry is None or time_info in entry["snapshots"]:
+                # 新的日期或覆盖已有快照时重新统计这一天
+                self._scan_date(date_folder)
+            else:
+                snapshots = list(entry["snapshots"])
+                bisect.insort(snapshots, time_info)
+                self._set_entry(
+                    date_folder,
+                    {
+                        "snapshots": snapshots,
+                        "platforms": {**entry["platforms"], **platforms},
+                        "size": entry["size"] + size,
+                        "signature": self._signature(date_folder),
+                    },
+                )
+            self.save()
+
+    def dates(self) -> List[str]:
+        """所有日期（升序）"""
+        return list(self._dates)
+
+    def date_range(self) -> Tuple[Optional[str], Optional[str]]:
+        """(最早日期, 最新日期)，没有数据时为 (None, None)"""
+        if not self._dates:
+            return None, None
+        return self._dates[0], self._dates[-1]
+
+    def get(self, date_folder: str) -> Optional[DateInfo]:
+        entry = self._entries.get(date_folder)
+        if entry is None:
+            return None
+        return DateInfo(
+            date_folder, tuple(entry["snapshots"]), dict(entry["platforms"]), entry["size"]
+        )
+
+    @property
+    def total_size(self) -> int:
+        """所有日期占用的字节数"""
+        return self._total_size
+
+    @property
+    def date_count(self) -> int:
+        return len(self._dates)
+
+    @property
+    def total_snapshots(self) -> int:
+        return self._total_snapshots
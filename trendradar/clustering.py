@@ -0,0 +1,121 @@
+"""
+相似标题聚类
+
+同一事件在不同平台上的标题往往只有少量字词不同。这里把标题归一化（去掉标点与空白、转小写）后
+取字符二元组，计算 MinHash 签名，再用 LSH 分段（banding）找出候选对，只对候选对计算
+精确的 Jaccard 相似度，相似度达到阈值的标题用并查集合并为一个簇：
+
+- 签名长度 BANDS × ROWS，签名在任意一段上完全相同的标题成为候选（Jaccard 0.5 时约 90% 命中）
+- 每个桶中只与最近加入的 BUCKET_WINDOW 个标题比较，最坏情况下也是线性时间
+- 哈希使用 zlib.crc32，结果不受 PYTHONHASHSEED 影响
+- 标题的二元组集合与签名按标题缓存，报告与各推送渠道反复处理同一批标题时不会重复计算
+- 提供来源时只合并来自不同来源的簇（同一平台上的连载、编号标题不会被合并）
+
+簇内的标题保持输入顺序，第一个标题作为代表（调用方按权重排序后传入即以权重最高者为代表）。
+"""
+
+import re
+import zlib
+from functools import lru_cache
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+BANDS = 8
+ROWS = 2
+# 每个桶中参与比较的最近标题数
+BUCKET_WINDOW = 8
+# 缓存的标题数（约为一天内出现的不同标题数）
+SKETCH_CACHE_SIZE = 16384
+
+_MAX_HASH = (1 << 32) - 1
+# 固定的哈希参数 (a, b)，h(x) = (a * x + b) mod 2^32（a 为奇数时是 32 位整数上的置换）
+_HASH_PARAMS = [
+    (zlib.crc32(f"a{index}".encode()) | 1, zlib.crc32(f"b{index}".encode()))
+    for index in range(BANDS * ROWS)
+]
+
+_NON_WORD_PATTERN = re.compile(r"[\W_]+")
+
+
+def title_shingles(title: str) -> frozenset:
+    """归一化后的字符二元组集合（不足两个字符时为整个标题）"""
+    text = _NON_WORD_PATTERN.sub("", title.lower())
+    if len(text) < 2:
+        return frozenset([text]) if text else frozenset()
+    return frozenset(text[index:index + 2] for index in range(len(text) - 1))
+
+
+def minhash_signature(shingles: frozenset) -> Tuple[int, ...]:
+    hashes = [zlib.crc32(shingle.encode("utf-8")) for shingle in shingles]
+    return tuple(min([(a * value + b) & _MAX_HASH for value in hashes]) for a, b in _HASH_PARAMS)
+
+
+@lru_cache(maxsize=SKETCH_CACHE_SIZE)
+def _title_sketch(title: str) -> Tuple[frozenset, Tuple[int, ...]]:
+    shingles = title_shingles(title)
+    return shingles, minhash_signature(shingles) if shingles else ()
+
+
+def jaccard(left: frozenset, right: frozenset) -> float:
+    if not left or not right:
+        return 0.0
+    intersection = len(left & right)
+    return intersection / (len(left) + len(right) - intersection)
+
+
+def cluster_titles(
+    titles: Sequence[str],
+    threshold: float = 0.5,
+    sources: Optional[Sequence[Hashable]] = None,
+) -> List[List[int]]:
+    """
+    把相似的标题聚为簇
+
+    Args:
+        titles: 标题列表
+        threshold: 字符二元组 Jaccard 相似度阈值
+        sources: 各标题的来源（如平台 ID），提供时同一簇内每个来源最多一个标题
+
+    Returns:
+        簇列表，每个簇为标题下标（升序），簇按第一个下标排序；不相似的标题单独成簇
+    """
+    parent = list(range(len(titles)))
+
+    def find(index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    # 各簇根节点的来源集合
+    root_sources = [{source} for source in sources] if sources is not None else None
+
+    sketches = [_title_sketch(title) for title in titles]
+    shingle_sets = [shingles for shingles, _ in sketches]
+    buckets: Dict[tuple, List[int]] = {}
+    for index, (shingles, signature) in enumerate(sketches):
+        if not shingles:
+            continue
+        for band in range(BANDS):
+            key = (band, *signature[band * ROWS:(band + 1) * ROWS])
+            members = buckets.setdefault(key, [])
+            for other in members[-BUCKET_WINDOW:]:
+                root, other_root = find(index), find(other)
+                if root == other_root:
+                    continue
+                if root_sources is not None and not root_sources[root].isdisjoint(
+                    root_sources[other_root]
+                ):
+                    continue
+                if jaccard(shingles, shingle_sets[other]) >= threshold:
+                    # 较小的下标作为根，簇代表即簇内最靠前的标题
+                    if other_root < root:
+                        root, other_root = other_root, root
+                    parent[other_root] = root
+                    if root_sources is not None:
+                        root_sources[root] |= root_sources[other_root]
+            members.append(index)
+
+    clusters: Dict[int, List[int]] = {}
+    for index in range(len(titles)):
+        clusters.setdefault(find(index), []).append(index)
+    return sorted(clusters.values(), key=lambda members: members[0])
@@ -0,0 +1,152 @@
+"""
+HTTP 客户端
+
+进程级共享的 HTTP 连接池：按主机复用 requests.Session，保持 keep-alive，
+避免每次请求都重新建立 TCP/TLS 连接。爬虫、推送和 MCP 临时爬取统一通过这里发出请求。
+"""
+
+from threading import Lock
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class HttpClient:
+    """按主机维护连接池的 HTTP 客户端"""
+
+    def __init__(self, pool_size: int = 10, proxy_url: Optional[str] = None):
+        """
+        初始化 HTTP 客户端
+
+        Args:
+            pool_size: 每个主机的最大连接数（并发爬取时应不小于线程数）
+            proxy_url: 代理地址，None 表示不使用代理
+        """
+        self.pool_size = max(1, int(pool_size or 1))
+        self.proxy_url = proxy_url
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = Lock()
+
+    def configure(
+        self, pool_size: Optional[int] = None, proxy_url: Optional[str] = None
+    ) -> None:
+        """
+        更新连接池配置，配置变化时关闭已有会话，后续请求按新配置重建
+
+        Args:
+            pool_size: 每个主机的最大连接数，None 表示不修改
+            proxy_url: 代理地址，None 表示不修改，空字符串表示取消代理
+        """
+        with self._lock:
+            changed = False
+            if pool_size is not None and max(1, int(pool_size)) != self.pool_size:
+                self.pool_size = max(1, int(pool_size))
+                changed = True
+            if proxy_url is not None and (proxy_url or None) != self.proxy_url:
+                self.proxy_url = proxy_url or None
+                changed = True
+            if changed:
+                self._close_sessions()
+
+    def session_for(self, url: str) -> requests.Session:
+        """
+        获取 URL 所属主机的共享会话
+
+        Args:
+            url: 请求地址
+
+        Returns:
+            该主机的 requests.Session
+        """
+        parsed = urlparse(url)
+        host_key = f"{parsed.scheme}://{parsed.netloc}"
+
+        with self._lock:
+            session = self._sessions.get(host_key)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1, pool_maxsize=self.pool_size
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                if self.proxy_url:
+                    session.proxies = {"http": self.proxy_url, "https": self.proxy_url}
+                self._sessions[host_key] = session
+            return session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """发送请求（参数与 requests.request 一致）"""
+        return self.session_for(url).request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """发送 GET 请求"""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """发送 POST 请求"""
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        """关闭所有会话"""
+        with self._lock:
+            self._close_sessions()
+
+    def get_stats(self) -> dict:
+        """
+        获取连接池统计信息
+
+        Returns:
+            统计信息字典
+        """
+        with self._lock:
+            return {
+                "hosts": sorted(self._sessions.keys()),
+                "pool_size": self.pool_size,
+                "proxy": bool(self.proxy_url),
+            }
+
+    def _close_sessions(self) -> None:
+        for session in self._sessions.values():
+            session.close()
+        self._sessions.clear()
+
+
+# 全局客户端实例
+_global_client = None
+_global_lock = Lock()
+
+
+def get_http_client() -> HttpClient:
+    """
+    获取进程级共享的 HTTP 客户端
+
+    Returns:
+        全局 HttpClient 实例
+    """
+    global _global_client
+    if _global_client is None:
+        with _global_lock:
+            if _global_client is None:
+                _global_client = HttpClient()
+    return _global_client
+
+
+def configure_http_client(
+    pool_size: Optional[int] = None, proxy_url: Optional[str] = None
+) -> HttpClient:
+    """
+    配置并返回全局 HTTP 客户端
+
+    Args:
+        pool_size: 每个主机的最大连接数
+        proxy_url: 代理地址，空字符串表示取消代理
+
+    Returns:
+        全局 HttpClient 实例
+    """
+    client = get_http_client()
+    client.configure(pool_size=pool_size, proxy_url=proxy_url)
+    return client
@@ -0,0 +1,322 @@
+"""
+快照解析缓存
+
+txt 快照写入后不再改变，main.py 和 MCP Server 却会在每次启动后重新解析历史快照。
+这里把每个快照的解析结果以二进制（marshal）形式持久化到 output/<日期>/.parse_cache.bin，
+按 txt 文件的大小和修改时间校验，任意进程都可以直接加载已解析的结构。
+
+缓存文件可能来自归档或他人提交的 output 目录，因此不使用 pickle：marshal 只还原
+str/int/bytes/tuple/list/dict 等数据，加载时不会执行任何代码。
+
+缓存文件结构：
+    MAGIC + marshal({
+        "version": 版本,
+        "byteorder": 字节序,  # 数组按本机字节序保存
+        "strings": [字符串, ...],  # 当天所有快照共用的标题/链接字典，只追加
+        "entries": {文件名: (大小, 修改时间ns, 编码后的快照blob)},
+    })
+
+同一标题在一天内会出现在几十个快照中，每个快照只保存字符串ID（字典编码）：
+    blob = marshal(([(平台ID, 标题ID数组, 排名数组, URL ID数组, MOBILE ID数组), ...], id_to_name, refs,
+                    {平台ID: (基准时间, 新增的四个数组..., 移除的标题ID数组, 排名变化的标题ID数组, 新排名数组)}))
+其中数组为 array('I') 的字节内容。读取时按需解码，同一天的所有快照共享同一个字符串对象；
+返回的字典和列表总是新对象，修改返回值不会污染缓存。
+"""
+
+import gc
+import marshal
+import os
+import sys
+from array import array
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from trendradar.snapshot_parser import PlatformDelta
+
+try:
+    import fcntl
+except ImportError:  # Windows 没有 fcntl，写回时不加锁
+    fcntl = None
+
+PARSE_CACHE_FILE_NAME = ".parse_cache.bin"
+# 写回缓存文件时加锁的旁路文件（与缓存文件同目录）
+PARSE_CACHE_LOCK_NAME = ".parse_cache.lock"
+PARSE_CACHE_MAGIC = b"TRPM"
+# 解析结果的结构变化时递增，旧缓存自动失效
+PARSE_CACHE_VERSION = 4
+
+
+@contextmanager
+def _locked(lock_path: Path):
+    """对旁路锁文件加排他锁，同一天的多个进程依次执行 读取-合并-替换"""
+    if fcntl is None:
+        yield
+        return
+    with open(lock_path, "a") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _uint_array(data: bytes) -> array:
+    values = array("I")
+    values.frombytes(data)
+    return values
+
+
+class ParseCache:
+    """单个日期目录的快照解析缓存，多进程共享同一个缓存文件（加锁合并后原子替换写入）"""
+
+    def __init__(self, cache_path: Path, persist: bool = True):
+        """
+        Args:
+            cache_path: 缓存文件路径（output/<日期>/.parse_cache.bin）
+            persist: 是否读写缓存文件，关闭时仅在进程内缓存
+        """
+        self.cache_path = Path(cache_path)
+        self.persist = persist
+        # 字符串字典：ID -> 字符串，以及按需构建的反向索引
+        self.strings: List[str] = []
+        self._string_ids: Optional[Dict[str, int]] = None
+        # {文件名: (大小, 修改时间ns, blob)}，blob 中的ID指向 self.strings
+        self.entries: Dict[str, Tuple[int, int, bytes]] = {}
+        # 本进程新增、尚未写回磁盘的条目
+        self._dirty: Set[str] = set()
+        self._disk_stamp: Optional[Tuple[int, int]] = None
+        self._refresh()
+
+    def _stat_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.cache_path.stat()
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    @classmethod
+    def from_bytes(cls, cache_path: Path, data: Optional[bytes]) -> "ParseCache":
+        """从缓存文件内容创建只在进程内使用的缓存（如归档中的解析缓存）"""
+        cache = cls(cache_path, persist=False)
+        if data:
+            cache.strings, cache.entries = cache._load(data)
+        return cache
+
+    def _load(self, data: bytes) -> Tuple[List[str], Dict[str, Tuple[int, int, bytes]]]:
+        if not data.startswith(PARSE_CACHE_MAGIC):
+            return [], {}
+        try:
+            payload = marshal.loads(data[len(PARSE_CACHE_MAGIC):])
+        except Exception as e:
+            print(f"解析缓存读取失败，将重新解析: {self.cache_path} ({e})")
+            return [], {}
+        if (
+            not isinstance(payload, dict)
+            or payload.get("version") != PARSE_CACHE_VERSION
+            or payload.get("byteorder") != sys.byteorder
+        ):
+            return [], {}
+        strings = payload.get("strings")
+        entries = payload.get("entries")
+        if not isinstance(strings, list) or not isinstance(entries, dict):
+            return [], {}
+        return strings, entries
+
+    def _read_disk(self) -> Tuple[List[str], Dict[str, Tuple[int, int, bytes]]]:
+        try:
+            with open(self.cache_path, "rb") as f:
+                return self._load(f.read())
+        except OSError:
+            return [], {}
+
+    def _refresh(self) -> None:
+        """缓存文件被其他进程更新过时重新读取，本进程尚未写回的条目按新的字典重新编码"""
+        if not self.persist:
+            return
+        stamp = self._stat_stamp()
+        if stamp is None or stamp == self._disk_stamp:
+            return
+
+        pending = {}
+        for name in self._dirty:
+            size, mtime_ns, blob = self.entries[name]
+            pending[name] = (size, mtime_ns, self._decode(blob))
+        self.strings, self.entries = self._read_disk()
+        self._string_ids = None
+        for name, (size, mtime_ns, parsed) in pending.items():
+            self.entries[name] = (size, mtime_ns, self._encode(parsed))
+        self._disk_stamp = stamp
+
+    def _string_id(self, value: str) -> int:
+        string_ids = self._string_ids
+        if string_ids is None:
+            string_ids = self._string_ids = {
+                string: index for index, string in enumerate(self.strings)
+            }
+        index = string_ids.get(value)
+        if index is None:
+            index = string_ids[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+    def _encode_titles(self, titles: Dict) -> Tuple[array, array, array, array]:
+        """{title: {ranks, url, mobileUrl}} -> (标题ID, 排名, URL ID, MOBILE ID) 四个数组"""
+        string_id = self._string_id
+        title_ids = array("I")
+        ranks = array("I")
+        url_ids = array("I")
+        mobile_ids = array("I")
+        for title, info in titles.items():
+            title_ids.append(string_id(title))
+            ranks.append(info["ranks"][0])
+            url_ids.append(string_id(info["url"]))
+            mobile_ids.append(string_id(info["mobileUrl"]))
+        return title_ids, ranks, url_ids, mobile_ids
+
+    def _decode_titles(self, title_ids, ranks, url_ids, mobile_ids) -> Dict:
+        strings = self.strings
+        return {
+            strings[title_id]: {
+                "ranks": [rank],
+                "url": strings[url_id],
+                "mobileUrl": strings[mobile_id],
+            }
+            for title_id, rank, url_id, mobile_id in zip(
+                title_ids, ranks, url_ids, mobile_ids
+            )
+        }
+
+    def _encode(self, parsed: Tuple[Dict, Dict, Dict, Dict]) -> bytes:
+        """把 (titles_by_id, id_to_name, refs, deltas) 编码为 blob（解析结果中每个标题只有一个排名）"""
+        titles_by_id, id_to_name, refs, deltas = parsed
+        string_id = self._string_id
+        platforms = [
+            (platform_id, *map(array.tobytes, self._encode_titles(titles)))
+            for platform_id, titles in titles_by_id.items()
+        ]
+        encoded_deltas = {
+            platform_id: (
+                delta.base_time,
+                *map(array.tobytes, self._encode_titles(delta.added)),
+                array("I", map(string_id, delta.removed)).tobytes(),
+                array("I", map(string_id, delta.moved)).tobytes(),
+                array("I", delta.moved.values()).tobytes(),
+            )
+            for platform_id, delta in deltas.items()
+        }
+        return marshal.dumps((platforms, id_to_name, refs, encoded_deltas))
+
+    def _decode(self, blob: bytes) -> Tuple[Dict, Dict, Dict, Dict]:
+        platforms, id_to_name, refs, encoded_deltas = marshal.loads(blob)
+        strings = self.strings
+        titles_by_id = {
+            sys.intern(platform_id): self._decode_titles(*map(_uint_array, columns))
+            for platform_id, *columns in platforms
+        }
+        deltas = {}
+        for platform_id, encoded in encoded_deltas.items():
+            base_time = encoded[0]
+            removed_ids, moved_ids, moved_ranks = map(_uint_array, encoded[5:])
+            deltas[platform_id] = PlatformDelta(
+                base_time,
+                self._decode_titles(*map(_uint_array, encoded[1:5])),
+                [strings[title_id] for title_id in removed_ids],
+                {
+                    strings[title_id]: rank
+                    for title_id, rank in zip(moved_ids, moved_ranks)
+                },
+            )
+        return titles_by_id, id_to_name, refs, deltas
+
+    def get(self, name: str, size: int, mtime_ns: int):
+        """
+        读取缓存的解析结果
+
+        Args:
+            name: 快照文件名
+            size: 快照文件当前大小
+            mtime_ns: 快照文件当前修改时间（纳秒）
+
+        Returns:
+            (titles_by_id, id_to_name, refs, deltas)（新对象，字符串在同一天内共享），
+            缓存不存在或已失效时返回 None
+        """
+        entry = self.entries.get(name)
+        if entry is None or entry[:2] != (size, mtime_ns):
+            self._refresh()
+            entry = self.entries.get(name)
+            if entry is None or entry[:2] != (size, mtime_ns):
+                return None
+
+        # 解码只产生不含循环引用的 dict/list，暂停 GC 避免大量分配触发无意义的分代回收
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return self._decode(entry[2])
+        except Exception as e:
+            print(f"解析缓存条目损坏，将重新解析: {self.cache_path}:{name} ({e})")
+            return None
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def put(
+        self, name: str, size: int, mtime_ns: int, parsed: Tuple[Dict, Dict, Dict, Dict]
+    ) -> None:
+        """记录解析结果 (titles_by_id, id_to_name, refs, deltas)（调用 save 后写入磁盘）"""
+        self.entries[name] = (size, mtime_ns, self._encode(parsed))
+        self._dirty.add(name)
+
+    def save(self) -> None:
+        """把新增的条目写回缓存文件，合并其他进程写入的内容，并清理已删除快照的条目"""
+        if not self._dirty or not self.persist:
+            return
+        try:
+            with _locked(self.cache_path.with_name(PARSE_CACHE_LOCK_NAME)):
+                self._merge_and_write()
+        except OSError as e:
+            # 输出目录只读等情况下只在内存中缓存
+            print(f"解析缓存写入失败: {self.cache_path} ({e})")
+
+    def _merge_and_write(self) -> None:
+        """读取其他进程已写入的内容并合并本进程新增的条目后替换缓存文件（调用方持有锁）"""
+        self._refresh()
+
+        txt_dir = self.cache_path.parent / "txt"
+        try:
+            existing = set(os.listdir(txt_dir))
+        except OSError:
+            existing = set(self.entries)
+        entries = {
+            name: entry for name, entry in self.entries.items() if name in existing
+        }
+
+        tmp_path = self.cache_path.with_name(
+            f"{self.cache_path.name}.{os.getpid()}.tmp"
+        )
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(PARSE_CACHE_MAGIC)
+                marshal.dump(
+                    {
+                        "version": PARSE_CACHE_VERSION,
+                        "byteorder": sys.byteorder,
+                        "strings": self.strings,
+                        "entries": entries,
+                    },
+                    f,
+                )
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            # 输出目录只读等情况下只在内存中缓存
+            print(f"解析缓存写入失败: {self.cache_path} ({e})")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            return
+
+        self.entries = entries
+        self._disk_stamp = self._stat_stamp()
+        self._dirty.clear()
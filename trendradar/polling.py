@@ -0,0 +1,139 @@
+"""
+自适应轮询
+
+按平台记录相邻两次抓取之间的标题更替率，在配置的上下限内调整各平台的抓取间隔：
+更替频繁的榜单（微博、抖音）保持高频抓取，几乎不变的榜单逐步降低频率。
+未到期的平台沿用上一次的抓取结果，保证快照与下游统计口径不变：沿用的结果按本轮出现写入快照，
+当日聚合中这些标题的最后出现时间与出现次数照常推进（与每轮都抓取、榜单未变化时相同），
+当前榜单模式也不会因平台本轮未抓取而漏掉它的标题。
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+from typing import Dict, Optional
+
+
+class AdaptivePoller:
+    """按平台更替率调整抓取间隔的轮询调度器，状态持久化到 JSON 文件"""
+
+    STATE_VERSION = 1
+
+    def __init__(
+        self,
+        state_path: str,
+        min_interval: int = 30,
+        max_interval: int = 180,
+        high_turnover: float = 0.3,
+        low_turnover: float = 0.05,
+        smoothing: float = 0.5,
+    ):
+        """
+        初始化轮询调度器
+
+        Args:
+            state_path: 状态文件路径
+            min_interval: 最小抓取间隔（分钟），应与定时任务的执行间隔一致
+            max_interval: 最大抓取间隔（分钟）
+            high_turnover: 更替率高于该值时间隔减半
+            low_turnover: 更替率低于该值时间隔加倍
+            smoothing: 更替率指数平滑系数（越大越看重最近一次）
+        """
+        self.state_path = Path(state_path)
+        self.min_interval = max(1, int(min_interval))
+        self.max_interval = max(self.min_interval, int(max_interval))
+        self.high_turnover = high_turnover
+        self.low_turnover = low_turnover
+        self.smoothing = smoothing
+        self.platforms: Dict[str, Dict] = {}
+        self._lock = Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.state_path.exists():
+            return
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == self.STATE_VERSION:
+                self.platforms = data.get("platforms", {})
+        except (OSError, ValueError) as e:
+            print(f"自适应轮询状态读取失败，将重新统计: {e}")
+            self.platforms = {}
+
+    def save(self) -> None:
+        """原子写入状态文件"""
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(".tmp")
+        with self._lock:
+            payload = {"version": self.STATE_VERSION, "platforms": self.platforms}
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+        os.replace(tmp_path, self.state_path)
+
+    def get_interval(self, platform_id: str) -> int:
+        """当前抓取间隔（分钟），未记录过的平台使用最小间隔"""
+        state = self.platforms.get(platform_id)
+        return state["interval"] if state else self.min_interval
+
+    def is_due(self, platform_id: str, now: datetime) -> bool:
+        """判断平台本轮是否需要抓取"""
+        state = self.platforms.get(platform_id)
+        if not state or not state.get("results"):
+            return True
+        try:
+            last_crawl = datetime.fromisoformat(state["last_crawl"])
+        except (KeyError, ValueError):
+            return True
+
+        elapsed = (now - last_crawl).total_seconds() / 60
+        # 定时任务按最小间隔触发，允许半个最小间隔的误差，避免因执行耗时错过一轮
+        return elapsed >= state["interval"] - self.min_interval / 2
+
+    def get_last_results(self, platform_id: str) -> Optional[Dict]:
+        """平台上一次成功抓取的结果，用于未到期平台沿用"""
+        state = self.platforms.get(platform_id)
+        return state.get("results") if state else None
+
+    def record(self, platform_id: str, results: Dict, now: datetime) -> float:
+        """
+        记录一次成功抓取，更新更替率与抓取间隔
+
+        Args:
+            platform_id: 平台ID
+            results: 本次抓取结果 {标题: {"ranks": [...], "url": ..., "mobileUrl": ...}}
+            now: 抓取时间
+
+        Returns:
+            平滑后的更替率
+        """
+        with self._lock:
+            state = self.platforms.get(platform_id)
+            previous_titles = set(state["results"]) if state and state.get("results") else None
+            current_titles = set(results)
+
+            if previous_titles is None:
+                turnover = 1.0
+                interval = self.min_interval
+            else:
+                new_count = len(current_titles - previous_titles)
+                raw_turnover = new_count / max(len(current_titles), 1)
+                turnover = (
+                    self.smoothing * raw_turnover
+                    + (1 - self.smoothing) * state.get("turnover", raw_turnover)
+                )
+                interval = state["interval"]
+                if turnover >= self.high_turnover:
+                    interval = max(self.min_interval, interval // 2)
+                elif turnover <= self.low_turnover:
+                    interval = min(self.max_interval, interval * 2)
+
+            self.platforms[platform_id] = {
+                "interval": interval,
+                "turnover": round(turnover, 4),
+                "last_crawl": now.isoformat(),
+                "results": results,
+            }
+            return turnover
@@ -0,0 +1,172 @@
+"""
+标题记录
+
+当日聚合（main.py）和 MCP Server 的日数据缓存中，每个标题用一个 TitleRecord 保存，
+取代 {"ranks": [...], "url": ..., "mobileUrl": ..., "first_time": ..., ...} 形式的嵌套字典：
+
+- __slots__，没有实例字典
+- 排名存为 array('H')（每个排名 2 字节）
+- 首次/最后出现时间存为当天的分钟数（"08时35分" -> 515）
+- 平台ID、标题和链接经 sys.intern 驻留，多天、多快照之间共享同一个字符串对象
+
+记录支持按旧字典的键只读访问（record["ranks"]、record.get("url", "")），
+返回的都是 list/str/int 等普通类型，报告渲染和 MCP 工具无需改动；
+可访问的键与 to_dict() 的输出一致（没有时间信息时不含 first_time/last_time/count）。
+需要写入 JSON 时统一通过 to_dict() 转换。
+"""
+
+import re
+import sys
+from array import array
+from typing import Dict, Iterable, Union
+
+TIME_PATTERN = re.compile(r"^(\d{2})时(\d{2})分$")
+
+# 没有时间信息（如 MCP 合并的日数据）
+NO_TIME = -1
+
+TimeValue = Union[int, str]
+
+intern = sys.intern
+
+
+def encode_time(time_info: str) -> TimeValue:
+    """把 "HH时MM分" 转为当天的分钟数，不符合格式的时间原样保留"""
+    if not time_info:
+        return NO_TIME
+    match = TIME_PATTERN.match(time_info)
+    if not match:
+        return time_info
+    return int(match.group(1)) * 60 + int(match.group(2))
+
+
+def decode_time(value: TimeValue) -> str:
+    """encode_time 的逆操作，没有时间时返回空字符串"""
+    if isinstance(value, str):
+        return value
+    if value == NO_TIME:
+        return ""
+    return f"{value // 60:02d}时{value % 60:02d}分"
+
+
+class TitleRecord:
+    """单个标题在一段时间内的汇总信息
+
+    按字典键访问是只读的：record["ranks"] 返回排名的副本，修改副本不会影响记录，
+    修改记录需通过 add_ranks / fill_urls 或直接修改属性。记录可变且按内容比较，因此不可哈希。
+    """
+
+    __slots__ = ("ranks", "url", "mobile_url", "first_time", "last_time", "count")
+
+    def __init__(
+        self,
+        ranks: Iterable[int] = (),
+        url: str = "",
+        mobile_url: str = "",
+        first_time: TimeValue = NO_TIME,
+        last_time: TimeValue = NO_TIME,
+        count: int = 0,
+    ):
+        self.ranks = array("H", ranks)
+        self.url = url
+        self.mobile_url = mobile_url
+        self.first_time = first_time
+        self.last_time = last_time
+        self.count = count
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TitleRecord":
+        """从旧的字典结构（快照解析结果或 to_dict 的输出）创建记录"""
+        return cls(
+            data.get("ranks") or (),
+            data.get("url", "") or "",
+            data.get("mobileUrl", "") or "",
+            encode_time(data.get("first_time", "")),
+            encode_time(data.get("last_time", "")),
+            data.get("count", 0),
+        )
+
+    def add_ranks(self, ranks: Iterable[int], unique: bool = False) -> None:
+        """追加排名；unique 为 True 时跳过已有的排名"""
+        if unique:
+            for rank in ranks:
+                if rank not in self.ranks:
+                    self.ranks.append(rank)
+        else:
+            self.ranks.extend(ranks)
+
+    def fill_urls(self, url: str, mobile_url: str) -> None:
+        """链接为空时用新的链接补全"""
+        if not self.url:
+            self.url = url
+        if not self.mobile_url:
+            self.mobile_url = mobile_url
+
+    def to_dict(self) -> Dict:
+        """转为字典（JSON/MCP 输出边界使用），没有时间信息时不包含时间与次数字段"""
+        data = {
+            "ranks": self.ranks.tolist(),
+            "url": self.url,
+            "mobileUrl": self.mobile_url,
+        }
+        if self.first_time != NO_TIME:
+            data["first_time"] = decode_time(self.first_time)
+            data["last_time"] = decode_time(self.last_time)
+            data["count"] = self.count
+        return data
+
+    def to_row(self) -> list:
+        """紧凑的列表形式（当日聚合 JSON 使用），时间保持分钟数"""
+        return [
+            self.ranks.tolist(),
+            self.url,
+            self.mobile_url,
+            self.first_time,
+            self.last_time,
+            self.count,
+        ]
+
+    @classmethod
+    def from_row(cls, row: list) -> "TitleRecord":
+        """to_row 的逆操作（链接驻留）"""
+        ranks, url, mobile_url, first_time, last_time, count = row
+        return cls(ranks, intern(url), intern(mobile_url), first_time, last_time, count)
+
+    # 按旧字典的键只读访问，可访问的键与 to_dict() 一致
+    def __getitem__(self, key: str):
+        if key == "ranks":
+            return self.ranks.tolist()
+        if key == "url":
+            return self.url
+        if key == "mobileUrl":
+            return self.mobile_url
+        if self.first_time != NO_TIME:
+            if key == "first_time":
+                return decode_time(self.first_time)
+            if key == "last_time":
+                return decode_time(self.last_time)
+            if key == "count":
+                return self.count
+        raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        if key in ("ranks", "url", "mobileUrl"):
+            return True
+        return self.first_time != NO_TIME and key in ("first_time", "last_time", "count")
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, TitleRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"TitleRecord({self.to_dict()!r})"
+
@@ -0,0 +1,106 @@
+"""
+报告数据
+
+每次爬取生成的报告不再直接写成完整的 HTML（内联 CSS/JS，每个几十 KB，大多数从未被打开），
+而是把渲染所需的结构化数据（prepare_report_data 的输出及渲染参数）压缩保存为
+output/<日期>/reports/<时间>.json.gz，HTML 只在需要时渲染：
+- 汇总报告和 index.html 仍在每次运行时生成
+- 邮件正文在发送时从报告数据渲染（不落盘）
+- 本地打开或通过 python main.py --serve 的查看器按请求渲染
+
+已归档日期（见 trendradar.archive）中的报告数据同样可以直接读取。
+"""
+
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from trendradar.archive import DayArchive, get_archive_path
+
+REPORTS_DIR = "reports"
+REPORT_DATA_SUFFIX = ".json.gz"
+REPORT_DATA_VERSION = 1
+
+
+def is_report_data_path(path: str) -> bool:
+    return str(path).endswith(REPORT_DATA_SUFFIX)
+
+
+def save_report_data(file_path: str, payload: Dict) -> None:
+    """原子写入报告数据"""
+    path = Path(file_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = json.dumps(
+        {"version": REPORT_DATA_VERSION, **payload},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        # mtime=0 使内容相同的报告数据字节一致
+        f.write(gzip.compress(data, compresslevel=6, mtime=0))
+    os.replace(tmp_path, path)
+
+
+def decode_report_data(raw: bytes) -> Dict:
+    payload = json.loads(gzip.decompress(raw).decode("utf-8"))
+    if payload.get("version") != REPORT_DATA_VERSION:
+        raise ValueError(f"不支持的报告数据版本: {payload.get('version')}")
+    return payload
+
+
+def load_report_data(file_path: str) -> Dict:
+    with open(file_path, "rb") as f:
+        return decode_report_data(f.read())
+
+
+class ReportStore:
+    """按日期读取报告文件（HTML、报告数据、音频），日期目录不存在时从归档中读取"""
+
+    def __init__(self, output_dir: str = "output"):
+        self.output_dir = Path(output_dir)
+
+    def _archive(self, date_folder: str) -> Optional[DayArchive]:
+        archive_path = get_archive_path(self.output_dir, date_folder)
+        if not archive_path.exists():
+            return None
+        return DayArchive(archive_path)
+
+    def read(self, date_folder: str, sub_dir: str, name: str) -> Optional[bytes]:
+        """读取 output/<日期>/<子目录>/<文件名>，不存在时返回 None"""
+        path = self.output_dir / date_folder / sub_dir / name
+        if path.is_file():
+            return path.read_bytes()
+        archive = self._archive(date_folder)
+        if archive is None:
+            return None
+        try:
+            return archive.read(f"{sub_dir}/{name}")
+        except FileNotFoundError:
+            return None
+
+    def list_files(self, date_folder: str, sub_dir: str) -> List[str]:
+        directory = self.output_dir / date_folder / sub_dir
+        names = set()
+        if directory.is_dir():
+            names.update(path.name for path in directory.iterdir() if path.is_file())
+        archive = self._archive(date_folder)
+        if archive is not None:
+            names.update(archive.list_files(sub_dir))
+        return sorted(names)
+
+    def list_reports(self, date_folder: str) -> List[str]:
+        """某天的报告名（不含扩展名）：已生成的 HTML 与只保存了报告数据的报告"""
+        names = {
+            name[: -len(".html")]
+            for name in self.list_files(date_folder, "html")
+            if name.endswith(".html")
+        }
+        names.update(
+            name[: -len(REPORT_DATA_SUFFIX)]
+            for name in self.list_files(date_folder, REPORTS_DIR)
+            if name.endswith(REPORT_DATA_SUFFIX)
+        )
+        return sorted(names)
@@ -0,0 +1,130 @@
+"""
+本地报告查看器
+
+python main.py --serve 启动，按请求渲染报告：
+
+    /                               日期列表
+    /<日期>/                        当天的报告列表
+    /<日期>/html/<时间>.html         已生成的 HTML，或由报告数据即时渲染
+    /<日期>/audio/<文件>             播客音频（报告中的 ../audio/ 相对链接）
+
+只读访问 output 目录（包括已归档的日期），不写入任何文件。
+"""
+
+import html
+import re
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional, Tuple
+from urllib.parse import quote, unquote, urlsplit
+
+from trendradar.report_store import (
+    REPORT_DATA_SUFFIX,
+    REPORTS_DIR,
+    ReportStore,
+    decode_report_data,
+)
+from trendradar.storage import DATE_FOLDER_PATTERN, TxtSnapshotStorage
+
+# 文件名只允许单层路径
+SAFE_NAME_PATTERN = re.compile(r"^[^/\\]+$")
+
+CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".mp3": "audio/mpeg",
+}
+
+
+def _page(title: str, items) -> bytes:
+    links = "\n".join(
+        f'<li><a href="{quote(href)}">{html.escape(text)}</a></li>' for href, text in items
+    )
+    return (
+        f'<!DOCTYPE html><html><head><meta charset="UTF-8"><title>{html.escape(title)}</title>'
+        f"</head><body><h1>{html.escape(title)}</h1><ul>{links}</ul></body></html>"
+    ).encode("utf-8")
+
+
+class ReportViewer:
+    """把请求路径映射为报告内容，render 由 main.py 提供（报告数据 -> HTML）"""
+
+    def __init__(self, output_dir: str, render: Callable[[Dict], str]):
+        self.store = ReportStore(output_dir)
+        self.storage = TxtSnapshotStorage(output_dir, parse_cache=False)
+        self.render = render
+
+    def handle(self, path: str) -> Optional[Tuple[str, bytes]]:
+        """返回 (Content-Type, 内容)，路径无效或文件不存在时返回 None"""
+        parts = [unquote(part) for part in urlsplit(path).path.split("/") if part]
+        if not parts:
+            return CONTENT_TYPES[".html"], _page(
+                "TrendRadar 报告",
+                [(f"/{date}/", date) for date in reversed(self.storage.list_dates())],
+            )
+
+        date_folder = parts[0]
+        if not DATE_FOLDER_PATTERN.match(date_folder):
+            return None
+        if len(parts) == 1:
+            reports = self.store.list_reports(date_folder)
+            if not reports:
+                return None
+            return CONTENT_TYPES[".html"], _page(
+                date_folder,
+                [(f"/{date_folder}/html/{name}.html", name) for name in reports],
+            )
+
+        if len(parts) != 3 or not SAFE_NAME_PATTERN.match(parts[2]):
+            return None
+        sub_dir, name = parts[1], parts[2]
+        suffix = name[name.rfind("."):] if "." in name else ""
+        if sub_dir == "audio":
+            content = self.store.read(date_folder, sub_dir, name)
+        elif sub_dir == "html" and suffix == ".html":
+            content = self.store.read(date_folder, sub_dir, name)
+            if content is None:
+                raw = self.store.read(
+                    date_folder, REPORTS_DIR, name[: -len(".html")] + REPORT_DATA_SUFFIX
+                )
+                if raw is not None:
+                    content = self.render(decode_report_data(raw)).encode("utf-8")
+        else:
+            return None
+        if content is None:
+            return None
+        return CONTENT_TYPES.get(suffix, "application/octet-stream"), content
+
+
+def serve_reports(
+    output_dir: str, render: Callable[[Dict], str], host: str = "127.0.0.1", port: int = 8080
+) -> None:
+    """启动查看器（阻塞直到 Ctrl+C）"""
+    viewer = ReportViewer(output_dir, render)
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            try:
+                result = viewer.handle(self.path)
+            except Exception as e:
+                self.send_error(500, str(e))
+                return
+            if result is None:
+                self.send_error(404)
+                return
+            content_type, content = result
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    print(f"报告查看器已启动: http://{host}:{port}/ （Ctrl+C 退出）")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
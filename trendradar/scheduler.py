@@ -0,0 +1,127 @@
+"""
+进程内定时调度
+
+解析标准 5 段 cron 表达式（分 时 日 月 周），供常驻模式（main.py --daemon）
+在进程内按与 supercronic 相同的 CRON_SCHEDULE 计算下一次执行时间。
+"""
+
+from datetime import datetime, timedelta
+from typing import List, Set
+
+CRON_ALIASES = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+
+MONTH_NAMES = {
+    name: index
+    for index, name in enumerate(
+        ["jan", "feb", "mar", "apr", "may", "jun",
+         "jul", "aug", "sep", "oct", "nov", "dec"],
+        start=1,
+    )
+}
+WEEKDAY_NAMES = {
+    name: index
+    for index, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])
+}
+
+
+class CronSchedule:
+    """5 段 cron 表达式，支持 *、*/n、a-b、a-b/n、逗号列表、月份/星期英文缩写与 @hourly 等别名"""
+
+    def __init__(self, expression: str):
+        self.expression = expression.strip()
+        fields = CRON_ALIASES.get(self.expression.lower(), self.expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"cron 表达式需要 5 段（分 时 日 月 周）: {expression}")
+
+        self.minutes = self._parse_field(fields[0], 0, 59)
+        self.hours = self._parse_field(fields[1], 0, 23)
+        self.days = self._parse_field(fields[2], 1, 31)
+        self.months = self._parse_field(fields[3], 1, 12, MONTH_NAMES)
+        weekdays = self._parse_field(fields[4], 0, 7, WEEKDAY_NAMES)
+        # 0 和 7 都表示周日
+        self.weekdays = {day % 7 for day in weekdays}
+
+        # 与 cron 一致：日和周都被限制时，满足其一即可
+        self.days_restricted = fields[2] != "*"
+        self.weekdays_restricted = fields[4] != "*"
+
+    @staticmethod
+    def _parse_value(value: str, names: dict) -> int:
+        value = value.lower()
+        if value in names:
+            return names[value]
+        return int(value)
+
+    def _parse_field(
+        self, field: str, min_value: int, max_value: int, names: dict = None
+    ) -> Set[int]:
+        names = names or {}
+        values: Set[int] = set()
+        for part in field.split(","):
+            step = 1
+            if "/" in part:
+                part, step_text = part.split("/", 1)
+                step = int(step_text)
+                if step <= 0:
+                    raise ValueError(f"cron 步长必须为正整数: {field}")
+
+            if part == "*":
+                start, end = min_value, max_value
+            elif "-" in part:
+                start_text, end_text = part.split("-", 1)
+                start = self._parse_value(start_text, names)
+                end = self._parse_value(end_text, names)
+            else:
+                start = self._parse_value(part, names)
+                # 形如 5/15 表示从 5 开始每 15 个单位
+                end = max_value if step > 1 else start
+
+            if start < min_value or end > max_value or start > end:
+                raise ValueError(f"cron 字段超出范围 [{min_value}-{max_value}]: {field}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        # Python 的 weekday() 周一为 0，cron 周日为 0
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self.days_restricted and self.weekdays_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_run(self, after: datetime) -> datetime:
+        """返回严格晚于 after 的下一次执行时间（精确到分钟，保留 after 的时区）"""
+        moment = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        # 最多向后查找 5 年，防止 2 月 30 日这类永远不会触发的表达式陷入死循环
+        limit = moment + timedelta(days=366 * 5)
+
+        while moment <= limit:
+            if moment.month not in self.months or not self._day_matches(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+                continue
+            if moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+                continue
+            return moment
+
+        raise ValueError(f"cron 表达式没有可执行的时间: {self.expression}")
+
+    def upcoming(self, after: datetime, count: int = 3) -> List[datetime]:
+        """返回接下来的若干次执行时间，便于启动时打印确认"""
+        runs = []
+        moment = after
+        for _ in range(count):
+            moment = self.next_run(moment)
+            runs.append(moment)
+        return runs
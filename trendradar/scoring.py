@@ -0,0 +1,155 @@
+"""
+新闻权重批量计算
+
+main.py 的报告排序与 MCP Server 的按权重排序共用同一个权重公式：
+
+    权重 = 排名权重 × rank_weight + 频次权重 × frequency_weight + 热度加成 × hotness_weight
+    - 排名权重：Σ(11 - min(rank, 10)) / 出现次数
+    - 频次权重：min(出现次数, 10) × 10
+    - 热度加成：高排名次数 / 总出现次数 × 100
+
+没有排名的条目权重为 0，未提供 count 时以 len(ranks) 代替。
+
+批量计算时所有条目的 ranks 拼接为一个数组，另用 offsets 记录每个条目的起止位置（CSR 形式），
+安装了 NumPy 且条目较多时一次向量化计算全部权重，否则逐条计算；两种方式的运算顺序相同，
+结果逐位一致。NumPy 为可选依赖。
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # 可选依赖
+    np = None
+
+# 条目数不少于该值时使用 NumPy（条目很少时数组转换的开销大于收益）
+NUMPY_MIN_ITEMS = 256
+
+
+def has_numpy() -> bool:
+    return np is not None
+
+
+def pack_ranks(items: Sequence[Dict]) -> Tuple[List[int], List[int], List[int]]:
+    """
+    把各条目的 ranks 拼接为 CSR 形式
+
+    Returns:
+        (ranks, offsets, counts)：第 i 个条目的排名为 ranks[offsets[i]:offsets[i + 1]]，
+        offsets 长度为条目数 + 1
+    """
+    ranks: List[int] = []
+    offsets = [0]
+    counts = []
+    for item in items:
+        item_ranks = item.get("ranks") or ()
+        ranks.extend(item_ranks)
+        offsets.append(len(ranks))
+        counts.append(item.get("count", len(item_ranks)))
+    return ranks, offsets, counts
+
+
+def score_packed(
+    ranks: Sequence[int],
+    offsets: Sequence[int],
+    counts: Sequence[int],
+    rank_threshold: int,
+    rank_weight: float,
+    frequency_weight: float,
+    hotness_weight: float,
+    use_numpy: Optional[bool] = None,
+) -> List[float]:
+    """
+    计算 CSR 形式的全部条目的权重
+
+    Args:
+        ranks: 拼接后的排名
+        offsets: 各条目在 ranks 中的起始位置（最后一个元素为 ranks 的长度）
+        counts: 各条目的出现次数
+        rank_threshold: 高排名阈值
+        rank_weight / frequency_weight / hotness_weight: 三项的权重系数
+        use_numpy: 是否使用 NumPy，默认在可用且条目足够多时使用
+
+    Returns:
+        各条目的权重
+    """
+    item_count = len(offsets) - 1
+    if use_numpy is None:
+        use_numpy = np is not None and item_count >= NUMPY_MIN_ITEMS
+    if use_numpy:
+        if np is None:
+            raise RuntimeError("未安装 NumPy")
+        return _score_packed_numpy(
+            ranks, offsets, counts, rank_threshold, rank_weight, frequency_weight, hotness_weight
+        )
+
+    weights = []
+    for index in range(item_count):
+        start, end = offsets[index], offsets[index + 1]
+        rank_total = end - start
+        if not rank_total:
+            weights.append(0.0)
+            continue
+        rank_score = 0
+        high_rank_count = 0
+        for position in range(start, end):
+            rank = ranks[position]
+            rank_score += 11 - (rank if rank < 10 else 10)
+            if rank <= rank_threshold:
+                high_rank_count += 1
+        weights.append(
+            rank_score / rank_total * rank_weight
+            + min(counts[index], 10) * 10 * frequency_weight
+            + high_rank_count / rank_total * 100 * hotness_weight
+        )
+    return weights
+
+
+def _score_packed_numpy(
+    ranks, offsets, counts, rank_threshold, rank_weight, frequency_weight, hotness_weight
+) -> List[float]:
+    rank_array = np.asarray(ranks, dtype=np.int64)
+    offset_array = np.asarray(offsets, dtype=np.int64)
+    count_array = np.asarray(counts, dtype=np.int64)
+
+    # 按条目求和：前缀和在条目边界处相减（空条目得到 0）
+    score_prefix = np.zeros(len(rank_array) + 1, dtype=np.int64)
+    np.cumsum(11 - np.minimum(rank_array, 10), out=score_prefix[1:])
+    high_prefix = np.zeros(len(rank_array) + 1, dtype=np.int64)
+    np.cumsum(rank_array <= rank_threshold, out=high_prefix[1:])
+    starts, ends = offset_array[:-1], offset_array[1:]
+    rank_scores = score_prefix[ends] - score_prefix[starts]
+    high_rank_counts = high_prefix[ends] - high_prefix[starts]
+    rank_totals = ends - starts
+
+    # 与逐条计算相同的运算顺序（整数相除后再乘系数），保证结果逐位一致
+    nonempty = rank_totals > 0
+    safe_totals = np.where(nonempty, rank_totals, 1)
+    weights = (
+        rank_scores / safe_totals * rank_weight
+        + np.minimum(count_array, 10) * 10 * frequency_weight
+        + high_rank_counts / safe_totals * 100 * hotness_weight
+    )
+    return np.where(nonempty, weights, 0.0).tolist()
+
+
+def calculate_weights(
+    items: Sequence[Dict],
+    rank_threshold: int,
+    rank_weight: float,
+    frequency_weight: float,
+    hotness_weight: float,
+    use_numpy: Optional[bool] = None,
+) -> List[float]:
+    """批量计算条目（含 ranks、可选 count 字段的字典）的权重"""
+    ranks, offsets, counts = pack_ranks(items)
+    return score_packed(
+        ranks,
+        offsets,
+        counts,
+        rank_threshold,
+        rank_weight,
+        frequency_weight,
+        hotness_weight,
+        use_numpy,
+    )
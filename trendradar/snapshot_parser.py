@@ -0,0 +1,221 @@
+"""
+快照解析
+
+txt 快照格式的唯一解析实现，main.py、MCP Server、播客脚本共用：
+
+    platform_id | 平台名称
+    1. 标题 [URL:链接] [MOBILE:移动端链接]
+    2. 标题
+    @ref 08时35分            （内容与该快照相同，由存储层展开）
+
+    platform_id | 平台名称
+    @delta 08时35分          （相对该快照的变化，由存储层展开）
+    - 下榜的标题
+    ~ 3. 排名变化的标题
+    + 5. 新上榜或链接变化的标题 [URL:链接] [MOBILE:移动端链接]
+
+    ==== 以下ID请求失败 ====
+    platform_id
+
+每个标题行只用一个预编译的正则做一次 fullmatch，同时取出排名、标题、URL 和 MOBILE。
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+FAILED_SECTION_MARKER = "==== 以下ID请求失败 ===="
+REF_LINE_PREFIX = "@ref "
+DELTA_LINE_PREFIX = "@delta "
+# 增量段中各行的前缀：新增/更新、移除、排名变化
+DELTA_ADDED_PREFIX = "+ "
+DELTA_REMOVED_PREFIX = "- "
+DELTA_MOVED_PREFIX = "~ "
+
+# 排名（可选） + 标题 + [URL:...]（可选） + [MOBILE:...]（可选）
+# 标题按不含空格的片段整段匹配，只在空格处检查后面是否是链接标记，避免逐字符回溯
+TITLE_LINE_PATTERN = re.compile(
+    r"(?:(\d+)\. )?((?:[^ ]+| (?!\[(?:URL|MOBILE):))*)"
+    r"(?: \[URL:([^\]]*)\])?(?: \[MOBILE:([^\]]*)\])?",
+    re.DOTALL,
+)
+# 链接中包含 "]" 等少见情况使用的完整匹配（与旧版 rsplit 语义一致）
+TITLE_LINE_FALLBACK_PATTERN = re.compile(
+    r"(?:(\d+)\. )?(.*?)(?: \[URL:(.*?)\])?(?: \[MOBILE:(.*?)\])?", re.DOTALL
+)
+
+
+class PlatformDelta(NamedTuple):
+    """单个平台相对基准快照的变化"""
+
+    base_time: str  # 基准快照时间
+    added: Dict[str, Dict]  # 新上榜或链接变化的标题 {title: {ranks, url, mobileUrl}}
+    removed: List[str]  # 下榜的标题
+    moved: Dict[str, int]  # 只有排名变化的标题 {title: 新排名}
+
+
+def clean_title(title: str) -> str:
+    """清理标题中的特殊字符（连续空白合并为一个空格并去除首尾空白）"""
+    if not isinstance(title, str):
+        title = str(title)
+    # str.split() 与正则 \s 的空白定义相同，比 re.sub 快数倍
+    return " ".join(title.split())
+
+
+def iter_sections(content: str):
+    """
+    按平台分段遍历快照，跳过失败平台段
+
+    Yields:
+        (platform_id, platform_name, body_lines)，没有名称时 platform_name 等于 platform_id
+    """
+    for section in content.split("\n\n"):
+        if not section.strip() or FAILED_SECTION_MARKER in section:
+            continue
+
+        lines = section.strip().split("\n")
+        if len(lines) < 2:
+            continue
+
+        # id | name 或 id
+        header_line = lines[0].strip()
+        if " | " in header_line:
+            source_id, name = header_line.split(" | ", 1)
+            source_id = source_id.strip()
+            name = name.strip()
+        else:
+            source_id = name = header_line
+
+        yield source_id, name, lines[1:]
+
+
+def _parse_title_line(line: str) -> Tuple[Optional[str], str, str, str]:
+    """解析标题行，返回 (排名字符串, 清理后的标题, url, mobile_url)"""
+    match = TITLE_LINE_PATTERN.fullmatch(line) or TITLE_LINE_FALLBACK_PATTERN.fullmatch(line)
+    rank_str, title, url, mobile_url = match.groups()
+    return rank_str, " ".join(title.split()), url or "", mobile_url or ""
+
+
+def parse_delta_lines(base_time: str, lines: List[str]) -> PlatformDelta:
+    """解析增量段中 @delta 行之后的内容"""
+    delta = PlatformDelta(base_time, {}, [], {})
+    for line in lines:
+        line = line.strip()
+        if line.startswith(DELTA_REMOVED_PREFIX):
+            delta.removed.append(" ".join(line[2:].split()))
+        elif line.startswith(DELTA_MOVED_PREFIX):
+            rank_str, title, _, _ = _parse_title_line(line[2:])
+            delta.moved[title] = int(rank_str) if rank_str else 1
+        elif line.startswith(DELTA_ADDED_PREFIX):
+            rank_str, title, url, mobile_url = _parse_title_line(line[2:])
+            delta.added[title] = {
+                "ranks": [int(rank_str)] if rank_str else [1],
+                "url": url,
+                "mobileUrl": mobile_url,
+            }
+    return delta
+
+
+def parse_snapshot_text(
+    content: str,
+    refs: Optional[Dict[str, str]] = None,
+    deltas: Optional[Dict[str, PlatformDelta]] = None,
+) -> Tuple[Dict, Dict]:
+    """
+    解析 txt 快照内容
+
+    Args:
+        content: 快照文本
+        refs: 传入字典时收集引用行 {platform_id: 被引用的快照时间}，对应平台保留空的
+            占位（保持平台顺序），由调用方展开；不传时忽略引用平台
+        deltas: 传入字典时收集增量段 {platform_id: PlatformDelta}，同样保留空的占位；
+            不传时忽略增量平台
+
+    Returns:
+        (titles_by_id, id_to_name) 元组
+        - titles_by_id: {platform_id: {title: {ranks, url, mobileUrl}}}
+        - id_to_name: {platform_id: platform_name}
+    """
+    titles_by_id = {}
+    id_to_name = {}
+    match_line = TITLE_LINE_PATTERN.fullmatch
+    match_fallback = TITLE_LINE_FALLBACK_PATTERN.fullmatch
+
+    for source_id, name, body_lines in iter_sections(content):
+        if body_lines[0].startswith(REF_LINE_PREFIX):
+            if refs is not None:
+                refs[source_id] = body_lines[0][len(REF_LINE_PREFIX):].strip()
+                titles_by_id[source_id] = {}
+                id_to_name[source_id] = name
+            continue
+        if body_lines[0].startswith(DELTA_LINE_PREFIX):
+            if deltas is not None:
+                base_time = body_lines[0][len(DELTA_LINE_PREFIX):].strip()
+                deltas[source_id] = parse_delta_lines(base_time, body_lines[1:])
+                titles_by_id[source_id] = {}
+                id_to_name[source_id] = name
+            continue
+
+        id_to_name[source_id] = name
+        source_titles = titles_by_id[source_id] = {}
+
+        for line in body_lines:
+            line = line.strip()
+            if not line:
+                continue
+            match = match_line(line) or match_fallback(line)
+            rank_str, title, url, mobile_url = match.groups()
+            source_titles[" ".join(title.split())] = {
+                "ranks": [int(rank_str)] if rank_str else [1],
+                "url": url or "",
+                "mobileUrl": mobile_url or "",
+            }
+
+    return titles_by_id, id_to_name
+
+
+def parse_failed_ids(content: str) -> List[str]:
+    """解析 txt 快照中请求失败的平台ID"""
+    if FAILED_SECTION_MARKER not in content:
+        return []
+    failed_part = content.split(FAILED_SECTION_MARKER, 1)[1]
+    return [line.strip() for line in failed_part.split("\n") if line.strip()]
+
+
+def parse_snapshot_platforms(
+    content: str, max_items_per_platform: Optional[int] = None
+) -> List[Dict]:
+    """
+    按文件顺序解析为平台列表（供播客等按榜单顺序取前几条的场景）
+
+    Args:
+        content: 快照文本
+        max_items_per_platform: 每个平台最多保留的条数，None 表示不限制
+
+    Returns:
+        [{"platform_id", "platform", "items": [{"rank", "title", "url", "mobileUrl"}]}]，
+        没有标题的平台不会出现在结果中
+    """
+    titles_by_id, id_to_name = parse_snapshot_text(content)
+
+    platforms = []
+    for source_id, titles in titles_by_id.items():
+        items = [
+            {
+                "rank": info["ranks"][0],
+                "title": title,
+                "url": info["url"],
+                "mobileUrl": info["mobileUrl"],
+            }
+            for title, info in titles.items()
+        ]
+        if max_items_per_platform is not None:
+            items = items[:max_items_per_platform]
+        if items:
+            platforms.append(
+                {
+                    "platform_id": source_id,
+                    "platform": id_to_name.get(source_id, source_id),
+                    "items": items,
+                }
+            )
+    return platforms
@@ -0,0 +1,1328 @@
+"""
+快照存储
+
+统一的快照读写接口，支持两种后端：
+- txt: 每次爬取写入 output/<日期>/txt/<时间>.txt（默认，与旧版本兼容）
+- sqlite: 写入带索引的 SQLite 数据库，按日期/平台的查询走索引而不是逐个解析文件
+
+内容与上一次快照完全相同的平台在 txt 中只写一行引用（"@ref <时间>"），
+读取时由存储层展开为被引用快照中的内容。
+
+开启增量快照（storage.delta_snapshots）后，txt 快照中的平台只记录相对上一个快照的
+新增、移除和排名变化（"@delta <时间>" 段），每隔 keyframe_interval 个快照写一次完整快照
+（关键帧）。读取任意快照时从最近的关键帧依次展开，也可以通过 load_changes/iter_changes
+直接遍历相邻快照之间的变化。
+
+txt 快照的解析结果持久化在 output/<日期>/.parse_cache.bin（见 trendradar.parse_cache），
+其他进程或下一次运行读取历史快照时无需重新解析。
+
+已结束的日期可以归档为 output/<日期>.tar.gz（见 trendradar.archive），txt 后端直接从
+归档中读取，不解压到磁盘。
+
+写入快照时同步更新目录索引 output/.catalog/index.json（见 trendradar.catalog），
+MCP Server 查询可用日期和存储占用时直接读取索引。
+
+main.py、MCP Server 和播客脚本都通过这里读取快照。
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import yaml
+
+from trendradar.archive import (
+    ARCHIVE_SUFFIX,
+    DayArchive,
+    archive_day_folder,
+    get_archive_path,
+)
+from trendradar.catalog import StorageCatalog
+from trendradar.parse_cache import PARSE_CACHE_FILE_NAME, ParseCache
+from trendradar.snapshot_parser import (
+    DELTA_ADDED_PREFIX,
+    DELTA_LINE_PREFIX,
+    DELTA_MOVED_PREFIX,
+    DELTA_REMOVED_PREFIX,
+    FAILED_SECTION_MARKER,
+    REF_LINE_PREFIX,
+    PlatformDelta,
+    clean_title,
+    parse_delta_lines,
+    parse_failed_ids,
+    parse_snapshot_text,
+)
+
+
+DATE_FOLDER_PATTERN = re.compile(r"^(\d{4})年(\d{2})月(\d{2})日$")
+
+# 单个平台的紧凑状态：{title: (rank, url, mobile_url)}，按写入顺序排列
+PlatformState = Dict[str, Tuple[int, str, str]]
+
+
+class SnapshotEntry(NamedTuple):
+    """快照索引项"""
+
+    time_info: str  # 快照时间（如 "08时35分"），同时是 txt 文件名
+    version: str  # 内容版本标识，快照被改写后会变化
+    timestamp: float  # 写入时间（epoch 秒）
+
+
+def iter_snapshot_rows(results: Dict) -> Iterator[Tuple[str, List[Tuple[int, str, str, str]]]]:
+    """
+    将爬取结果整理为写入顺序：平台按原顺序，标题按首个排名排序
+
+    Args:
+        results: {platform_id: {title: {ranks, url, mobileUrl}}}
+
+    Yields:
+        (platform_id, [(rank, cleaned_title, url, mobile_url), ...])
+    """
+    for id_value, title_data in results.items():
+        sorted_titles = []
+        for title, info in title_data.items():
+            cleaned_title = clean_title(title)
+            if isinstance(info, dict):
+                ranks = info.get("ranks", [])
+                url = info.get("url", "")
+                mobile_url = info.get("mobileUrl", "")
+            else:
+                ranks = info if isinstance(info, list) else []
+                url = ""
+                mobile_url = ""
+
+            rank = ranks[0] if ranks else 1
+            sorted_titles.append((rank, cleaned_title, url, mobile_url))
+
+        sorted_titles.sort(key=lambda x: x[0])
+        yield id_value, sorted_titles
+
+
+def compute_platform_hash(title_data: Dict) -> str:
+    """
+    计算单个平台内容的哈希（按写入 txt 的规范形式：清理后的标题、首个排名、链接）
+
+    抓取结果与从快照读回的结果得到相同的哈希，可用于判断平台内容是否变化。
+    """
+    digest = hashlib.md5()
+    for _, sorted_titles in iter_snapshot_rows({"": title_data}):
+        for rank, cleaned_title, url, mobile_url in sorted_titles:
+            digest.update(f"{rank}\t{cleaned_title}\t{url}\t{mobile_url}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def titles_to_state(titles: Dict) -> PlatformState:
+    """{title: {ranks, url, mobileUrl}} -> 紧凑状态（取首个排名）"""
+    return {
+        title: (info["ranks"][0] if info["ranks"] else 1, info["url"], info["mobileUrl"])
+        for title, info in titles.items()
+    }
+
+
+def state_to_titles(state: PlatformState) -> Dict:
+    """紧凑状态 -> {title: {ranks, url, mobileUrl}}（新对象）"""
+    return {
+        title: {"ranks": [rank], "url": url, "mobileUrl": mobile_url}
+        for title, (rank, url, mobile_url) in state.items()
+    }
+
+
+def diff_platform_states(
+    base_time: str, base_state: PlatformState, state: PlatformState
+) -> PlatformDelta:
+    """计算平台相对基准快照的变化（链接变化的标题记为新增）"""
+    added = {}
+    moved = {}
+    for title, row in state.items():
+        base_row = base_state.get(title)
+        if base_row is None or base_row[1:] != row[1:]:
+            added[title] = {"ranks": [row[0]], "url": row[1], "mobileUrl": row[2]}
+        elif base_row[0] != row[0]:
+            moved[title] = row[0]
+    removed = [title for title in base_state if title not in state]
+    return PlatformDelta(base_time, added, removed, moved)
+
+
+def apply_platform_delta(base_state: PlatformState, delta: PlatformDelta) -> PlatformState:
+    """在基准状态上应用变化，结果按排名排序（与完整快照的写入顺序一致）"""
+    state = dict(base_state)
+    for title in delta.removed:
+        state.pop(title, None)
+    for title, rank in delta.moved.items():
+        row = state.get(title)
+        if row is not None:
+            state[title] = (rank, row[1], row[2])
+    for title, info in delta.added.items():
+        state[title] = (info["ranks"][0], info["url"], info["mobileUrl"])
+    return dict(sorted(state.items(), key=lambda item: item[1][0]))
+
+
+def format_delta_lines(delta: PlatformDelta) -> List[str]:
+    """增量段内容（不含平台标题行）"""
+    lines = [f"{DELTA_LINE_PREFIX}{delta.base_time}"]
+    for title in delta.removed:
+        lines.append(f"{DELTA_REMOVED_PREFIX}{title}")
+    for title, rank in delta.moved.items():
+        lines.append(f"{DELTA_MOVED_PREFIX}{rank}. {title}")
+    for title, info in delta.added.items():
+        line = f"{DELTA_ADDED_PREFIX}{info['ranks'][0]}. {title}"
+        if info["url"]:
+            line += f" [URL:{info['url']}]"
+        if info["mobileUrl"]:
+            line += f" [MOBILE:{info['mobileUrl']}]"
+        lines.append(line)
+    return lines
+
+
+def compute_platform_delta(
+    base_time: str, base_state: PlatformState, state: PlatformState
+) -> Optional[PlatformDelta]:
+    """
+    计算写入快照用的增量
+
+    变化条数不少于完整内容，或按文本读回展开后与完整内容不一致（如排名相同的标题）时
+    返回 None，由调用方写入完整内容。
+    """
+    delta = diff_platform_states(base_time, base_state, state)
+    if len(delta.added) + len(delta.removed) + len(delta.moved) >= len(state):
+        return None
+    lines = format_delta_lines(delta)
+    parsed = parse_delta_lines(base_time, lines[1:])
+    if list(apply_platform_delta(base_state, parsed).items()) != list(state.items()):
+        return None
+    return delta
+
+
+def format_snapshot_text(
+    results: Dict,
+    id_to_name: Dict,
+    failed_ids: List,
+    refs: Optional[Dict[str, str]] = None,
+    deltas: Optional[Dict[str, PlatformDelta]] = None,
+) -> str:
+    """将爬取结果格式化为 txt 快照内容，refs 中的平台只写引用行，deltas 中的平台只写变化"""
+    lines = []
+    for id_value, sorted_titles in iter_snapshot_rows(results):
+        # id | name 或 id
+        name = id_to_name.get(id_value)
+        if name and name != id_value:
+            lines.append(f"{id_value} | {name}")
+        else:
+            lines.append(id_value)
+
+        if refs and id_value in refs:
+            lines.append(f"{REF_LINE_PREFIX}{refs[id_value]}")
+            lines.append("")
+            continue
+        if deltas and id_value in deltas:
+            lines.extend(format_delta_lines(deltas[id_value]))
+            lines.append("")
+            continue
+
+        for rank, cleaned_title, url, mobile_url in sorted_titles:
+            line = f"{rank}. {cleaned_title}"
+            if url:
+                line += f" [URL:{url}]"
+            if mobile_url:
+                line += f" [MOBILE:{mobile_url}]"
+            lines.append(line)
+
+        lines.append("")
+
+    if failed_ids:
+        lines.append(FAILED_SECTION_MARKER)
+        for id_value in failed_ids:
+            lines.append(id_value)
+
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def previous_snapshot_time(entries: List["SnapshotEntry"], time_info: str) -> str:
+    """当天在 time_info 之前的最近一个快照时间，没有时返回空字符串"""
+    previous = ""
+    for entry in entries:
+        if entry.time_info >= time_info:
+            break
+        previous = entry.time_info
+    return previous
+
+
+def filter_platforms(
+    titles_by_id: Dict, id_to_name: Dict, platform_ids: Optional[List[str]]
+) -> Tuple[Dict, Dict]:
+    """按平台过滤单个快照"""
+    if not platform_ids:
+        return titles_by_id, id_to_name
+    return (
+        {k: v for k, v in titles_by_id.items() if k in platform_ids},
+        {k: v for k, v in id_to_name.items() if k in platform_ids},
+    )
+
+
+class SnapshotStorage:
+    """快照存储接口"""
+
+    backend = ""
+    # load_changes 是否直接读取存储的增量（否则需要加载前一个快照逐平台对比）
+    stores_changes = False
+    # 写入快照时是否更新目录索引
+    records_catalog = True
+
+    def __init__(self, output_dir: str = "output"):
+        self.output_dir = Path(output_dir)
+        self._catalog: Optional[StorageCatalog] = None
+
+    def save_snapshot(
+        self,
+        date_folder: str,
+        time_info: str,
+        results: Dict,
+        id_to_name: Dict,
+        failed_ids: List,
+        refs: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """
+        保存一次爬取结果，返回保存位置描述
+
+        refs 为内容未变化的平台 {platform_id: 内容所在的快照时间}，results 中仍需包含
+        这些平台的完整数据（保证平台顺序，并供不支持引用的后端使用）。
+        """
+        raise NotImplementedError
+
+    def get_catalog(self) -> StorageCatalog:
+        """目录索引（查询前调用 refresh() 检测其他进程的写入）"""
+        if self._catalog is None:
+            self._catalog = StorageCatalog(self)
+        return self._catalog
+
+    def _record_snapshot(
+        self, date_folder: str, time_info: str, results: Dict, id_to_name: Dict, size: int
+    ) -> None:
+        """把刚写入的快照记入目录索引，失败不影响快照本身"""
+        if not self.records_catalog:
+            return
+        platforms = {
+            platform_id: id_to_name.get(platform_id) or platform_id for platform_id in results
+        }
+        try:
+            self.get_catalog().record_snapshot(date_folder, time_info, platforms, size)
+        except Exception as e:
+            print(f"Warning: 更新目录索引失败: {e}")
+
+    def list_dates(self) -> List[str]:
+        """列出所有有数据的日期文件夹名（升序）"""
+        raise NotImplementedError
+
+    def has_date(self, date_folder: str) -> bool:
+        """判断日期是否存在数据"""
+        return date_folder in self.list_dates()
+
+    def list_snapshots(self, date_folder: str) -> List[SnapshotEntry]:
+        """列出某天的所有快照（按时间升序）"""
+        raise NotImplementedError
+
+    def load_snapshot(
+        self,
+        date_folder: str,
+        time_info: str,
+        platform_ids: Optional[List[str]] = None,
+    ) -> Tuple[Dict, Dict]:
+        """读取单个快照，返回 (titles_by_id, id_to_name)"""
+        raise NotImplementedError
+
+    def iter_snapshots(
+        self, date_folder: str, platform_ids: Optional[List[str]] = None
+    ) -> Iterator[Tuple[SnapshotEntry, Dict, Dict]]:
+        """按时间顺序遍历某天的快照，产出 (entry, titles_by_id, id_to_name)"""
+        for entry in self.list_snapshots(date_folder):
+            try:
+                titles_by_id, id_to_name = self.load_snapshot(
+                    date_folder, entry.time_info, platform_ids
+                )
+            except Exception as e:
+                print(f"Warning: 读取快照 {date_folder}/{entry.time_info} 失败: {e}")
+                continue
+            yield entry, titles_by_id, id_to_name
+
+    def load_range(
+        self,
+        start_date: str,
+        end_date: str,
+        platform_ids: Optional[List[str]] = None,
+    ) -> Iterator[Tuple[str, SnapshotEntry, Dict, Dict]]:
+        """
+        按日期、时间顺序读取一段日期内的所有快照（逐个产出，不一次性载入内存）
+
+        Args:
+            start_date: 开始日期文件夹名（包含）
+            end_date: 结束日期文件夹名（包含）
+            platform_ids: 平台ID列表，None表示所有平台
+
+        Yields:
+            (date_folder, entry, titles_by_id, id_to_name)
+        """
+        for date_folder in self.list_dates():
+            if start_date <= date_folder <= end_date:
+                for entry, titles_by_id, id_to_name in self.iter_snapshots(
+                    date_folder, platform_ids
+                ):
+                    yield date_folder, entry, titles_by_id, id_to_name
+
+    def load_changes(
+        self,
+        date_folder: str,
+        time_info: str,
+        platform_ids: Optional[List[str]] = None,
+    ) -> Dict[str, PlatformDelta]:
+        """
+        读取单个快照相对当天前一个快照的变化
+
+        Returns:
+            {platform_id: PlatformDelta}，当天第一个快照或新出现的平台所有标题都记为新增；
+            本次请求失败（快照中没有）的平台不出现在结果中
+        """
+        previous = previous_snapshot_time(self.list_snapshots(date_folder), time_info)
+        titles_by_id, _ = self.load_snapshot(date_folder, time_info, platform_ids)
+        previous_titles = (
+            self.load_snapshot(date_folder, previous, platform_ids)[0] if previous else {}
+        )
+        return {
+            platform_id: diff_platform_states(
+                previous,
+                titles_to_state(previous_titles.get(platform_id, {})),
+                titles_to_state(titles),
+            )
+            for platform_id, titles in titles_by_id.items()
+        }
+
+    def iter_changes(
+        self, date_folder: str, platform_ids: Optional[List[str]] = None
+    ) -> Iterator[Tuple[SnapshotEntry, Dict[str, PlatformDelta]]]:
+        """按时间顺序遍历某天每个快照相对前一个快照的变化，产出 (entry, changes)"""
+        previous = ""
+        previous_states: Dict[str, PlatformState] = {}
+        for entry, titles_by_id, _ in self.iter_snapshots(date_folder, platform_ids):
+            states = {
+                platform_id: titles_to_state(titles)
+                for platform_id, titles in titles_by_id.items()
+            }
+            yield entry, {
+                platform_id: diff_platform_states(
+                    previous, previous_states.get(platform_id, {}), state
+                )
+                for platform_id, state in states.items()
+            }
+            previous, previous_states = entry.time_info, states
+
+    def read_snapshot_text(self, date_folder: str, time_info: str) -> str:
+        """读取单个快照的 txt 格式内容"""
+        raise NotImplementedError
+
+    def flush_cache(self) -> None:
+        """把读取过程中产生的缓存写回磁盘（默认无缓存）"""
+
+    def archive_date(self, date_folder: str) -> str:
+        """把已结束日期的 txt/html 文件打包为 output/<日期>.tar.gz，返回归档路径"""
+        return str(archive_day_folder(self.output_dir, date_folder))
+
+
+class TxtSnapshotStorage(SnapshotStorage):
+    """txt 文件存储：output/<日期>/txt/<时间>.txt"""
+
+    backend = "txt"
+
+    def get_txt_dir(self, date_folder: str) -> Path:
+        return self.output_dir / date_folder / "txt"
+
+    def get_snapshot_path(self, date_folder: str, time_info: str) -> Path:
+        return self.get_txt_dir(date_folder) / f"{time_info}.txt"
+
+    # 进程内最多保留的日期解析缓存数（按最近使用淘汰，长时间范围的扫描内存占用不随天数增长）
+    MAX_PARSE_CACHES = 8
+    # 进程内保留的已展开快照数（顺序读取时下一个增量快照直接在上一个的基础上展开）
+    MAX_RESOLVED_STATES = 4
+    # 引用/增量链的最大展开深度，关键帧间隔不能超过它
+    MAX_RESOLVE_DEPTH = 128
+    # 进程内保留的已打开归档数（每个归档按需在内存中保存当天解压后的 txt）
+    MAX_ARCHIVES = 4
+
+    def __init__(
+        self,
+        output_dir: str = "output",
+        parse_cache: bool = True,
+        delta_snapshots: bool = False,
+        keyframe_interval: int = 12,
+    ):
+        super().__init__(output_dir)
+        # 是否把解析结果持久化到磁盘；关闭时仅在进程内缓存
+        self.persist_parse_cache = parse_cache
+        self._parse_caches: Dict[str, ParseCache] = {}
+        # 是否写入增量快照，以及每隔多少个快照写一次完整快照
+        self.delta_snapshots = delta_snapshots
+        self.stores_changes = delta_snapshots
+        self.keyframe_interval = max(1, min(keyframe_interval, self.MAX_RESOLVE_DEPTH // 2))
+        # {(日期, 时间): (版本, {platform_id: PlatformState}, id_to_name, deltas)}，调用方只读
+        self._resolved_states: Dict[Tuple[str, str], Tuple] = {}
+        # 已打开的归档 {日期: (归档文件的修改时间ns, DayArchive)}
+        self._archives: Dict[str, Tuple[int, DayArchive]] = {}
+
+    def save_snapshot(
+        self, date_folder, time_info, results, id_to_name, failed_ids, refs=None
+    ):
+        deltas = None
+        if self.delta_snapshots:
+            # 增量快照不再写引用行：未变化的平台即空的增量，关键帧保持完整
+            refs = None
+            deltas = self._compute_snapshot_deltas(date_folder, time_info, results)
+
+        file_path = self.get_snapshot_path(date_folder, time_info)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(format_snapshot_text(results, id_to_name, failed_ids, refs, deltas))
+        self._record_snapshot(
+            date_folder, time_info, results, id_to_name, file_path.stat().st_size
+        )
+        return str(file_path)
+
+    def _compute_snapshot_deltas(
+        self, date_folder: str, time_info: str, results: Dict
+    ) -> Dict[str, PlatformDelta]:
+        """计算各平台相对上一个快照的增量，需要写关键帧时返回空字典"""
+        previous = [
+            entry for entry in self.list_snapshots(date_folder)
+            if entry.time_info < time_info
+        ]
+        if not previous or len(previous) % self.keyframe_interval == 0:
+            return {}
+
+        base_time = previous[-1].time_info
+        try:
+            base_states = self._resolve_states(date_folder, base_time)[1]
+        except Exception as e:
+            print(f"Warning: 读取上一个快照 {base_time} 失败，写入完整快照: {e}")
+            return {}
+
+        deltas = {}
+        for platform_id, sorted_titles in iter_snapshot_rows(results):
+            base_state = base_states.get(platform_id)
+            if base_state is None:
+                continue
+            state = {}
+            for rank, cleaned_title, url, mobile_url in sorted_titles:
+                state[cleaned_title] = (rank, url, mobile_url)
+            delta = compute_platform_delta(base_time, base_state, state)
+            if delta is not None:
+                deltas[platform_id] = delta
+        return deltas
+
+    def _get_archive(self, date_folder: str) -> Optional[DayArchive]:
+        """日期目录中没有 txt 快照而存在归档时返回归档，否则返回 None"""
+        if self.get_txt_dir(date_folder).exists():
+            return None
+        archive_path = get_archive_path(self.output_dir, date_folder)
+        try:
+            mtime_ns = archive_path.stat().st_mtime_ns
+        except OSError:
+            self._archives.pop(date_folder, None)
+            return None
+
+        opened = self._archives.pop(date_folder, None)
+        if opened is None or opened[0] != mtime_ns:
+            if len(self._archives) >= self.MAX_ARCHIVES:
+                self._archives.pop(next(iter(self._archives)))
+            opened = (mtime_ns, DayArchive(archive_path))
+            # 归档被替换时，旧的解析缓存也随之失效
+            self._parse_caches.pop(date_folder, None)
+        self._archives[date_folder] = opened
+        return opened[1]
+
+    def _snapshot_stat(self, date_folder: str, time_info: str) -> Tuple[int, int]:
+        """返回快照的 (大小, 修改时间ns)，归档中的快照返回归档前的值"""
+        try:
+            stat = self.get_snapshot_path(date_folder, time_info).stat()
+        except FileNotFoundError:
+            archive = self._get_archive(date_folder)
+            if archive is None:
+                raise
+            return archive.stat(f"txt/{time_info}.txt")
+        return stat.st_size, stat.st_mtime_ns
+
+    def _read_snapshot_content(self, date_folder: str, time_info: str) -> str:
+        try:
+            with open(self.get_snapshot_path(date_folder, time_info), "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            archive = self._get_archive(date_folder)
+            if archive is None:
+                raise
+            return archive.read(f"txt/{time_info}.txt").decode("utf-8")
+
+    def _get_parse_cache(self, date_folder: str) -> ParseCache:
+        cache = self._parse_caches.pop(date_folder, None)
+        if cache is None:
+            if len(self._parse_caches) >= self.MAX_PARSE_CACHES:
+                oldest = next(iter(self._parse_caches))
+                self._parse_caches.pop(oldest).save()
+            cache_path = self.output_dir / date_folder / PARSE_CACHE_FILE_NAME
+            archive = self._get_archive(date_folder)
+            if archive is not None:
+                # 归档自带解析缓存，只读
+                cache = ParseCache.from_bytes(cache_path, archive.parse_cache_data)
+            else:
+                cache = ParseCache(cache_path, persist=self.persist_parse_cache)
+        # 重新插入到末尾，保持字典顺序即最近使用顺序
+        self._parse_caches[date_folder] = cache
+        return cache
+
+    def _parse_snapshot(
+        self,
+        date_folder: str,
+        time_info: str,
+        stat: Optional[Tuple[int, int]] = None,
+    ) -> Tuple[Dict, Dict, Dict[str, str], Dict[str, PlatformDelta]]:
+        """解析单个快照（不展开引用和增量），返回 (titles_by_id, id_to_name, refs, deltas)，优先读取解析缓存"""
+        name = f"{time_info}.txt"
+        if stat is None:
+            stat = self._snapshot_stat(date_folder, time_info)
+        cache = self._get_parse_cache(date_folder)
+        parsed = cache.get(name, *stat)
+        if parsed is not None:
+            return parsed
+
+        content = self._read_snapshot_content(date_folder, time_info)
+        refs: Dict[str, str] = {}
+        deltas: Dict[str, PlatformDelta] = {}
+        titles_by_id, id_to_name = parse_snapshot_text(content, refs, deltas)
+        parsed = (titles_by_id, id_to_name, refs, deltas)
+        cache.put(name, *stat, parsed)
+        return parsed
+
+    def _get_resolved(self, date_folder: str, time_info: str, version: str):
+        """读取已展开的快照（版本不一致时视为不存在）"""
+        key = (date_folder, time_info)
+        resolved = self._resolved_states.pop(key, None)
+        if resolved is None or resolved[0] != version:
+            return None
+        self._resolved_states[key] = resolved
+        return resolved
+
+    def _resolve_states(
+        self,
+        date_folder: str,
+        time_info: str,
+        depth: int = 0,
+        stat: Optional[Tuple[int, int]] = None,
+        parsed: Optional[Tuple] = None,
+    ) -> Tuple[str, Dict[str, PlatformState], Dict, Dict[str, PlatformDelta]]:
+        """
+        展开快照中的引用和增量
+
+        Returns:
+            (版本, {platform_id: PlatformState}, id_to_name, deltas)，结果会被缓存，调用方只读
+        """
+        if stat is None:
+            stat = self._snapshot_stat(date_folder, time_info)
+        version = "%d-%d" % stat
+        resolved = self._get_resolved(date_folder, time_info, version)
+        if resolved is not None:
+            return resolved
+
+        if parsed is None:
+            parsed = self._parse_snapshot(date_folder, time_info, stat)
+        titles_by_id, id_to_name, refs, deltas = parsed
+        states = {}
+        for platform_id, titles in titles_by_id.items():
+            if platform_id in refs:
+                base_time = refs[platform_id]
+                # 引用必须指向有内容的平台
+                state = self._load_base_state(date_folder, base_time, platform_id, depth) or None
+            elif platform_id in deltas:
+                base_time = deltas[platform_id].base_time
+                state = self._load_base_state(date_folder, base_time, platform_id, depth)
+                if state is not None:
+                    state = apply_platform_delta(state, deltas[platform_id])
+            else:
+                states[platform_id] = titles_to_state(titles)
+                continue
+
+            if state is None:
+                print(f"Warning: 快照 {time_info} 引用的 {base_time}/{platform_id} 不存在")
+                del id_to_name[platform_id]
+            else:
+                states[platform_id] = state
+
+        resolved = (version, states, id_to_name, deltas)
+        if len(self._resolved_states) >= self.MAX_RESOLVED_STATES:
+            self._resolved_states.pop(next(iter(self._resolved_states)))
+        self._resolved_states[(date_folder, time_info)] = resolved
+        return resolved
+
+    def _load_base_state(
+        self, date_folder: str, time_info: str, platform_id: str, depth: int
+    ) -> Optional[PlatformState]:
+        """读取被引用（或作为增量基准）的快照中某个平台的内容，不存在时返回 None"""
+        if depth >= self.MAX_RESOLVE_DEPTH:
+            return None
+        try:
+            states = self._resolve_states(date_folder, time_info, depth + 1)[1]
+        except OSError:
+            return None
+        return states.get(platform_id)
+
+    def _load_resolved(self, date_folder: str, time_info: str) -> Tuple[Dict, Dict]:
+        """解析快照并展开引用和增量，返回 (titles_by_id, id_to_name)（新对象）"""
+        stat = self._snapshot_stat(date_folder, time_info)
+        version = "%d-%d" % stat
+        resolved = self._get_resolved(date_folder, time_info, version)
+        if resolved is None:
+            parsed = self._parse_snapshot(date_folder, time_info, stat)
+            if not parsed[2] and not parsed[3]:
+                # 完整快照直接返回解析结果（被后续快照引用时再展开）
+                return parsed[0], parsed[1]
+            resolved = self._resolve_states(date_folder, time_info, 0, stat, parsed)
+        _, states, id_to_name, _ = resolved
+        titles_by_id = {
+            platform_id: state_to_titles(state) for platform_id, state in states.items()
+        }
+        return titles_by_id, dict(id_to_name)
+
+    def flush_cache(self) -> None:
+        for cache in self._parse_caches.values():
+            cache.save()
+
+    def list_dates(self) -> List[str]:
+        if not self.output_dir.exists():
+            return []
+        dates = set()
+        for path in self.output_dir.iterdir():
+            if path.is_dir():
+                if DATE_FOLDER_PATTERN.match(path.name):
+                    dates.add(path.name)
+            elif path.name.endswith(ARCHIVE_SUFFIX):
+                date_folder = path.name[: -len(ARCHIVE_SUFFIX)]
+                if DATE_FOLDER_PATTERN.match(date_folder):
+                    dates.add(date_folder)
+        return sorted(dates)
+
+    def has_date(self, date_folder: str) -> bool:
+        return (
+            self.get_txt_dir(date_folder).exists()
+            or get_archive_path(self.output_dir, date_folder).exists()
+        )
+
+    def list_snapshots(self, date_folder: str) -> List[SnapshotEntry]:
+        archive = self._get_archive(date_folder)
+        if archive is not None:
+            entries = []
+            for name in archive.list_files("txt"):
+                if name.endswith(".txt"):
+                    size, mtime_ns = archive.stat(f"txt/{name}")
+                    entries.append(
+                        SnapshotEntry(name[:-4], f"{size}-{mtime_ns}", mtime_ns / 1e9)
+                    )
+            return entries
+
+        txt_dir = self.get_txt_dir(date_folder)
+        if not txt_dir.exists():
+            return []
+
+        entries = []
+        for file_path in sorted(f for f in txt_dir.iterdir() if f.suffix == ".txt"):
+            stat = file_path.stat()
+            entries.append(
+                SnapshotEntry(
+                    file_path.stem, f"{stat.st_size}-{stat.st_mtime_ns}", stat.st_mtime
+                )
+            )
+        return entries
+
+    def load_snapshot(self, date_folder, time_info, platform_ids=None):
+        titles_by_id, id_to_name = self._load_resolved(date_folder, time_info)
+        return filter_platforms(titles_by_id, id_to_name, platform_ids)
+
+    def iter_snapshots(self, date_folder, platform_ids=None):
+        try:
+            yield from super().iter_snapshots(date_folder, platform_ids)
+        finally:
+            self.flush_cache()
+
+    def load_changes(self, date_folder, time_info, platform_ids=None):
+        previous = previous_snapshot_time(self.list_snapshots(date_folder), time_info)
+        return self._load_changes(date_folder, time_info, previous, platform_ids)
+
+    def _load_changes(
+        self,
+        date_folder: str,
+        time_info: str,
+        previous: str,
+        platform_ids: Optional[List[str]],
+    ) -> Dict[str, PlatformDelta]:
+        """以前一个快照为基准的增量直接返回，其余平台与前一个快照逐条对比"""
+        _, states, _, deltas = self._resolve_states(date_folder, time_info)
+        previous_states = None
+        changes = {}
+        for platform_id, state in states.items():
+            if platform_ids and platform_id not in platform_ids:
+                continue
+            delta = deltas.get(platform_id)
+            if delta is not None and delta.base_time == previous:
+                changes[platform_id] = delta
+                continue
+            if previous_states is None:
+                previous_states = (
+                    self._resolve_states(date_folder, previous)[1] if previous else {}
+                )
+            changes[platform_id] = diff_platform_states(
+                previous, previous_states.get(platform_id, {}), state
+            )
+        return changes
+
+    def iter_changes(self, date_folder, platform_ids=None):
+        previous = ""
+        try:
+            for entry in self.list_snapshots(date_folder):
+                try:
+                    changes = self._load_changes(
+                        date_folder, entry.time_info, previous, platform_ids
+                    )
+                except Exception as e:
+                    print(f"Warning: 读取快照 {date_folder}/{entry.time_info} 失败: {e}")
+                    continue
+                previous = entry.time_info
+                yield entry, changes
+        finally:
+            self.flush_cache()
+
+    def archive_date(self, date_folder: str) -> str:
+        # 先确保所有快照都已解析并写入解析缓存，归档后读取无需重新解析
+        for entry in self.list_snapshots(date_folder):
+            try:
+                self._parse_snapshot(date_folder, entry.time_info)
+            except Exception as e:
+                print(f"Warning: 解析快照 {date_folder}/{entry.time_info} 失败: {e}")
+        cache = self._parse_caches.pop(date_folder, None)
+        if cache is not None:
+            cache.save()
+        for key in [key for key in self._resolved_states if key[0] == date_folder]:
+            del self._resolved_states[key]
+        return super().archive_date(date_folder)
+
+    def read_snapshot_text(self, date_folder: str, time_info: str) -> str:
+        content = self._read_snapshot_content(date_folder, time_info)
+        if f"\n{REF_LINE_PREFIX}" not in content and f"\n{DELTA_LINE_PREFIX}" not in content:
+            return content
+        # 含引用或增量的快照展开为完整内容，保证外部解析器看到的格式不变
+        titles_by_id, id_to_name = self._load_resolved(date_folder, time_info)
+        return format_snapshot_text(titles_by_id, id_to_name, parse_failed_ids(content))
+
+
+class SQLiteSnapshotStorage(SnapshotStorage):
+    """
+    SQLite 存储
+
+    表结构：
+    - platforms: 平台 ID 与最新名称
+    - snapshots: 每次爬取一行，(date, time) 唯一，按日期索引
+    - snapshot_platforms: 快照中出现的平台、顺序和当时的名称
+    - titles: 去重后的标题（平台 + 标题 + 链接）
+    - rank_observations: 标题在某个快照中的排名，按标题索引
+    - failed_platforms: 快照中请求失败的平台
+    """
+
+    backend = "sqlite"
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS platforms (
+        id TEXT PRIMARY KEY,
+        name TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS snapshots (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        date TEXT NOT NULL,
+        time TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        UNIQUE (date, time)
+    );
+    CREATE TABLE IF NOT EXISTS snapshot_platforms (
+        snapshot_id INTEGER NOT NULL REFERENCES snapshots(id) ON DELETE CASCADE,
+        platform_id TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        name TEXT NOT NULL,
+        PRIMARY KEY (snapshot_id, platform_id)
+    );
+    CREATE TABLE IF NOT EXISTS titles (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        platform_id TEXT NOT NULL,
+        title TEXT NOT NULL,
+        url TEXT NOT NULL DEFAULT '',
+        mobile_url TEXT NOT NULL DEFAULT '',
+        UNIQUE (platform_id, title, url, mobile_url)
+    );
+    CREATE TABLE IF NOT EXISTS rank_observations (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        snapshot_id INTEGER NOT NULL REFERENCES snapshots(id) ON DELETE CASCADE,
+        title_id INTEGER NOT NULL REFERENCES titles(id),
+        rank INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS failed_platforms (
+        snapshot_id INTEGER NOT NULL REFERENCES snapshots(id) ON DELETE CASCADE,
+        platform_id TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_snapshots_date ON snapshots(date, time);
+    CREATE INDEX IF NOT EXISTS idx_observations_snapshot ON rank_observations(snapshot_id);
+    CREATE INDEX IF NOT EXISTS idx_observations_title ON rank_observations(title_id);
+    CREATE INDEX IF NOT EXISTS idx_titles_title ON titles(title);
+    CREATE INDEX IF NOT EXISTS idx_failed_snapshot ON failed_platforms(snapshot_id);
+    """
+
+    def __init__(
+        self,
+        output_dir: str = "output",
+        db_path: Optional[str] = None,
+        txt_export: bool = True,
+    ):
+        """
+        初始化 SQLite 存储
+
+        Args:
+            output_dir: 输出目录
+            db_path: 数据库文件路径，默认 <output_dir>/trendradar.db
+            txt_export: 是否同时导出 txt 快照（兼容依赖 txt 文件的外部工具）
+        """
+        super().__init__(output_dir)
+        self.db_path = Path(db_path) if db_path else self.output_dir / "trendradar.db"
+        self.txt_export = txt_export
+        self._txt = TxtSnapshotStorage(output_dir)
+        # txt 导出不单独记录目录索引，由本存储按数据库中的快照记录
+        self._txt.records_catalog = False
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._schema_ready:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.execute("PRAGMA foreign_keys = ON")
+        if not self._schema_ready:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.executescript(self.SCHEMA)
+            self._schema_ready = True
+        return conn
+
+    def save_snapshot(
+        self, date_folder, time_info, results, id_to_name, failed_ids, refs=None
+    ):
+        # 数据库中的标题本身已去重，这里始终写入完整的排名记录，引用只用于 txt 导出
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "DELETE FROM snapshots WHERE date = ? AND time = ?",
+                    (date_folder, time_info),
+                )
+                snapshot_id = conn.execute(
+                    "INSERT INTO snapshots (date, time, created_at) VALUES (?, ?, ?)",
+                    (date_folder, time_info, time.time()),
+                ).lastrowid
+
+                position = 0
+                # [(platform_id, title, url, mobile_url, rank)]，按写入顺序
+                observations = []
+                for platform_id, sorted_titles in iter_snapshot_rows(results):
+                    # 与 txt 解析结果保持一致：同名标题保留首次位置、末次数据
+                    rows = {}
+                    for rank, title, url, mobile_url in sorted_titles:
+                        rows[title] = (rank, url, mobile_url)
+                    if not rows:
+                        continue
+
+                    name = id_to_name.get(platform_id) or platform_id
+                    conn.execute(
+                        "INSERT INTO platforms (id, name) VALUES (?, ?) "
+                        "ON CONFLICT(id) DO UPDATE SET name = excluded.name",
+                        (platform_id, name),
+                    )
+                    conn.execute(
+                        "INSERT INTO snapshot_platforms (snapshot_id, platform_id, position, name) "
+                        "VALUES (?, ?, ?, ?)",
+                        (snapshot_id, platform_id, position, name),
+                    )
+                    position += 1
+
+                    observations.extend(
+                        (platform_id, title, url or "", mobile_url or "", rank)
+                        for title, (rank, url, mobile_url) in rows.items()
+                    )
+
+                title_ids = self._get_title_ids(
+                    conn, [observation[:4] for observation in observations]
+                )
+                conn.executemany(
+                    "INSERT INTO rank_observations (snapshot_id, title_id, rank) "
+                    "VALUES (?, ?, ?)",
+                    [
+                        (snapshot_id, title_ids[observation[:4]], observation[4])
+                        for observation in observations
+                    ],
+                )
+
+                conn.executemany(
+                    "INSERT INTO failed_platforms (snapshot_id, platform_id) VALUES (?, ?)",
+                    [(snapshot_id, platform_id) for platform_id in failed_ids],
+                )
+        finally:
+            conn.close()
+
+        location = f"{self.db_path} ({date_folder} {time_info})"
+        size = 0
+        if self.txt_export:
+            txt_path = self._txt.save_snapshot(
+                date_folder, time_info, results, id_to_name, failed_ids, refs
+            )
+            size = Path(txt_path).stat().st_size
+            location = f"{location}, {txt_path}"
+        self._record_snapshot(date_folder, time_info, results, id_to_name, size)
+        return location
+
+    # 批量查询标题ID时每条语句的标题数（低于 SQLite 默认的参数上限 999）
+    TITLE_LOOKUP_BATCH = 900
+
+    @classmethod
+    def _lookup_title_ids(
+        cls, conn: sqlite3.Connection, keys: List[Tuple[str, str, str, str]]
+    ) -> Dict[Tuple[str, str, str, str], int]:
+        """按平台批量查询已存在的标题ID（每个平台一次查询）"""
+        titles_by_platform: Dict[str, Dict[str, None]] = {}
+        for platform_id, title, _, _ in keys:
+            titles_by_platform.setdefault(platform_id, {})[title] = None
+
+        wanted = set(keys)
+        title_ids = {}
+        for platform_id, titles in titles_by_platform.items():
+            titles = list(titles)
+            for start in range(0, len(titles), cls.TITLE_LOOKUP_BATCH):
+                batch = titles[start:start + cls.TITLE_LOOKUP_BATCH]
+                placeholders = ",".join("?" for _ in batch)
+                for title_id, *key in conn.execute(
+                    "SELECT id, platform_id, title, url, mobile_url FROM titles "
+                    f"WHERE platform_id = ? AND title IN ({placeholders})",
+                    (platform_id, *batch),
+                ):
+                    key = tuple(key)
+                    if key in wanted:
+                        title_ids[key] = title_id
+        return title_ids
+
+    @classmethod
+    def _get_title_ids(
+        cls, conn: sqlite3.Connection, keys: List[Tuple[str, str, str, str]]
+    ) -> Dict[Tuple[str, str, str, str], int]:
+        """
+        批量获取标题ID，不存在的标题先插入
+
+        先按平台批量查询，只对缺少的标题执行 INSERT OR IGNORE 并再查询一次
+        （一天中大部分标题在之前的快照里已经出现过）。
+
+        Args:
+            keys: [(platform_id, title, url, mobile_url), ...]
+
+        Returns:
+            {(platform_id, title, url, mobile_url): title_id}
+        """
+        title_ids = cls._lookup_title_ids(conn, keys)
+        missing = [key for key in dict.fromkeys(keys) if key not in title_ids]
+        if missing:
+            conn.executemany(
+                "INSERT OR IGNORE INTO titles (platform_id, title, url, mobile_url) "
+                "VALUES (?, ?, ?, ?)",
+                missing,
+            )
+            title_ids.update(cls._lookup_title_ids(conn, missing))
+        return title_ids
+
+    def list_dates(self) -> List[str]:
+        if not self.db_path.exists():
+            return []
+        conn = self._connect()
+        try:
+            return [
+                row[0]
+                for row in conn.execute(
+                    "SELECT DISTINCT date FROM snapshots ORDER BY date"
+                )
+            ]
+        finally:
+            conn.close()
+
+    def has_date(self, date_folder: str) -> bool:
+        if not self.db_path.exists():
+            return False
+        conn = self._connect()
+        try:
+            return (
+                conn.execute(
+                    "SELECT 1 FROM snapshots WHERE date = ? LIMIT 1", (date_folder,)
+                ).fetchone()
+                is not None
+            )
+        finally:
+            conn.close()
+
+    def list_snapshots(self, date_folder: str) -> List[SnapshotEntry]:
+        if not self.db_path.exists():
+            return []
+        conn = self._connect()
+        try:
+            return [
+                SnapshotEntry(time_info, str(snapshot_id), created_at)
+                for snapshot_id, time_info, created_at in conn.execute(
+                    "SELECT id, time, created_at FROM snapshots WHERE date = ? ORDER BY time",
+                    (date_folder,),
+                )
+            ]
+        finally:
+            conn.close()
+
+    def _query_rows(
+        self,
+        conn: sqlite3.Connection,
+        where: str,
+        params: Tuple,
+        platform_ids: Optional[List[str]] = None,
+        key_column: str = "s.time",
+    ):
+        """查询快照中的排名记录，每行第一列为 key_column（用于按快照分组），按快照时间排序"""
+        sql = (
+            f"SELECT {key_column}, sp.platform_id, sp.name, t.title, t.url, t.mobile_url, r.rank "
+            "FROM snapshots s "
+            "JOIN rank_observations r ON r.snapshot_id = s.id "
+            "JOIN titles t ON t.id = r.title_id "
+            "JOIN snapshot_platforms sp "
+            "ON sp.snapshot_id = s.id AND sp.platform_id = t.platform_id "
+            f"WHERE {where}"
+        )
+        if platform_ids:
+            placeholders = ",".join("?" for _ in platform_ids)
+            sql += f" AND sp.platform_id IN ({placeholders})"
+            params = params + tuple(platform_ids)
+        sql += " ORDER BY s.date, s.time, sp.position, r.id"
+        return conn.execute(sql, params)
+
+    @staticmethod
+    def _rows_to_snapshots(rows) -> Iterator[Tuple[str, Dict, Dict]]:
+        """将按快照排序的查询结果组装为 (快照键, titles_by_id, id_to_name)"""
+        current_time = None
+        titles_by_id = {}
+        id_to_name = {}
+        for time_info, platform_id, name, title, url, mobile_url, rank in rows:
+            if time_info != current_time:
+                if current_time is not None:
+                    yield current_time, titles_by_id, id_to_name
+                current_time = time_info
+                titles_by_id = {}
+                id_to_name = {}
+            if platform_id not in titles_by_id:
+                titles_by_id[platform_id] = {}
+                id_to_name[platform_id] = name
+            titles_by_id[platform_id][title] = {
+                "ranks": [rank],
+                "url": url,
+                "mobileUrl": mobile_url,
+            }
+        if current_time is not None:
+            yield current_time, titles_by_id, id_to_name
+
+    def load_snapshot(self, date_folder, time_info, platform_ids=None):
+        conn = self._connect()
+        try:
+            rows = self._query_rows(
+                conn, "s.date = ? AND s.time = ?", (date_folder, time_info), platform_ids
+            )
+            for _, titles_by_id, id_to_name in self._rows_to_snapshots(rows):
+                return titles_by_id, id_to_name
+            return {}, {}
+        finally:
+            conn.close()
+
+    def iter_snapshots(self, date_folder, platform_ids=None):
+        entries = {entry.time_info: entry for entry in self.list_snapshots(date_folder)}
+        if not entries:
+            return
+        conn = self._connect()
+        try:
+            rows = self._query_rows(conn, "s.date = ?", (date_folder,), platform_ids)
+            snapshots = {
+                time_info: (titles_by_id, id_to_name)
+                for time_info, titles_by_id, id_to_name in self._rows_to_snapshots(rows)
+            }
+        finally:
+            conn.close()
+
+        # 没有任何标题的快照（如全部请求失败）也要产出，保证快照数量一致
+        for time_info, entry in entries.items():
+            titles_by_id, id_to_name = snapshots.get(time_info, ({}, {}))
+            yield entry, titles_by_id, id_to_name
+
+    def load_range(self, start_date, end_date, platform_ids=None):
+        if not self.db_path.exists():
+            return
+        conn = self._connect()
+        try:
+            # 快照列表与排名记录都按 idx_snapshots_date 的 (date, time) 顺序读取
+            entries = [
+                (snapshot_id, date_folder, SnapshotEntry(time_info, str(snapshot_id), created_at))
+                for snapshot_id, date_folder, time_info, created_at in conn.execute(
+                    "SELECT id, date, time, created_at FROM snapshots "
+                    "WHERE date BETWEEN ? AND ? ORDER BY date, time",
+                    (start_date, end_date),
+                )
+            ]
+            rows = self._query_rows(
+                conn,
+                "s.date BETWEEN ? AND ?",
+                (start_date, end_date),
+                platform_ids,
+                key_column="s.id",
+            )
+            snapshots = self._rows_to_snapshots(rows)
+            pending = next(snapshots, None)
+            for snapshot_id, date_folder, entry in entries:
+                # 没有任何标题的快照（如全部请求失败）也要产出，与 iter_snapshots 一致
+                if pending is not None and pending[0] == snapshot_id:
+                    yield date_folder, entry, pending[1], pending[2]
+                    pending = next(snapshots, None)
+                else:
+                    yield date_folder, entry, {}, {}
+        finally:
+            conn.close()
+
+    def read_snapshot_text(self, date_folder: str, time_info: str) -> str:
+        titles_by_id, id_to_name = self.load_snapshot(date_folder, time_info)
+        conn = self._connect()
+        try:
+            failed_ids = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT f.platform_id FROM failed_platforms f "
+                    "JOIN snapshots s ON s.id = f.snapshot_id "
+                    "WHERE s.date = ? AND s.time = ? ORDER BY f.rowid",
+                    (date_folder, time_info),
+                )
+            ]
+        finally:
+            conn.close()
+        return format_snapshot_text(titles_by_id, id_to_name, failed_ids)
+
+
+def create_storage(
+    backend: str = "txt",
+    output_dir: str = "output",
+    sqlite_path: Optional[str] = None,
+    txt_export: bool = True,
+    parse_cache: bool = True,
+    delta_snapshots: bool = False,
+    keyframe_interval: int = 12,
+) -> SnapshotStorage:
+    """
+    创建快照存储
+
+    Args:
+        backend: 存储后端，"txt" 或 "sqlite"
+        output_dir: 输出目录
+        sqlite_path: SQLite 数据库路径（仅 sqlite 后端），默认 <output_dir>/trendradar.db
+        txt_export: sqlite 后端是否同时导出 txt 快照
+        parse_cache: txt 后端是否把解析结果持久化到 output/<日期>/.parse_cache.bin
+        delta_snapshots: txt 后端是否只写入相对上一个快照的变化
+        keyframe_interval: 增量快照模式下每隔多少个快照写一次完整快照
+
+    Returns:
+        快照存储实例
+    """
+    backend = (backend or "txt").strip().lower()
+    if backend == "sqlite":
+        return SQLiteSnapshotStorage(output_dir, sqlite_path, txt_export)
+    if backend != "txt":
+        print(f"未知的存储后端 {backend}，使用 txt")
+    return TxtSnapshotStorage(output_dir, parse_cache, delta_snapshots, keyframe_interval)
+
+
+def load_storage_config(config_path: Optional[str] = None) -> Dict:
+    """
+    读取 config.yaml 中的 storage 配置
+
+    Args:
+        config_path: 配置文件路径，默认读取 CONFIG_PATH 环境变量或 config/config.yaml
+
+    Returns:
+        storage 配置字典（文件不存在时为空字典）
+    """
+    if config_path is None:
+        config_path = os.environ.get("CONFIG_PATH", "config/config.yaml")
+    path = Path(config_path)
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        config_data = yaml.safe_load(f) or {}
+    return config_data.get("storage") or {}
+
+
+def resolve_storage_config(storage_data: Optional[Dict]) -> Dict:
+    """
+    补全 storage 配置的默认值并应用环境变量覆盖（STORAGE_BACKEND）
+
+    main.py 与 MCP Server、播客脚本共用，保证各方读写同一个存储后端。
+
+    Args:
+        storage_data: config.yaml 中的 storage 配置
+
+    Returns:
+        {"BACKEND", "SQLITE_PATH", "TXT_EXPORT", "PARSE_CACHE", "DELTA_SNAPSHOTS",
+        "KEYFRAME_INTERVAL", "ARCHIVE_AFTER_DAYS"}
+    """
+    storage_data = storage_data or {}
+    return {
+        "BACKEND": os.environ.get("STORAGE_BACKEND", "").strip()
+        or storage_data.get("backend", "txt"),
+        "SQLITE_PATH": storage_data.get("sqlite_path", "output/trendradar.db"),
+        "TXT_EXPORT": storage_data.get("txt_export", True),
+        "PARSE_CACHE": storage_data.get("parse_cache", True),
+        "DELTA_SNAPSHOTS": storage_data.get("delta_snapshots", False),
+        "KEYFRAME_INTERVAL": storage_data.get("keyframe_interval", 12),
+        "ARCHIVE_AFTER_DAYS": storage_data.get("archive_after_days", 0),
+    }
+
+
+def get_storage_from_config(
+    config_path: Optional[str] = None, project_root: Optional[str] = None
+) -> SnapshotStorage:
+    """
+    按 config.yaml 的 storage 配置（含环境变量覆盖）创建快照存储
+
+    Args:
+        config_path: 配置文件路径
+        project_root: 项目根目录，相对路径以此为基准（默认当前目录）
+
+    Returns:
+        快照存储实例
+    """
+    root = Path(project_root) if project_root else Path(".")
+    if config_path is None and project_root:
+        config_path = str(root / "config" / "config.yaml")
+    storage_config = resolve_storage_config(load_storage_config(config_path))
+
+    sqlite_path = storage_config["SQLITE_PATH"]
+    if sqlite_path and not Path(sqlite_path).is_absolute():
+        sqlite_path = str(root / sqlite_path)
+
+    return create_storage(
+        backend=storage_config["BACKEND"],
+        output_dir=str(root / "output"),
+        sqlite_path=sqlite_path,
+        txt_export=storage_config["TXT_EXPORT"],
+        parse_cache=storage_config["PARSE_CACHE"],
+        delta_snapshots=storage_config["DELTA_SNAPSHOTS"],
+        keyframe_interval=storage_config["KEYFRAME_INTERVAL"],
+    )